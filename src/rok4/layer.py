@@ -18,8 +18,13 @@ from typing import Dict, List, Tuple
 from rok4.enums import PyramidType
 from rok4.exceptions import FormatError, MissingAttributeError
 from rok4.pyramid import Pyramid
-from rok4.storage import get_data_str, get_infos_from_path, put_data_str
-from rok4.utils import reproject_bbox
+from rok4.storage import get_data_binary, get_infos_from_path, put_data_str
+from rok4.utils import json_loads, reproject_bbox
+
+# -- GLOBALS --
+
+# Nom technique d'une couche, compatible avec les URL et les stockages
+_NAME_PATTERN = re.compile(r"^[A-Za-z0-9_-]*$")
 
 
 class Layer:
@@ -55,7 +60,7 @@ class Layer:
             Layer: a Layer instance
         """
         try:
-            data = json.loads(get_data_str(descriptor))
+            data = json_loads(get_data_binary(descriptor))
 
         except JSONDecodeError as e:
             raise FormatError("JSON", descriptor, e)
@@ -128,7 +133,7 @@ class Layer:
         layer = cls()
 
         # Informations obligatoires
-        if not re.match("^[A-Za-z0-9_-]*$", name):
+        if not _NAME_PATTERN.match(name):
             raise Exception(
                 f"Layer's name have to contain only letters, number, hyphen and underscore, to be URL and storage compliant ({name})"
             )
@@ -233,7 +238,7 @@ class Layer:
                 {"pyramid": pyramid, "bottom_level": bottom_level, "top_level": top_level}
             )
 
-        self.__best_level = sorted(self.__levels.values(), key=lambda level: level.resolution)[0]
+        self.__best_level = min(self.__levels.values(), key=lambda level: level.resolution)
 
     def __str__(self) -> str:
         return f"{self.type.name} layer '{self.__name}'"
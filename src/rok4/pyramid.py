@@ -11,11 +11,14 @@ The module contains the following classes:
 # standard library
 import io
 import json
-import os
 import re
+import struct
+import sys
 import tempfile
 import zlib
+from functools import lru_cache
 from json.decoder import JSONDecodeError
+from operator import attrgetter
 from typing import Dict, Iterator, List, Tuple
 
 # 3rd party
@@ -29,26 +32,33 @@ from rok4.exceptions import FormatError, MissingAttributeError
 from rok4.storage import (
     copy,
     get_data_binary,
-    get_data_str,
     get_infos_from_path,
     get_path_from_infos,
     put_data_str,
     remove,
     size_path,
 )
-from rok4.tile_matrix_set import TileMatrix, TileMatrixSet
-from rok4.utils import reproject_point, srs_to_spatialreference
+from rok4.tile_matrix_set import TileMatrix, TileMatrixSet, get_tile_matrix_set
+from rok4.utils import json_loads, reproject_point, srs_to_spatialreference
 
 # -- GLOBALS --
 ROK4_IMAGE_HEADER_SIZE = 2048
 """Slab's header size, 2048 bytes"""
 
+_SLAB_SPLIT_RE = re.compile(r"[/_]")
+_RESOLUTION_KEY = attrgetter("resolution")
+_B36_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_B36_ALPHABET_CODES = numpy.frombuffer(_B36_ALPHABET.encode("ascii"), dtype=numpy.uint8)
 
+
+@lru_cache(maxsize=65536)
 def b36_number_encode(number: int) -> str:
     """Convert base-10 number to base-36
 
     Used alphabet is '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
 
+    Results are cached, columns and rows recurring a lot in a level.
+
     Args:
         number (int): base-10 number
 
@@ -56,18 +66,54 @@ def b36_number_encode(number: int) -> str:
         str: base-36 number
     """
 
-    alphabet = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    if 0 <= number < 36:
+        return _B36_ALPHABET[number]
 
-    base36 = ""
-
-    if 0 <= number < len(alphabet):
-        return alphabet[number]
+    digits = []
 
     while number != 0:
-        number, i = divmod(number, len(alphabet))
-        base36 = alphabet[i] + base36
+        number, i = divmod(number, 36)
+        digits.append(_B36_ALPHABET[i])
+
+    return "".join(reversed(digits))
+
+
+def b36_numbers_encode(numbers: List[int]) -> List[str]:
+    """Convert several base-10 numbers to base-36 at once
+
+    Digits are computed column by column on the whole numpy array, instead of one number at a time.
+
+    Args:
+        numbers (List[int]): base-10 positive numbers, lower than 2^64
+
+    Examples:
+
+        Convert slabs' columns
+
+            from rok4.pyramid import b36_numbers_encode
+
+            b36_numbers_encode([0, 35, 4032])
+            # ["0", "Z", "340"]
+
+    Returns:
+        List[str]: base-36 numbers, in the same order
+    """
 
-    return base36
+    values = numpy.asarray(numbers, dtype=numpy.uint64)
+    if values.size == 0:
+        return []
+
+    width = len(b36_number_encode(int(values.max())))
+    digits = numpy.empty((values.size, width), dtype=numpy.uint8)
+
+    for j in range(width - 1, -1, -1):
+        digits[:, j] = values % 36
+        values = values // 36
+
+    # Conversion des chiffres en codes ASCII puis découpage en chaînes de largeur fixe
+    encoded = _B36_ALPHABET_CODES[digits].tobytes().decode("ascii")
+
+    return [encoded[i : i + width].lstrip("0") or "0" for i in range(0, len(encoded), width)]
 
 
 def b36_number_decode(number: str) -> int:
@@ -92,23 +138,24 @@ def b36_path_decode(path: str) -> Tuple[int, int]:
         Tuple[int, int]: slab's column and row
     """
 
-    path = path.replace("/", "")
-    path = re.sub(r"(\.TIFF?)", "", path.upper())
+    path = path.replace("/", "").upper()
 
-    b36_column = ""
-    b36_row = ""
+    # On retire l'extension éventuelle sans passer par une expression régulière
+    if path.endswith(".TIFF"):
+        path = path[:-5]
+    elif path.endswith(".TIF"):
+        path = path[:-4]
 
-    while len(path) > 0:
-        b36_column += path[0]
-        b36_row += path[1]
-        path = path[2:]
-
-    return b36_number_decode(b36_column), b36_number_decode(b36_row)
+    # Les chiffres de la colonne et de la ligne sont entrelacés
+    return b36_number_decode(path[0::2]), b36_number_decode(path[1::2])
 
 
+@lru_cache(maxsize=65536)
 def b36_path_encode(column: int, row: int, slashs: int) -> str:
     """Convert slab indices to base-36 based path, with .tif extension
 
+    Results are cached, tiles of a same slab being often requested one after another.
+
     Args:
         column (int): slab's column
         row (int): slab's row
@@ -126,20 +173,65 @@ def b36_path_encode(column: int, row: int, slashs: int) -> str:
     b36_column = b36_column.rjust(max_len, "0")
     b36_row = b36_row.rjust(max_len, "0")
 
-    b36_path = ""
+    pairs = [c + r for c, r in zip(b36_column, b36_row)]
 
-    while len(b36_column) > 0:
-        b36_path = b36_row[-1] + b36_path
-        b36_path = b36_column[-1] + b36_path
+    # Les derniers couples de chiffres sont chacun précédés d'un slash
+    head = max_len - slashs
+    b36_path = "/".join(["".join(pairs[:head])] + pairs[head:])
 
-        b36_column = b36_column[:-1]
-        b36_row = b36_row[:-1]
+    return f"{b36_path}.tif"
 
-        if slashs > 0:
-            b36_path = "/" + b36_path
-            slashs -= 1
 
-    return f"{b36_path}.tif"
+# Table d'étalement des bits d'un octet : le bit i passe en position 2i
+_MORTON_SPREAD = [sum(((b >> i) & 1) << (2 * i) for i in range(8)) for b in range(256)]
+_MORTON_BITS = 28
+"""Bits used for each of column and row in a Morton number"""
+
+
+def morton_encode(column: int, row: int) -> int:
+    """Interleave column and row bits into a Morton number (Z-order)
+
+    Column bits take even positions, row bits take odd positions.
+
+    Args:
+        column (int): slab's column, lower than 2^28
+        row (int): slab's row, lower than 2^28
+
+    Returns:
+        int: Morton number, on 56 bits
+    """
+
+    code = 0
+    shift = 0
+    while column or row:
+        code |= (_MORTON_SPREAD[column & 0xFF] | (_MORTON_SPREAD[row & 0xFF] << 1)) << shift
+        column >>= 8
+        row >>= 8
+        shift += 16
+
+    return code
+
+
+def morton_decode(code: int) -> Tuple[int, int]:
+    """Get back column and row from a Morton number
+
+    Args:
+        code (int): Morton number
+
+    Returns:
+        Tuple[int, int]: column and row
+    """
+
+    def compact(value: int) -> int:
+        value &= 0x5555555555555555
+        value = (value | (value >> 1)) & 0x3333333333333333
+        value = (value | (value >> 2)) & 0x0F0F0F0F0F0F0F0F
+        value = (value | (value >> 4)) & 0x00FF00FF00FF00FF
+        value = (value | (value >> 8)) & 0x0000FFFF0000FFFF
+        value = (value | (value >> 16)) & 0x00000000FFFFFFFF
+        return value
+
+    return compact(code), compact(code >> 1)
 
 
 class Level:
@@ -150,6 +242,9 @@ class Level:
         __tile_limits (Dict[str, int]): minimum and maximum tiles' columns and rows of pyramid's content
         __slab_size (Tuple[int, int]): number of tile in a slab, widthwise and heightwise
         __tables (List[Dict]): for a VECTOR pyramid, description of vector content, tables and attributes
+        __tile_matrix (rok4.tile_matrix_set.TileMatrix): level's tile matrix in the pyramid's TMS
+        __bbox (Tuple[float, float, float, float]): cached level extent, computed on first access
+        __serialization (Dict): cached descriptor compliant description, computed on first access
     """
 
     @classmethod
@@ -173,7 +268,8 @@ class Level:
 
         # Attributs communs
         try:
-            level.__id = data["id"]
+            level.__id = sys.intern(data["id"])
+            level.__tile_matrix = pyramid.tms.get_level(level.__id)
             level.__tile_limits = data["tile_limits"]
             level.__slab_size = (
                 data["tiles_per_width"],
@@ -234,6 +330,7 @@ class Level:
         # Attributs communs
         level.__id = other.__id
         level.__pyramid = pyramid
+        level.__tile_matrix = pyramid.tms.get_level(level.__id)
         level.__tile_limits = other.__tile_limits
         level.__slab_size = other.__slab_size
 
@@ -243,6 +340,10 @@ class Level:
 
         return level
 
+    def __init__(self) -> None:
+        self.__bbox = None
+        self.__serialization = None
+
     def __str__(self) -> str:
         return f"{self.__pyramid.type.name} pyramid's level '{self.__id}' ({self.__pyramid.storage_type.name} storage)"
 
@@ -250,9 +351,14 @@ class Level:
     def serializable(self) -> Dict:
         """Get the dict version of the pyramid object, pyramid's descriptor compliant
 
+        Description is computed once and cached, until tile limits change
+
         Returns:
             Dict: pyramid's descriptor structured object description
         """
+        if self.__serialization is not None:
+            return self.__serialization
+
         serialization = {
             "id": self.__id,
             "tiles_per_width": self.__slab_size[0],
@@ -292,6 +398,8 @@ class Level:
             if self.__pyramid.own_masks:
                 serialization["storage"]["mask_prefix"] = f"{self.__pyramid.name}/MASK_{self.__id}"
 
+        self.__serialization = serialization
+
         return serialization
 
     @property
@@ -302,26 +410,31 @@ class Level:
     def bbox(self) -> Tuple[float, float, float, float]:
         """Return level extent, based on tile limits
 
+        Extent is computed once and cached, until tile limits change
+
         Returns:
             Tuple[float, float, float, float]: level terrain extent (xmin, ymin, xmax, ymax)
         """
 
-        min_bbox = self.__pyramid.tms.get_level(self.__id).tile_to_bbox(
-            self.__tile_limits["min_col"], self.__tile_limits["max_row"]
-        )
-        max_bbox = self.__pyramid.tms.get_level(self.__id).tile_to_bbox(
-            self.__tile_limits["max_col"], self.__tile_limits["min_row"]
-        )
+        if self.__bbox is None:
+            min_bbox = self.__tile_matrix.tile_to_bbox(
+                self.__tile_limits["min_col"], self.__tile_limits["max_row"]
+            )
+            max_bbox = self.__tile_matrix.tile_to_bbox(
+                self.__tile_limits["max_col"], self.__tile_limits["min_row"]
+            )
+
+            self.__bbox = (min_bbox[0], min_bbox[1], max_bbox[2], max_bbox[3])
 
-        return (min_bbox[0], min_bbox[1], max_bbox[2], max_bbox[3])
+        return self.__bbox
 
     @property
-    def resolution(self) -> str:
-        return self.__pyramid.tms.get_level(self.__id).resolution
+    def resolution(self) -> float:
+        return self.__tile_matrix.resolution
 
     @property
     def tile_matrix(self) -> TileMatrix:
-        return self.__pyramid.tms.get_level(self.__id)
+        return self.__tile_matrix
 
     @property
     def slab_width(self) -> int:
@@ -360,9 +473,7 @@ class Level:
 
         """
 
-        col_min, row_min, col_max, row_max = self.__pyramid.tms.get_level(self.__id).bbox_to_tiles(
-            bbox
-        )
+        col_min, row_min, col_max, row_max = self.__tile_matrix.bbox_to_tiles(bbox)
         self.__tile_limits = {
             "min_row": row_min,
             "max_col": col_max,
@@ -370,6 +481,10 @@ class Level:
             "min_col": col_min,
         }
 
+        # Les valeurs en cache dépendent des limites
+        self.__bbox = None
+        self.__serialization = None
+
 
 class Pyramid:
     """A data pyramid, raster or vector
@@ -380,8 +495,16 @@ class Pyramid:
         __list (str): pyramid's list path
         __tms (rok4.tile_matrix_set.TileMatrixSet): Used grid
         __levels (Dict[str, Level]): Pyramid's levels
+        __sorted_levels (List[Level]): Pyramid's levels sorted by resolution (best first), computed on demand
+        __levels_positions (Dict[str, int]): Position of each level in sorted levels, computed with them
+        __tms_levels (List[str]): TMS levels' identifiers sorted by resolution (best first), computed on demand
+        __tms_positions (Dict[str, int]): Position of each TMS level in the TMS sorted levels, computed with them
         __format (str): Data format
         __storage (Dict[str, Union[rok4.enums.StorageType,str,int]]): Pyramid's storage informations (type, root and depth if FILE storage)
+        __storage_type (rok4.enums.StorageType): Pyramid's storage type, copied from the storage informations
+        __storage_root (str): Pyramid's storage root, without S3 cluster
+        __storage_depth (int): Pyramid's storage depth for FILE storage, None otherwise or if not yet known
+        __storage_s3_cluster (str): S3 cluster host from the storage root, None if not provided or not S3
         __raster_specifications (Dict): If raster pyramid, raster specifications
         __content (Dict): Loading status (loaded), slab count (count) and list content (cache).
 
@@ -430,7 +553,7 @@ class Pyramid:
             Pyramid: a Pyramid instance
         """
         try:
-            data = json.loads(get_data_str(descriptor))
+            data = json_loads(get_data_binary(descriptor))
 
         except JSONDecodeError as e:
             raise FormatError("JSON", descriptor, e)
@@ -440,6 +563,7 @@ class Pyramid:
         pyramid.__storage["type"], path, pyramid.__storage["root"], base_name = get_infos_from_path(
             descriptor
         )
+        pyramid.__load_storage()
         pyramid.__name = base_name[:-5]  # on supprime l'extension.json
         pyramid.__descriptor = descriptor
         pyramid.__list = get_path_from_infos(
@@ -448,7 +572,7 @@ class Pyramid:
 
         try:
             # Attributs communs
-            pyramid.__tms = TileMatrixSet(data["tile_matrix_set"])
+            pyramid.__tms = get_tile_matrix_set(data["tile_matrix_set"])
             pyramid.__format = data["format"]
 
             # Attributs d'une pyramide raster
@@ -465,7 +589,7 @@ class Pyramid:
                 lev = Level.from_descriptor(level, pyramid)
                 pyramid.__levels[lev.id] = lev
 
-                if pyramid.__tms.get_level(lev.id) is None:
+                if lev.tile_matrix is None:
                     raise Exception(
                         f"Pyramid {descriptor} owns a level with the ID '{lev.id}', not defined in the TMS '{pyramid.tms.name}'"
                     )
@@ -512,6 +636,7 @@ class Pyramid:
             # Attributs communs
             pyramid.__name = name
             pyramid.__storage = storage
+            pyramid.__load_storage()
             pyramid.__masks = other.__masks
 
             pyramid.__descriptor = get_path_from_infos(
@@ -545,13 +670,70 @@ class Pyramid:
 
     def __init__(self) -> None:
         self.__storage = {}
+        self.__storage_type = None
+        self.__storage_depth = None
         self.__levels = {}
+        self.__sorted_levels = None
+        self.__levels_positions = None
+        self.__tms_levels = None
+        self.__tms_positions = None
         self.__masks = None
 
         self.__content = {"loaded": False, "count": 0, "cache": {}}
 
     def __str__(self) -> str:
-        return f"{self.type.name} pyramid '{self.__name}' ({self.__storage['type'].name} storage)"
+        return f"{self.type.name} pyramid '{self.__name}' ({self.__storage_type.name} storage)"
+
+    def __load_storage(self) -> None:
+        """Copy storage informations into attributes, once for all
+
+        Storage type and depth are directly read by slab paths conversions. The storage root is split
+        between the root itself and the S3 cluster host.
+        """
+
+        self.__storage_type = self.__storage["type"]
+        self.__storage_depth = self.__storage.get("depth", None)
+
+        # Suppression de l'éventuel hôte de spécification du cluster S3
+        root, _, cluster = self.__storage["root"].partition("@")
+        self.__storage_root = root
+
+        if self.__storage_type == StorageType.S3 and cluster != "":
+            self.__storage_s3_cluster = cluster
+        else:
+            self.__storage_s3_cluster = None
+
+    def __get_sorted_levels(self) -> List[Level]:
+        """Get levels sorted by resolution, from bottom to top
+
+        Sorted list is cached, until levels are added or deleted
+
+        Returns:
+            List[Level]: sorted levels
+        """
+        if self.__sorted_levels is None:
+            self.__sorted_levels = sorted(self.__levels.values(), key=_RESOLUTION_KEY)
+            self.__levels_positions = {
+                level.id: position for position, level in enumerate(self.__sorted_levels)
+            }
+
+        return self.__sorted_levels
+
+    def __get_tms_positions(self) -> Dict[str, int]:
+        """Get the position of each TMS level in the TMS levels sorted by resolution, from bottom to top
+
+        Positions only depend on the TMS : they stay the same when pyramid's levels are added or deleted
+
+        Returns:
+            Dict[str, int]: TMS levels' positions
+        """
+        if self.__tms_positions is None:
+            self.__tms_levels = [tile_matrix.id for tile_matrix in self.__tms.sorted_levels]
+            self.__tms_positions = {
+                level_id: position for position, level_id in enumerate(self.__tms_levels)
+            }
+
+        return self.__tms_positions
 
     @property
     def serializable(self) -> Dict:
@@ -563,13 +745,9 @@ class Pyramid:
 
         serialization = {"tile_matrix_set": self.__tms.name, "format": self.__format}
 
-        serialization["levels"] = []
-        sorted_levels = sorted(
-            self.__levels.values(), key=lambda level: level.resolution, reverse=True
-        )
-
-        for level in sorted_levels:
-            serialization["levels"].append(level.serializable)
+        serialization["levels"] = [
+            level.serializable for level in reversed(self.__get_sorted_levels())
+        ]
 
         if self.type == PyramidType.RASTER:
             serialization["raster_specifications"] = self.__raster_specifications
@@ -622,7 +800,7 @@ class Pyramid:
         Returns:
             StorageType: FILE, S3 or CEPH
         """
-        return self.__storage["type"]
+        return self.__storage_type
 
     @property
     def storage_root(self) -> str:
@@ -634,13 +812,11 @@ class Pyramid:
             str: Pyramid's storage root
         """
 
-        return self.__storage["root"].split("@", 1)[
-            0
-        ]  # Suppression de l'éventuel hôte de spécification du cluster S3
+        return self.__storage_root
 
     @property
     def storage_depth(self) -> int:
-        return self.__storage.get("depth", None)
+        return self.__storage_depth
 
     @property
     def storage_s3_cluster(self) -> str:
@@ -649,13 +825,7 @@ class Pyramid:
         Returns:
             str: the host if known, None if the default one have to be used or if storage is not S3
         """
-        if self.__storage["type"] == StorageType.S3:
-            try:
-                return self.__storage["root"].split("@")[1]
-            except IndexError:
-                return None
-        else:
-            return None
+        return self.__storage_s3_cluster
 
     @storage_depth.setter
     def storage_depth(self, d: int) -> None:
@@ -670,6 +840,7 @@ class Pyramid:
         if "depth" in self.__storage and self.__storage["depth"] != d:
             raise Exception(f"Pyramid {self.__descriptor} owns levels with different path depths")
         self.__storage["depth"] = d
+        self.__storage_depth = d
 
     @property
     def own_masks(self) -> bool:
@@ -714,7 +885,7 @@ class Pyramid:
         Returns:
             Level: the bottom level
         """
-        return sorted(self.__levels.values(), key=lambda level: level.resolution)[0]
+        return self.__get_sorted_levels()[0]
 
     @property
     def top_level(self) -> "Level":
@@ -723,7 +894,7 @@ class Pyramid:
         Returns:
             Level: the top level
         """
-        return sorted(self.__levels.values(), key=lambda level: level.resolution)[-1]
+        return self.__get_sorted_levels()[-1]
 
     @property
     def type(self) -> PyramidType:
@@ -908,47 +1079,37 @@ class Pyramid:
             List[Level]: asked sorted levels
         """
 
-        sorted_levels = sorted(self.__levels.values(), key=lambda level: level.resolution)
+        sorted_levels = self.__get_sorted_levels()
 
-        levels = []
-
-        begin = False
         if bottom_id is None:
             # Pas de niveau du bas fourni, on commence tout en bas
-            begin = True
+            begin = 0
         else:
-            if self.get_level(bottom_id) is None:
+            try:
+                begin = self.__levels_positions[bottom_id]
+            except KeyError:
                 raise Exception(
                     f"Pyramid {self.name} does not contain the provided bottom level {bottom_id}"
                 )
 
-        if top_id is not None and self.get_level(top_id) is None:
-            raise Exception(f"Pyramid {self.name} does not contain the provided top level {top_id}")
-
-        end = False
-
-        for level in sorted_levels:
-            if not begin and level.id == bottom_id:
-                begin = True
-
-            if begin:
-                levels.append(level)
-                if top_id is not None and level.id == top_id:
-                    end = True
-                    break
-                else:
-                    continue
-
         if top_id is None:
-            # Pas de niveau du haut fourni, on a été jusqu'en haut et c'est normal
-            end = True
+            # Pas de niveau du haut fourni, on va jusqu'en haut
+            end = len(sorted_levels)
+        else:
+            try:
+                end = self.__levels_positions[top_id] + 1
+            except KeyError:
+                raise Exception(
+                    f"Pyramid {self.name} does not contain the provided top level {top_id}"
+                )
 
-        if not begin or not end:
+        # Une pyramide sans niveau donne une liste vide, si aucun niveau n'est précisé
+        if begin >= end and (bottom_id is not None or top_id is not None):
             raise Exception(
                 f"Provided levels ids are not consistent to extract levels from the pyramid {self.name}"
             )
 
-        return levels
+        return sorted_levels[begin:end]
 
     def write_descriptor(self) -> None:
         """Write the pyramid's descriptor to the final location (in the pyramid's storage root)"""
@@ -989,14 +1150,14 @@ class Pyramid:
         Returns:
             Tuple[SlabType, str, int, int]: Slab's type (DATA or MASK), level identifier, slab's column and slab's row
         """
-        if self.__storage["type"] == StorageType.FILE:
+        if self.__storage_type == StorageType.FILE:
             parts = path.split("/")
 
             # Le partie du chemin qui contient la colonne et ligne de la dalle est à la fin, en fonction de la profondeur choisie
             # depth = 2 -> on doit utiliser les 3 dernières parties pour la conversion
-            column, row = b36_path_decode("/".join(parts[-(self.__storage["depth"] + 1) :]))
-            level = parts[-(self.__storage["depth"] + 2)]
-            raw_slab_type = parts[-(self.__storage["depth"] + 3)]
+            column, row = b36_path_decode("/".join(parts[-(self.__storage_depth + 1) :]))
+            level = sys.intern(parts[-(self.__storage_depth + 2)])
+            raw_slab_type = parts[-(self.__storage_depth + 3)]
 
             # Pour être retro compatible avec l'ancien nommage
             if raw_slab_type == "IMAGE":
@@ -1006,10 +1167,10 @@ class Pyramid:
 
             return slab_type, level, column, row
         else:
-            parts = re.split(r"[/_]", path)
+            parts = _SLAB_SPLIT_RE.split(path)
             column = parts[-2]
             row = parts[-1]
-            level = parts[-3]
+            level = sys.intern(parts[-3])
             raw_slab_type = parts[-4]
 
             # Pour être retro compatible avec l'ancien nommage
@@ -1037,20 +1198,79 @@ class Pyramid:
         Returns:
             str: Absolute or relative slab's storage path
         """
-        if self.__storage["type"] == StorageType.FILE:
-            slab_path = os.path.join(
-                slab_type.value, level, b36_path_encode(column, row, self.__storage["depth"])
+        # Aucun des éléments n'est absolu : une concaténation suffit, sans passer par os.path.join
+        if self.__storage_type == StorageType.FILE:
+            slab_path = f"{slab_type.value}/{level}/" + b36_path_encode(
+                column, row, self.__storage_depth
             )
         else:
             slab_path = f"{slab_type.value}_{level}_{column}_{row}"
 
         if full:
             return get_path_from_infos(
-                self.__storage["type"], self.__storage["root"], self.__name, slab_path
+                self.__storage_type, self.__storage["root"], self.__name, slab_path
             )
         else:
             return slab_path
 
+    def get_slab_key(self, slab_type: SlabType, level: str, column: int, row: int) -> int:
+        """Pack slab's indices into one integer, usable as a cheap cache key
+
+        Bits are used as follow, from the most significant : slab type (2 bits), level position
+        in the TMS from the bottom (6 bits), Morton number of column and row (56 bits). Keys of the
+        same level are ordered along the Z-order curve. Keys only depend on the TMS, so they stay
+        valid when levels are added to or deleted from the pyramid.
+
+        Args:
+            slab_type (SlabType): DATA or MASK
+            level (str): Level identifier
+            column (int): Slab's column
+            row (int): Slab's row
+
+        Raises:
+            Exception: Level not in the pyramid or indices out of range
+
+        Returns:
+            int: 64 bits slab's key
+        """
+
+        if level not in self.__levels:
+            raise Exception(f"Pyramid {self.name} does not contain the level {level}")
+
+        position = self.__get_tms_positions()[level]
+
+        if position >= 64 or not (0 <= column < 2**_MORTON_BITS and 0 <= row < 2**_MORTON_BITS):
+            raise Exception(f"Slab ({level}, {column}, {row}) cannot be encoded into a 64 bits key")
+
+        slab_type_index = 0 if slab_type == SlabType.DATA else 1
+
+        return (slab_type_index << 62) | (position << 56) | morton_encode(column, row)
+
+    def get_infos_from_slab_key(self, key: int) -> Tuple[SlabType, str, int, int]:
+        """Get slab's indices from a key built with get_slab_key
+
+        Args:
+            key (int): 64 bits slab's key
+
+        Raises:
+            Exception: Key's level is not in the TMS or not in the pyramid
+
+        Returns:
+            Tuple[SlabType, str, int, int]: Slab's type (DATA or MASK), level identifier, slab's column and slab's row
+        """
+
+        self.__get_tms_positions()
+
+        slab_type = SlabType.DATA if (key >> 62) == 0 else SlabType.MASK
+        position = (key >> 56) & 0x3F
+
+        if position >= len(self.__tms_levels) or self.__tms_levels[position] not in self.__levels:
+            raise Exception(f"Slab key {key} does not match a level of the pyramid {self.name}")
+
+        column, row = morton_decode(key & ((1 << 56) - 1))
+
+        return slab_type, self.__tms_levels[position], column, row
+
     def get_tile_data_binary(self, level: str, column: int, row: int) -> str:
         """Get a pyramid's tile as binary string
 
@@ -1140,22 +1360,15 @@ class Pyramid:
             # L'absence de la dalle est gérée comme simplement une absence de données
             return None
 
-        offsets = numpy.frombuffer(
-            binary_index,
-            dtype=numpy.dtype("uint32"),
-            count=level_object.slab_width * level_object.slab_height,
-        )
-        sizes = numpy.frombuffer(
-            binary_index,
-            dtype=numpy.dtype("uint32"),
-            offset=4 * level_object.slab_width * level_object.slab_height,
-            count=level_object.slab_width * level_object.slab_height,
-        )
+        # Lecture des seuls offset et taille de la tuile voulue, en petit boutiste
+        tiles_count = level_object.slab_width * level_object.slab_height
+        (offset,) = struct.unpack_from("<I", binary_index, 4 * tile_index)
+        (size,) = struct.unpack_from("<I", binary_index, 4 * (tiles_count + tile_index))
 
-        if sizes[tile_index] == 0:
+        if size == 0:
             return None
 
-        return get_data_binary(slab_path, (offsets[tile_index], sizes[tile_index]))
+        return get_data_binary(slab_path, (offset, size))
 
     def get_tile_data_raster(self, level: str, column: int, row: int) -> numpy.ndarray:
         """Get a raster pyramid's tile as 3-dimension numpy ndarray
@@ -1417,6 +1630,8 @@ class Pyramid:
         except Exception:
             raise Exception(f"The level {level_id} don't exist in the pyramid")
 
+        self.__sorted_levels = None
+
     def add_level(
         self,
         level_id: str,
@@ -1447,12 +1662,13 @@ class Pyramid:
 
         lev = Level.from_descriptor(data, self)
 
-        if self.__tms.get_level(lev.id) is None:
+        if lev.tile_matrix is None:
             raise Exception(
                 f"Pyramid {self.name} owns a level with the ID '{lev.id}', not defined in the TMS '{self.tms.name}'"
             )
         else:
             self.__levels[lev.id] = lev
+            self.__sorted_levels = None
 
     @property
     def size(self) -> int:
@@ -13,15 +13,17 @@ import re
 import tempfile
 
 # standard library
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from json.decoder import JSONDecodeError
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
 
 # 3rd party
 from osgeo import gdal, ogr
 
 # package
 from rok4.enums import ColorFormat
+from rok4.exceptions import FormatError
 from rok4.storage import (
     copy,
     exists,
@@ -38,6 +40,8 @@ from rok4.utils import compute_bbox, compute_format
 ogr.UseExceptions()
 gdal.UseExceptions()
 
+_IMAGE_EXTENSION_RE = re.compile("(/[^/]+?)[.][a-zA-Z0-9_-]+$")
+
 
 class Raster:
     """A structure describing raster data
@@ -100,11 +104,11 @@ class Raster:
         image_datasource = gdal.Open(work_image_path)
         self.path = path
 
-        path_pattern = re.compile("(/[^/]+?)[.][a-zA-Z0-9_-]+$")
-        mask_path = path_pattern.sub("\\1.msk", path)
+        mask_path = _IMAGE_EXTENSION_RE.sub("\\1.msk", path)
+        work_mask_path = get_osgeo_path(mask_path)
 
-        if exists(mask_path):
-            work_mask_path = get_osgeo_path(mask_path)
+        # Présence du masque testée par GDAL, qui réutilise ces informations pour le format
+        if gdal.VSIStatL(work_mask_path) is not None:
             mask_driver = gdal.IdentifyDriver(work_mask_path).ShortName
             if "GTiff" != mask_driver:
                 message = f"Mask file '{mask_path}' use GDAL driver : '{mask_driver}'"
@@ -120,6 +124,43 @@ class Raster:
 
         return self
 
+    @classmethod
+    def from_files(cls, paths: List[str], max_workers: int = None) -> List["Raster"]:
+        """Creates Raster objects from several images, reading them concurrently
+
+        Each image is read as with `Raster.from_file`, in a pool of threads : storage and GDAL accesses of different images overlap.
+
+        Args:
+            paths (List[str]): paths to the images files/objects
+            max_workers (int, optional): maximum number of simultaneous readings. Defaults to None, ThreadPoolExecutor's default.
+
+        Examples:
+
+            Loading informations from S3 stored raster TIFF images
+
+                from rok4.raster import Raster
+
+                try:
+                    rasters = Raster.from_files(
+                        ["s3://bucket/0040_6150_L93.tif", "s3://bucket/0040_6151_L93.tif"],
+                        max_workers=8
+                    )
+
+                except Exception as e:
+                    print(f"Cannot load information from images : {e}")
+
+        Raises:
+            FormatError: MASK file is not a TIFF
+            RuntimeError: raised by OGR/GDAL if anything goes wrong
+            NotImplementedError: Storage type not handled
+            FileNotFoundError: File or object does not exists
+
+        Returns:
+            List[Raster]: Raster instances, in the same order as provided paths
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(cls.from_file, paths))
+
     @classmethod
     def from_parameters(
         cls,
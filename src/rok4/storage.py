@@ -38,20 +38,38 @@ Example, work with 2 S3 clusters:
 - ROK4_S3_URL=https://s3.storage.fr,https://s4.storage.fr
 
 To precise the cluster to use, bucket name should be bucket_name@s3.storage.fr or bucket_name@s4.storage.fr. If no host is defined (no @) in the bucket name, first S3 cluster is used
+
+S3 clients' connection pool can be sized with the environment variable ROK4_S3_MAX_POOL_CONNECTIONS. Default is 4 connections by CPU, at least 32. It's the maximum number of simultaneous requests to a S3 cluster.
+
+Large S3 transfers are split into parts, sent or received concurrently. It's possible to tune them with environment variables :
+
+- ROK4_S3_PART_SIZE : Size of parts, in bytes. Default 16 MiB, at least 5 MiB.
+- ROK4_S3_CONCURRENCY : Number of parts transferred at the same time, for one file or object. Default 16.
+- ROK4_S3_SPOOL_SIZE : Size, in bytes, up to which data copied to S3 from another S3 cluster, CEPH or HTTP is kept in memory before being spooled to a temporary file. Default is the part size.
+
+Requests failing with a transient error (5xx, throttling like SlowDown, connection issue) are retried, with a jittered exponential backoff. The maximum number of attempts, first one included, can be configured with the environment variable ROK4_S3_MAX_ATTEMPTS. Default is 5. Values lower than 1 are clamped to 1 : a single attempt, without retry.
+
+To use AWS S3 Transfer Acceleration (bucket have to be configured accordingly), set ROK4_S3_ACCELERATE to 1 or true.
 """
 
+import base64
+import errno
 import hashlib
+import io
 import os
-import re
 import tempfile
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
-from shutil import copyfile
-from typing import Dict, Tuple, Union
+from shutil import SameFileError, copyfile
+from typing import Dict, Iterable, Iterator, List, Tuple, Union
 
 import boto3
 import botocore.exceptions
 import requests
+from boto3.s3.transfer import TransferConfig
 
 # conditional import
 
@@ -75,6 +93,14 @@ except ImportError:
     CEPH_RADOS_AVAILABLE: bool = False
     rados = None
 
+try:
+    import blake3
+
+    BLAKE3_AVAILABLE: bool = True
+except ImportError:
+    BLAKE3_AVAILABLE: bool = False
+    blake3 = None
+
 # package
 from rok4.enums import StorageType
 from rok4.exceptions import MissingEnvironmentError, StorageError
@@ -84,11 +110,25 @@ from rok4.exceptions import MissingEnvironmentError, StorageError
 
 __CEPH_CLIENT = None
 __CEPH_IOCTXS = {}
+__CEPH_LOCK = threading.Lock()
 __OBJECT_SYMLINK_SIGNATURE = "SYMLINK#"
 __S3_CLIENTS = {}
+__S3_CLIENTS_LOCK = threading.Lock()
 __S3_DEFAULT_CLIENT = None
 __LRU_SIZE = 64
 __LRU_TTL = 300
+__S3_MAX_POOL_CONNECTIONS = max(32, (os.cpu_count() or 1) * 4)
+__HASH_BLOCK_SIZE = 1024 * 1024
+__BLOCK_BUFFERS = threading.local()
+__CEPH_CHUNK_SIZE = 4 * 1024 * 1024
+__CEPH_READ_DEPTH = 8
+__CEPH_WRITE_DEPTH = 8
+__STORAGE_TYPES = {t.value[:-3]: t for t in StorageType}
+__S3_LISTING_MIN_KEYS = 16
+__S3_LISTING_PAGE_SIZE = 1000
+__S3_MAX_ATTEMPTS = 5
+__S3_PART_SIZE = 16 * 1024 * 1024
+__S3_CONCURRENCY = 16
 
 try:
     __LRU_SIZE = int(os.environ["ROK4_READING_LRU_CACHE_SIZE"])
@@ -108,6 +148,54 @@ except ValueError:
 except KeyError:
     pass
 
+try:
+    __S3_MAX_POOL_CONNECTIONS = max(1, int(os.environ["ROK4_S3_MAX_POOL_CONNECTIONS"]))
+except ValueError:
+    pass
+except KeyError:
+    pass
+
+try:
+    # Nombre total de tentatives, la première incluse (au moins une)
+    __S3_MAX_ATTEMPTS = max(1, int(os.environ["ROK4_S3_MAX_ATTEMPTS"]))
+except ValueError:
+    pass
+except KeyError:
+    pass
+
+try:
+    # Les parties d'un envoi multiple font au moins 5 Mio (minimum imposé par S3)
+    __S3_PART_SIZE = max(5 * 1024 * 1024, int(os.environ["ROK4_S3_PART_SIZE"]))
+except ValueError:
+    pass
+except KeyError:
+    pass
+
+try:
+    __S3_CONCURRENCY = max(1, int(os.environ["ROK4_S3_CONCURRENCY"]))
+except ValueError:
+    pass
+except KeyError:
+    pass
+
+# Données copiées vers S3 depuis un autre cluster, CEPH ou HTTP : gardées en mémoire jusqu'à cette taille
+__COPY_SPOOL_MAX_SIZE = __S3_PART_SIZE
+
+try:
+    __COPY_SPOOL_MAX_SIZE = max(1, int(os.environ["ROK4_S3_SPOOL_SIZE"]))
+except ValueError:
+    pass
+except KeyError:
+    pass
+
+__S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=__S3_PART_SIZE,
+    max_concurrency=__S3_CONCURRENCY,
+    io_chunksize=1024 * 1024,
+    use_threads=True,
+)
+
 
 def __get_ttl_hash() -> int:
     """Return the time string rounded according to time-to-live value"""
@@ -136,63 +224,79 @@ def __get_s3_client(bucket_name: str) -> Tuple[Dict[str, Union["boto3.client", s
     global __S3_CLIENTS, __S3_DEFAULT_CLIENT
 
     if not __S3_CLIENTS:
-        verify = True
-        if "ROK4_SSL_NO_VERIFY" in os.environ and os.environ["ROK4_SSL_NO_VERIFY"] != "":
-            verify = False
-        # C'est la première fois qu'on cherche à utiliser le stockage S3, chargeons les informations depuis les variables d'environnement
-        try:
-            keys = os.environ["ROK4_S3_KEY"].split(",")
-            secret_keys = os.environ["ROK4_S3_SECRETKEY"].split(",")
-            urls = os.environ["ROK4_S3_URL"].split(",")
-
-            if len(keys) != len(secret_keys) or len(keys) != len(urls):
-                raise StorageError(
-                    "S3",
-                    "S3 informations in environment variables are inconsistent : same number of element in each list is required",
-                )
-
-            for i in range(len(keys)):
-                h = re.sub("https?://", "", urls[i])
-
-                if h in __S3_CLIENTS:
-                    raise StorageError("S3", "A S3 cluster is defined twice (based on URL)")
-
-                __S3_CLIENTS[h] = {
-                    "client": boto3.client(
-                        "s3",
-                        aws_access_key_id=keys[i],
-                        aws_secret_access_key=secret_keys[i],
-                        verify=verify,
-                        endpoint_url=urls[i],
-                        config=botocore.config.Config(tcp_keepalive=True, max_pool_connections=10),
-                    ),
-                    "key": keys[i],
-                    "secret_key": secret_keys[i],
-                    "url": urls[i],
-                    "host": h,
-                    "secure": urls[i].startswith("https://"),
-                }
-
-                if i == 0:
-                    # Le premier cluster est celui par défaut
-                    __S3_DEFAULT_CLIENT = h
-
-        except KeyError as e:
-            raise MissingEnvironmentError(e)
-        except Exception as e:
-            raise StorageError("S3", e)
+        # Plusieurs threads peuvent demander un client en même temps : un seul les crée
+        with __S3_CLIENTS_LOCK:
+            if not __S3_CLIENTS:
+                verify = True
+                if "ROK4_SSL_NO_VERIFY" in os.environ and os.environ["ROK4_SSL_NO_VERIFY"] != "":
+                    verify = False
+                # C'est la première fois qu'on cherche à utiliser le stockage S3, chargeons les informations depuis les variables d'environnement
+                try:
+                    keys = os.environ["ROK4_S3_KEY"].split(",")
+                    secret_keys = os.environ["ROK4_S3_SECRETKEY"].split(",")
+                    urls = os.environ["ROK4_S3_URL"].split(",")
+
+                    if len(keys) != len(secret_keys) or len(keys) != len(urls):
+                        raise StorageError(
+                            "S3",
+                            "S3 informations in environment variables are inconsistent : same number of element in each list is required",
+                        )
+
+                    # Configuration commune : pool de connexions dimensionné pour les accès concurrents, et reprises
+                    # avec attente exponentielle aléatoire sur les erreurs transitoires (5xx, SlowDown, coupures)
+                    accelerate = os.environ.get("ROK4_S3_ACCELERATE", "").lower() in ("1", "true")
+                    config = botocore.config.Config(
+                        tcp_keepalive=True,
+                        max_pool_connections=__S3_MAX_POOL_CONNECTIONS,
+                        retries={"total_max_attempts": __S3_MAX_ATTEMPTS, "mode": "standard"},
+                        s3={"use_accelerate_endpoint": accelerate},
+                    )
 
-    try:
-        host = bucket_name.split("@")[1]
-    except IndexError:
+                    clients = {}
+                    for i in range(len(keys)):
+                        h = urls[i].split("://", 1)[-1]
+
+                        if h in clients:
+                            raise StorageError("S3", "A S3 cluster is defined twice (based on URL)")
+
+                        clients[h] = {
+                            "client": boto3.client(
+                                "s3",
+                                aws_access_key_id=keys[i],
+                                aws_secret_access_key=secret_keys[i],
+                                verify=verify,
+                                endpoint_url=urls[i],
+                                config=config,
+                            ),
+                            "key": keys[i],
+                            "secret_key": secret_keys[i],
+                            "url": urls[i],
+                            "host": h,
+                            "secure": urls[i].startswith("https://"),
+                        }
+
+                        if i == 0:
+                            # Le premier cluster est celui par défaut
+                            __S3_DEFAULT_CLIENT = h
+
+                    # Les clients ne sont visibles qu'une fois tous créés
+                    __S3_CLIENTS = clients
+
+                except KeyError as e:
+                    raise MissingEnvironmentError(e)
+                except Exception as e:
+                    raise StorageError("S3", e)
+
+    # Sans hôte précisé, on utilise le cluster par défaut
+    bucket_name, _, host = bucket_name.partition("@")
+    if host == "":
         host = __S3_DEFAULT_CLIENT
 
-    bucket_name = bucket_name.split("@")[0]
-
-    if host not in __S3_CLIENTS:
+    s3_client = __S3_CLIENTS.get(host)
+    if s3_client is None:
         raise StorageError("S3", f"Unknown S3 cluster, according to host '{host}'")
 
-    return __S3_CLIENTS[host], bucket_name
+    return s3_client, bucket_name
 
 
 def disconnect_s3_clients() -> None:
@@ -220,26 +324,30 @@ def __get_ceph_ioctx(pool: str) -> "rados.Ioctx":
     """
     global __CEPH_CLIENT, __CEPH_IOCTXS
 
-    if __CEPH_CLIENT is None:
-        try:
-            __CEPH_CLIENT = rados.Rados(
-                conffile=os.environ["ROK4_CEPH_CONFFILE"],
-                clustername=os.environ["ROK4_CEPH_CLUSTERNAME"],
-                name=os.environ["ROK4_CEPH_USERNAME"],
-            )
+    if __CEPH_CLIENT is None or pool not in __CEPH_IOCTXS:
+        # Plusieurs threads peuvent demander un contexte en même temps : un seul le crée
+        with __CEPH_LOCK:
+            if __CEPH_CLIENT is None:
+                try:
+                    client = rados.Rados(
+                        conffile=os.environ["ROK4_CEPH_CONFFILE"],
+                        clustername=os.environ["ROK4_CEPH_CLUSTERNAME"],
+                        name=os.environ["ROK4_CEPH_USERNAME"],
+                    )
 
-            __CEPH_CLIENT.connect()
+                    client.connect()
+                    __CEPH_CLIENT = client
 
-        except KeyError as e:
-            raise MissingEnvironmentError(e)
-        except Exception as e:
-            raise StorageError("CEPH", e)
+                except KeyError as e:
+                    raise MissingEnvironmentError(e)
+                except Exception as e:
+                    raise StorageError("CEPH", e)
 
-    if pool not in __CEPH_IOCTXS:
-        try:
-            __CEPH_IOCTXS[pool] = __CEPH_CLIENT.open_ioctx(pool)
-        except Exception as e:
-            raise StorageError("CEPH", e)
+            if pool not in __CEPH_IOCTXS:
+                try:
+                    __CEPH_IOCTXS[pool] = __CEPH_CLIENT.open_ioctx(pool)
+                except Exception as e:
+                    raise StorageError("CEPH", e)
 
     return __CEPH_IOCTXS[pool]
 
@@ -251,9 +359,33 @@ def disconnect_ceph_clients() -> None:
     __CEPH_IOCTXS = {}
 
 
+def __reset_clients_after_fork() -> None:
+    """Forget S3 and CEPH clients in a forked process
+
+    Connection pools and RADOS handles inherited from the parent process must not be shared : the child process
+    creates its own clients at the first use.
+    """
+
+    global __S3_CLIENTS_LOCK, __CEPH_LOCK
+
+    # Un verrou détenu par un autre thread au moment du fork ne serait jamais libéré
+    __S3_CLIENTS_LOCK = threading.Lock()
+    __CEPH_LOCK = threading.Lock()
+
+    disconnect_s3_clients()
+    disconnect_ceph_clients()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=__reset_clients_after_fork)
+
+
+@lru_cache(maxsize=4096)
 def get_infos_from_path(path: str) -> Tuple[StorageType, str, str, str]:
     """Extract storage type, the unprefixed path, the container and the basename from path (Default: FILE storage)
 
+    Results are cached : the same paths are analysed again and again when reading tiles.
+
     For a FILE storage, the tray is the directory and the basename is the file name.
 
     For an object storage (CEPH or S3), the tray is the bucket or the pool and the basename is the object name.
@@ -266,20 +398,24 @@ def get_infos_from_path(path: str) -> Tuple[StorageType, str, str, str]:
         Tuple[StorageType, str, str, str]: storage type, unprefixed path, the container and the basename
     """
 
-    if path.startswith("s3://"):
-        bucket_name, object_name = path[5:].split("/", 1)
-        return StorageType.S3, path[5:], bucket_name, object_name
-    elif path.startswith("ceph://"):
-        pool_name, object_name = path[7:].split("/", 1)
-        return StorageType.CEPH, path[7:], pool_name, object_name
-    elif path.startswith("file://"):
-        return StorageType.FILE, path[7:], os.path.dirname(path[7:]), os.path.basename(path[7:])
-    elif path.startswith("http://"):
-        return StorageType.HTTP, path[7:], os.path.dirname(path[7:]), os.path.basename(path[7:])
-    elif path.startswith("https://"):
-        return StorageType.HTTPS, path[8:], os.path.dirname(path[8:]), os.path.basename(path[8:])
+    scheme, separator, unprefixed_path = path.partition("://")
+    storage_type = __STORAGE_TYPES.get(scheme) if separator else None
+
+    if storage_type is None:
+        # Pas de préfixe connu : chemin fichier, conservé tel quel
+        storage_type = StorageType.FILE
+        unprefixed_path = path
+
+    if storage_type == StorageType.S3 or storage_type == StorageType.CEPH:
+        tray_name, base_name = unprefixed_path.split("/", 1)
     else:
-        return StorageType.FILE, path, os.path.dirname(path), os.path.basename(path)
+        # Équivalent de os.path.dirname et os.path.basename, en un seul découpage
+        i = unprefixed_path.rfind("/") + 1
+        tray_name, base_name = unprefixed_path[:i], unprefixed_path[i:]
+        if tray_name and tray_name != "/" * len(tray_name):
+            tray_name = tray_name.rstrip("/")
+
+    return storage_type, unprefixed_path, tray_name, base_name
 
 
 def get_path_from_infos(storage_type: StorageType, *args) -> str:
@@ -296,27 +432,174 @@ def get_path_from_infos(storage_type: StorageType, *args) -> str:
     return f"{storage_type.value}{os.path.join(*args)}"
 
 
-def hash_file(path: str) -> str:
-    """Process MD5 sum of the provided file
+def __new_md5() -> "hashlib._Hash":
+    """Create a MD5 checker, flagged as not used for security when possible
+
+    MD5 sums are only integrity controls : outside security context, OpenSSL does not block MD5 in FIPS mode.
+
+    Returns:
+        hashlib._Hash: MD5 checker
+    """
+
+    try:
+        return hashlib.md5(usedforsecurity=False)
+    except TypeError:
+        # Python < 3.9
+        return hashlib.md5()
+
+
+def __get_block_buffer() -> memoryview:
+    """Get the reading buffer of the calling thread, allocated at its first use
+
+    Buffer is reused by successive hashings and copies, in the same thread : it must not be kept by the caller.
+
+    Returns:
+        memoryview: buffer of __HASH_BLOCK_SIZE bytes
+    """
+
+    buffer = getattr(__BLOCK_BUFFERS, "buffer", None)
+    if buffer is None or len(buffer) != __HASH_BLOCK_SIZE:
+        buffer = memoryview(bytearray(__HASH_BLOCK_SIZE))
+        __BLOCK_BUFFERS.buffer = buffer
+
+    return buffer
+
+
+def __new_checker(algorithm: str) -> "hashlib._Hash":
+    """Create a checker for the provided hash algorithm
+
+    Args:
+        algorithm (str): "md5", "blake3" or any algorithm name handled by hashlib.new
+
+    Raises:
+        NotImplementedError: BLAKE3 is asked but the blake3 package is not installed
+        ValueError: Unknown algorithm
+
+    Returns:
+        hashlib._Hash: checker
+    """
+
+    if algorithm == "md5":
+        return __new_md5()
+
+    if algorithm == "blake3":
+        if not BLAKE3_AVAILABLE:
+            raise NotImplementedError("BLAKE3 hashing requires the blake3 package")
+        return blake3.blake3()
+
+    return hashlib.new(algorithm)
+
+
+def hash_file(path: str, algorithm: str = "md5") -> str:
+    """Process hash sum of the provided file, MD5 by default
+
+    MD5 is required to compare with S3 ETags or MD5 sums provided to `copy`. For internal integrity controls,
+    faster algorithms can be used : "blake2b" (standard library) or "blake3" (blake3 package, using SIMD instructions
+    and several threads, installed with the rok4[blake3] extra).
 
     Args:
         path (str): path to file
+        algorithm (str, optional): hash algorithm, "md5", "blake3" or any algorithm name handled by hashlib.new. Defaults to "md5".
+
+    Raises:
+        NotImplementedError: BLAKE3 is asked but the blake3 package is not installed
+        ValueError: Unknown algorithm
 
     Returns:
-        str: hexadeimal MD5 sum
+        str: hexadecimal hash sum
     """
 
-    checker = hashlib.md5()
+    checker = __new_checker(algorithm)
 
-    with open(path, "rb") as file:
-        chunk = 0
-        while chunk != b"":
-            chunk = file.read(65536)
-            checker.update(chunk)
+    with open(path, "rb", buffering=0) as file:
+        # Python 3.11+ : boucle de lecture et de calcul entièrement en C
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(file, lambda: checker).hexdigest()
+
+        # Lecture dans le tampon du thread, réutilisé d'un appel à l'autre
+        buffer = __get_block_buffer()
+
+        while True:
+            size = file.readinto(buffer)
+            if not size:
+                break
+            checker.update(buffer[:size])
 
     return checker.hexdigest()
 
 
+def hash_file_parts(path: str, part_size: int = None, max_workers: int = 8) -> Tuple[str, str]:
+    """Process MD5 sum and S3 multipart ETag of the provided file, hashing parts in parallel
+
+    Parts are read and hashed by a pool of threads (hashlib releases the GIL on large buffers), while the whole file
+    MD5 sum is updated with the parts in order. The file is read only once.
+
+    The ETag is the one S3 gives to an object uploaded with parts of part_size bytes : MD5 sum of the concatenated
+    parts' digests, followed by the parts count. For an empty file, it is the MD5 sum.
+
+    Args:
+        path (str): path to file
+        part_size (int, optional): parts size, in bytes. Defaults to the multipart chunk size used for S3 uploads.
+        max_workers (int, optional): maximum number of parts read and hashed at the same time. Defaults to 8.
+
+    Examples:
+
+        from rok4.storage import hash_file_parts
+
+        md5, etag = hash_file_parts("/data/SCAN1000.tif")
+
+    Returns:
+        Tuple[str, str]: hexadecimal MD5 sum and S3 multipart ETag
+    """
+
+    if part_size is None:
+        part_size = __S3_TRANSFER_CONFIG.multipart_chunksize
+
+    checker = __new_md5()
+    digests = []
+
+    with open(path, "rb", buffering=0) as file, ThreadPoolExecutor(max_workers) as executor:
+        fd = file.fileno()
+        offsets = iter(range(0, os.fstat(fd).st_size, part_size))
+        pending = deque()
+
+        def hash_part(offset: int) -> Tuple[bytes, bytes]:
+            # Lecture positionnelle : les threads ne partagent pas la position du fichier
+            data = os.pread(fd, part_size, offset)
+            while len(data) < part_size:
+                block = os.pread(fd, part_size - len(data), offset + len(data))
+                if not block:
+                    break
+                data += block
+
+            part_checker = __new_md5()
+            part_checker.update(data)
+            return data, part_checker.digest()
+
+        for offset in offsets:
+            pending.append(executor.submit(hash_part, offset))
+            if len(pending) == max_workers:
+                break
+
+        while pending:
+            data, digest = pending.popleft().result()
+            checker.update(data)
+            digests.append(digest)
+
+            # Une partie traitée libère une place pour la suivante
+            offset = next(offsets, None)
+            if offset is not None:
+                pending.append(executor.submit(hash_part, offset))
+
+    if len(digests) == 0:
+        return checker.hexdigest(), checker.hexdigest()
+
+    etag_checker = __new_md5()
+    etag_checker.update(b"".join(digests))
+
+    return checker.hexdigest(), f"{etag_checker.hexdigest()}-{len(digests)}"
+
+
 def get_data_str(path: str) -> str:
     """Load full data into a string
 
@@ -336,6 +619,183 @@ def get_data_str(path: str) -> str:
     return get_data_binary(path).decode("utf-8")
 
 
+def __read_fd(fd: int, size: int) -> bytes:
+    """Read bytes from a file descriptor, until the wanted size or the end of file
+
+    Args:
+        fd (int): opened file descriptor
+        size (int): number of bytes to read
+
+    Returns:
+        bytes: read data, shorter than the wanted size if the end of file is reached
+    """
+
+    data = os.read(fd, size)
+
+    if 0 < len(data) < size:
+        # Lecture partielle (fichier très volumineux par exemple) : on complète
+        chunks = [data]
+        remaining = size - len(data)
+        while remaining > 0:
+            chunk = os.read(fd, remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        data = b"".join(chunks)
+
+    return data
+
+
+def __read_fd_to_end(fd: int) -> bytes:
+    """Read bytes from a file descriptor, until the end of file
+
+    The file's size is only a hint for the first reading : some files (procfs, FIFO, standard input) report a
+    null size but provide data.
+
+    Args:
+        fd (int): opened file descriptor
+
+    Returns:
+        bytes: read data
+    """
+
+    # Un octet de plus que la taille annoncée, pour constater la fin du fichier à la lecture suivante
+    read_size = max(os.fstat(fd).st_size + 1, io.DEFAULT_BUFFER_SIZE)
+
+    chunks = []
+    while True:
+        chunk = os.read(fd, read_size)
+        if not chunk:
+            break
+        chunks.append(chunk)
+
+    return b"".join(chunks)
+
+
+def __get_data_binary_s3(
+    storage_type: StorageType, path: str, tray_name: str, base_name: str, range: Tuple[int, int]
+) -> str:
+    """Load S3 object's data into a binary string"""
+    s3_client, bucket_name = __get_s3_client(tray_name)
+
+    try:
+        if range is None:
+            data = (
+                s3_client["client"]
+                .get_object(
+                    Bucket=bucket_name,
+                    Key=base_name,
+                )["Body"]
+                .read()
+            )
+        else:
+            data = (
+                s3_client["client"]
+                .get_object(
+                    Bucket=bucket_name,
+                    Key=base_name,
+                    Range=f"bytes={range[0]}-{range[0] + range[1] - 1}",
+                )["Body"]
+                .read()
+            )
+
+    except botocore.exceptions.ClientError as e:
+        if e.response["Error"]["Code"] == "NoSuchKey":
+            raise FileNotFoundError(f"{storage_type.value}{path}")
+        else:
+            raise StorageError("S3", e)
+
+    except Exception as e:
+        raise StorageError("S3", e)
+
+    return data
+
+
+def __get_data_binary_ceph(
+    storage_type: StorageType, path: str, tray_name: str, base_name: str, range: Tuple[int, int]
+) -> str:
+    """Load CEPH object's data into a binary string"""
+    ioctx = __get_ceph_ioctx(tray_name)
+
+    try:
+        if range is None:
+            # Lecture directe sans demander la taille au préalable : une seule requête
+            # pour les objets plus petits qu'un bloc, puis bloc par bloc si besoin
+            data = ioctx.read(base_name, __CEPH_CHUNK_SIZE)
+            if len(data) == __CEPH_CHUNK_SIZE:
+                chunks = [data]
+                while len(chunks[-1]) == __CEPH_CHUNK_SIZE:
+                    chunks.append(
+                        ioctx.read(base_name, __CEPH_CHUNK_SIZE, len(chunks) * __CEPH_CHUNK_SIZE)
+                    )
+                data = b"".join(chunks)
+        else:
+            data = ioctx.read(base_name, range[1], range[0])
+
+    except rados.ObjectNotFound:
+        raise FileNotFoundError(f"{storage_type.value}{path}")
+
+    except Exception as e:
+        raise StorageError("CEPH", e)
+
+    return data
+
+
+def __get_data_binary_file(
+    storage_type: StorageType, path: str, tray_name: str, base_name: str, range: Tuple[int, int]
+) -> str:
+    """Load file's data into a binary string"""
+    try:
+        # Lecture directe sur le descripteur, sans tampon intermédiaire
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            if range is None:
+                data = __read_fd_to_end(fd)
+            else:
+                os.lseek(fd, range[0], os.SEEK_SET)
+                data = __read_fd(fd, range[1])
+        finally:
+            os.close(fd)
+
+    except FileNotFoundError:
+        raise FileNotFoundError(f"{storage_type.value}{path}")
+
+    except Exception as e:
+        raise StorageError("FILE", e)
+
+    return data
+
+
+def __get_data_binary_http(
+    storage_type: StorageType, path: str, tray_name: str, base_name: str, range: Tuple[int, int]
+) -> str:
+    """Load HTTP(S) resource's data into a binary string"""
+    if range is not None:
+        raise NotImplementedError("Cannot get partial data for storage type HTTP(S)")
+
+    try:
+        reponse = requests.get(f"{storage_type.value}{path}", stream=True)
+        data = reponse.content
+        if reponse.status_code == 404:
+            raise FileNotFoundError(f"{storage_type.value}{path}")
+    except Exception as e:
+        raise StorageError(storage_type.name, e)
+
+    return data
+
+
+# Fonction de lecture selon le type de stockage
+__GET_DATA_BINARY_FUNCTIONS = {
+    StorageType.S3: __get_data_binary_s3,
+    StorageType.FILE: __get_data_binary_file,
+    StorageType.HTTP: __get_data_binary_http,
+    StorageType.HTTPS: __get_data_binary_http,
+}
+if CEPH_RADOS_AVAILABLE:
+    __GET_DATA_BINARY_FUNCTIONS[StorageType.CEPH] = __get_data_binary_ceph
+
+
 @lru_cache(maxsize=__LRU_SIZE)
 def __get_cached_data_binary(path: str, ttl_hash: int, range: Tuple[int, int] = None) -> str:
     """Load data into a binary string, using a LRU cache
@@ -356,312 +816,760 @@ def __get_cached_data_binary(path: str, ttl_hash: int, range: Tuple[int, int] =
     """
     storage_type, path, tray_name, base_name = get_infos_from_path(path)
 
+    try:
+        read_function = __GET_DATA_BINARY_FUNCTIONS[storage_type]
+    except KeyError:
+        raise NotImplementedError(f"Cannot get data for storage type {storage_type.name}")
+
+    return read_function(storage_type, path, tray_name, base_name, range)
+
+
+def get_data_binary(path: str, range: Tuple[int, int] = None) -> str:
+    """Load data into a binary string
+
+    This function uses a LRU cache, with a TTL of 5 minutes
+
+    Args:
+        path (str): path to data
+        range (Tuple[int, int], optional): offset and size, to make a partial read. Defaults to None.
+
+    Raises:
+        MissingEnvironmentError: Missing object storage informations
+        StorageError: Storage read issue
+        FileNotFoundError: File or object does not exist
+        NotImplementedError: Storage type not handled
+
+    Returns:
+        str: Data binary content
+    """
+    return __get_cached_data_binary(path, __get_ttl_hash(), range)
+
+
+def get_data_chunks(path: str) -> Tuple[int, Iterator[bytes]]:
+    """Open data for a streamed reading, and get its size with the same request
+
+    Unlike `get_data_binary`, data is not cached nor entirely loaded in memory. Errors occuring after the opening are
+    raised during the iteration, as provided by the storage library.
+
+    Args:
+        path (str): path to data
+
+    Examples:
+
+        from rok4.storage import get_data_chunks
+
+        try:
+            size, chunks = get_data_chunks("s3://bucket/data.json")
+            for chunk in chunks:
+                process(chunk)
+
+        except Exception as e:
+            print(f"Cannot read data : {e}")
+
+    Raises:
+        MissingEnvironmentError: Missing object storage informations
+        StorageError: Storage read issue
+        FileNotFoundError: File or object does not exist
+        NotImplementedError: Storage type not handled
+
+    Returns:
+        Tuple[int, Iterator[bytes]]: data size (None if not provided by a HTTP(S) server) and data chunks
+    """
+
+    storage_type, path, tray_name, base_name = get_infos_from_path(path)
+
     if storage_type == StorageType.S3:
         s3_client, bucket_name = __get_s3_client(tray_name)
 
         try:
-            if range is None:
-                data = (
-                    s3_client["client"]
-                    .get_object(
-                        Bucket=bucket_name,
-                        Key=base_name,
-                    )["Body"]
-                    .read()
-                )
-            else:
-                data = (
-                    s3_client["client"]
-                    .get_object(
-                        Bucket=bucket_name,
-                        Key=base_name,
-                        Range=f"bytes={range[0]}-{range[0] + range[1] - 1}",
-                    )["Body"]
-                    .read()
-                )
-
+            # Une seule requête donne la taille et le contenu
+            response = s3_client["client"].get_object(Bucket=bucket_name, Key=base_name)
         except botocore.exceptions.ClientError as e:
             if e.response["Error"]["Code"] == "NoSuchKey":
                 raise FileNotFoundError(f"{storage_type.value}{path}")
             else:
                 raise StorageError("S3", e)
-
         except Exception as e:
             raise StorageError("S3", e)
 
+        return int(response["ContentLength"]), response["Body"].iter_chunks(__HASH_BLOCK_SIZE)
+
     elif storage_type == StorageType.CEPH and CEPH_RADOS_AVAILABLE:
         ioctx = __get_ceph_ioctx(tray_name)
 
         try:
-            if range is None:
-                size, mtime = ioctx.stat(base_name)
-                data = ioctx.read(base_name, size)
-            else:
-                data = ioctx.read(base_name, range[1], range[0])
-
+            size, mtime = ioctx.stat(base_name)
         except rados.ObjectNotFound:
             raise FileNotFoundError(f"{storage_type.value}{path}")
-
         except Exception as e:
             raise StorageError("CEPH", e)
 
+        return size, __read_ceph_chunks(ioctx, base_name, size)
+
     elif storage_type == StorageType.FILE:
         try:
-            f = open(path, "rb")
-            if range is None:
-                data = f.read()
-            else:
-                f.seek(range[0])
-                data = f.read(range[1])
+            file = open(path, "rb", buffering=0)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"{storage_type.value}{path}")
+        except Exception as e:
+            raise StorageError("FILE", e)
+
+        try:
+            size = os.fstat(file.fileno()).st_size
+        except Exception as e:
+            # Le fichier n'est confié au générateur qu'en cas de succès
+            file.close()
+            raise StorageError("FILE", e)
+
+        def read_file() -> Iterator[bytes]:
+            with file:
+                while True:
+                    chunk = file.read(__HASH_BLOCK_SIZE)
+                    if not chunk:
+                        return
+                    yield chunk
+
+        return size, read_file()
+
+    elif storage_type == StorageType.HTTP or storage_type == StorageType.HTTPS:
+        try:
+            response = requests.get(f"{storage_type.value}{path}", stream=True)
+        except Exception as e:
+            raise StorageError(storage_type.name, e)
+
+        if response.status_code == 404:
+            raise FileNotFoundError(f"{storage_type.value}{path}")
+
+        size = response.headers.get("Content-Length")
+        if size is not None:
+            size = int(size)
+
+        return size, response.iter_content(chunk_size=__HASH_BLOCK_SIZE)
+
+    else:
+        raise NotImplementedError(f"Cannot get data for storage type {storage_type.name}")
+
+
+def __put_data_str_s3(data: str, path: str, tray_name: str, base_name: str) -> None:
+    """Store string data into a S3 object"""
+    s3_client, bucket_name = __get_s3_client(tray_name)
+
+    try:
+        body = data.encode("utf-8")
+        if len(body) < __S3_TRANSFER_CONFIG.multipart_threshold:
+            s3_client["client"].put_object(Body=body, Bucket=bucket_name, Key=base_name)
+        else:
+            # Gros contenu : envoi en plusieurs parties simultanées
+            s3_client["client"].upload_fileobj(
+                io.BytesIO(body), bucket_name, base_name, Config=__S3_TRANSFER_CONFIG
+            )
+    except Exception as e:
+        raise StorageError("S3", e)
+
+
+def __put_data_str_ceph(data: str, path: str, tray_name: str, base_name: str) -> None:
+    """Store string data into a CEPH object"""
+    ioctx = __get_ceph_ioctx(tray_name)
+
+    try:
+        ioctx.write_full(base_name, data.encode("utf-8"))
+    except Exception as e:
+        raise StorageError("CEPH", e)
+
+
+def __put_data_str_file(data: str, path: str, tray_name: str, base_name: str) -> None:
+    """Store string data into a file"""
+    try:
+        with open(path, "w") as f:
+            f.write(data)
+    except Exception as e:
+        raise StorageError("FILE", e)
+
+
+# Fonction d'écriture selon le type de stockage
+__PUT_DATA_STR_FUNCTIONS = {
+    StorageType.S3: __put_data_str_s3,
+    StorageType.FILE: __put_data_str_file,
+}
+if CEPH_RADOS_AVAILABLE:
+    __PUT_DATA_STR_FUNCTIONS[StorageType.CEPH] = __put_data_str_ceph
+
+
+def put_data_str(data: str, path: str) -> None:
+    """Store string data into a file or an object
+
+    UTF-8 encoding is used for bytes conversion
+
+    Args:
+        data (str): data to write
+        path (str): destination path, where to write data
+
+    Raises:
+        MissingEnvironmentError: Missing object storage informations
+        StorageError: Storage write issue
+        NotImplementedError: Storage type not handled
+    """
+
+    storage_type, path, tray_name, base_name = get_infos_from_path(path)
+
+    try:
+        put_function = __PUT_DATA_STR_FUNCTIONS[storage_type]
+    except KeyError:
+        raise NotImplementedError(f"Cannot write data for storage type {storage_type.name}")
+
+    put_function(data, path, tray_name, base_name)
+
+
+def __get_size_s3(storage_type: StorageType, path: str, tray_name: str, base_name: str) -> int:
+    """Get size of a S3 object"""
+    s3_client, bucket_name = __get_s3_client(tray_name)
+
+    try:
+        size = s3_client["client"].head_object(Bucket=bucket_name, Key=base_name)["ContentLength"]
+        return int(size)
+    except Exception as e:
+        raise StorageError("S3", e)
+
+
+def __get_size_ceph(storage_type: StorageType, path: str, tray_name: str, base_name: str) -> int:
+    """Get size of a CEPH object"""
+    ioctx = __get_ceph_ioctx(tray_name)
+
+    try:
+        size, mtime = ioctx.stat(base_name)
+        return size
+    except Exception as e:
+        raise StorageError("CEPH", e)
+
+
+def __get_size_file(storage_type: StorageType, path: str, tray_name: str, base_name: str) -> int:
+    """Get size of a file"""
+    try:
+        file_stats = os.stat(path)
+        return file_stats.st_size
+    except Exception as e:
+        raise StorageError("FILE", e)
+
+
+def __get_size_http(storage_type: StorageType, path: str, tray_name: str, base_name: str) -> int:
+    """Get size of a HTTP(S) resource, from the response header"""
+    try:
+        # Le stream=True permet de ne télécharger que le header initialement
+        reponse = requests.get(storage_type.value + path, stream=True).headers["content-length"]
+        return reponse
+    except Exception as e:
+        raise StorageError(storage_type.name, e)
+
+
+# Fonction de lecture de la taille selon le type de stockage
+__GET_SIZE_FUNCTIONS = {
+    StorageType.S3: __get_size_s3,
+    StorageType.FILE: __get_size_file,
+    StorageType.HTTP: __get_size_http,
+    StorageType.HTTPS: __get_size_http,
+}
+if CEPH_RADOS_AVAILABLE:
+    __GET_SIZE_FUNCTIONS[StorageType.CEPH] = __get_size_ceph
+
+
+def get_size(path: str) -> int:
+    """Get size of file or object
+
+    Args:
+        path (str): path of file/object whom size is asked
+
+    Raises:
+        MissingEnvironmentError: Missing object storage informations
+        StorageError: Storage read issue
+        NotImplementedError: Storage type not handled
+
+    Returns:
+        int: file/object size, in bytes
+    """
+
+    storage_type, path, tray_name, base_name = get_infos_from_path(path)
+
+    try:
+        size_function = __GET_SIZE_FUNCTIONS[storage_type]
+    except KeyError:
+        raise NotImplementedError(f"Cannot get size for storage type {storage_type.name}")
+
+    return size_function(storage_type, path, tray_name, base_name)
+
+
+def __exists_s3(storage_type: StorageType, path: str, tray_name: str, base_name: str) -> bool:
+    """Does the S3 object exist ?"""
+    s3_client, bucket_name = __get_s3_client(tray_name)
+
+    try:
+        s3_client["client"].head_object(Bucket=bucket_name, Key=base_name)
+        return True
+    except botocore.exceptions.ClientError as e:
+        if e.response["Error"]["Code"] == "404":
+            return False
+        else:
+            raise StorageError("S3", e)
+
+
+def __exists_ceph(storage_type: StorageType, path: str, tray_name: str, base_name: str) -> bool:
+    """Does the CEPH object exist ?"""
+    ioctx = __get_ceph_ioctx(tray_name)
+
+    try:
+        ioctx.stat(base_name)
+        return True
+    except rados.ObjectNotFound:
+        return False
+    except Exception as e:
+        raise StorageError("CEPH", e)
+
+
+def __exists_file(storage_type: StorageType, path: str, tray_name: str, base_name: str) -> bool:
+    """Does the file exist ?"""
+    return os.path.exists(path)
+
+
+def __exists_http(storage_type: StorageType, path: str, tray_name: str, base_name: str) -> bool:
+    """Does the HTTP(S) resource exist ?"""
+    try:
+        response = requests.get(storage_type.value + path, stream=True)
+        if response.status_code == 200:
+            return True
+        else:
+            return False
+    except Exception as e:
+        raise StorageError(storage_type.name, e)
+
+
+# Fonction de test d'existence selon le type de stockage
+__EXISTS_FUNCTIONS = {
+    StorageType.S3: __exists_s3,
+    StorageType.FILE: __exists_file,
+    StorageType.HTTP: __exists_http,
+    StorageType.HTTPS: __exists_http,
+}
+if CEPH_RADOS_AVAILABLE:
+    __EXISTS_FUNCTIONS[StorageType.CEPH] = __exists_ceph
+
+
+def exists(path: str) -> bool:
+    """Do the file or object exist ?
+
+    Args:
+        path (str): path of file/object to test
+
+    Raises:
+        MissingEnvironmentError: Missing object storage informations
+        StorageError: Storage read issue
+        NotImplementedError: Storage type not handled
+
+    Returns:
+        bool: file/object existing status
+    """
+
+    storage_type, path, tray_name, base_name = get_infos_from_path(path)
+
+    try:
+        exists_function = __EXISTS_FUNCTIONS[storage_type]
+    except KeyError:
+        raise NotImplementedError(f"Cannot test existence for storage type {storage_type.name}")
+
+    return exists_function(storage_type, path, tray_name, base_name)
+
+
+def __list_s3_keys(tray_name: str, keys: List[str]) -> Tuple[set, bool]:
+    """List S3 objects around the provided keys, to test their existence with few requests
+
+    Listing uses the keys' common prefix and starts just before the smallest key. It stops after the biggest key
+    or when too many objects (unrelated to the provided keys) are listed. If listing is refused (missing
+    s3:ListBucket permission for example), it is considered incomplete, so that keys are tested individually.
+
+    Args:
+        tray_name (str): S3 bucket name, with the cluster host if needed
+        keys (List[str]): objects' keys to look for, in the bucket
+
+    Raises:
+        MissingEnvironmentError: Missing S3 storage informations
+        StorageError: S3 listing issue
+
+    Returns:
+        Tuple[set, bool]: found keys, and listing completeness (if False, missing keys are undetermined)
+    """
+
+    s3_client, bucket_name = __get_s3_client(tray_name)
+
+    wanted = set(keys)
+    first_key = min(keys)
+    last_key = max(keys)
+    budget = max(__S3_LISTING_PAGE_SIZE, 2 * len(wanted))
+
+    found = set()
+    listed = 0
+
+    try:
+        paginator = s3_client["client"].get_paginator("list_objects_v2")
+        pages = paginator.paginate(
+            Bucket=bucket_name,
+            Prefix=os.path.commonprefix(keys),
+            StartAfter=first_key[:-1],
+            PaginationConfig={"PageSize": __S3_LISTING_PAGE_SIZE},
+        )
+
+        for page in pages:
+            for content in page.get("Contents", []):
+                key = content["Key"]
+                if key > last_key:
+                    return found, True
+
+                if key in wanted:
+                    found.add(key)
+
+                listed += 1
+
+            if len(found) == len(wanted):
+                return found, True
+
+            if listed > budget:
+                # Trop d'objets sans rapport entre les clés demandées : on s'arrête là
+                return found, False
+
+    except botocore.exceptions.ClientError:
+        # Listing refusé ou en échec : les clés non trouvées seront testées une à une
+        return found, False
+
+    except Exception as e:
+        raise StorageError("S3", e)
+
+    return found, True
+
+
+def exists_many(paths: List[str], max_workers: int = 32) -> List[bool]:
+    """Do the files or objects exist ?
+
+    Tests are made concurrently, in a pool of threads, so that storage requests' latencies overlap.
+
+    When a lot of S3 objects of the same bucket are tested, they are looked for in a listing of the bucket (one request
+    for 1000 objects) rather than tested one by one. Objects not found this way, if listing had to be stopped, are then
+    tested one by one.
+
+    Args:
+        paths (List[str]): paths of files/objects to test
+        max_workers (int, optional): maximum number of simultaneous tests. Defaults to 32.
+
+    Raises:
+        MissingEnvironmentError: Missing object storage informations
+        StorageError: Storage read issue
+        NotImplementedError: Storage type not handled
+
+    Returns:
+        List[bool]: files/objects existing status, in the same order as provided paths
+    """
+
+    results = [None] * len(paths)
+    s3_groups = {}
+
+    for i, path in enumerate(paths):
+        storage_type, unprefixed_path, tray_name, base_name = get_infos_from_path(path)
+        if storage_type == StorageType.S3:
+            s3_groups.setdefault(tray_name, []).append((i, base_name))
+
+    # Les objets S3 nombreux dans un même bucket sont cherchés par listing
+    for tray_name, objects in s3_groups.items():
+        if len(objects) < __S3_LISTING_MIN_KEYS:
+            continue
+
+        found, complete = __list_s3_keys(tray_name, [key for i, key in objects])
+        for i, key in objects:
+            if key in found:
+                results[i] = True
+            elif complete:
+                results[i] = False
+
+    # Les autres sont testés individuellement
+    remaining = [i for i, result in enumerate(results) if result is None]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for i, result in zip(remaining, executor.map(exists, [paths[i] for i in remaining])):
+            results[i] = result
+
+    return results
+
+
+def __remove_s3(path: str, tray_name: str, base_name: str) -> None:
+    """Remove the S3 object"""
+    s3_client, bucket_name = __get_s3_client(tray_name)
 
-            f.close()
+    try:
+        s3_client["client"].delete_object(Bucket=bucket_name, Key=base_name)
+    except Exception as e:
+        raise StorageError("S3", e)
 
-        except FileNotFoundError:
-            raise FileNotFoundError(f"{storage_type.value}{path}")
 
-        except Exception as e:
-            raise StorageError("FILE", e)
+def __remove_ceph(path: str, tray_name: str, base_name: str) -> None:
+    """Remove the CEPH object, if it exists"""
+    ioctx = __get_ceph_ioctx(tray_name)
 
-    elif storage_type == StorageType.HTTP or storage_type == StorageType.HTTPS:
-        if range is None:
-            try:
-                reponse = requests.get(f"{storage_type.value}{path}", stream=True)
-                data = reponse.content
-                if reponse.status_code == 404:
-                    raise FileNotFoundError(f"{storage_type.value}{path}")
-            except Exception as e:
-                raise StorageError(storage_type.name, e)
-        else:
-            raise NotImplementedError("Cannot get partial data for storage type HTTP(S)")
+    try:
+        ioctx.remove_object(base_name)
+    except rados.ObjectNotFound:
+        pass
+    except Exception as e:
+        raise StorageError("CEPH", e)
 
-    else:
-        raise NotImplementedError(f"Cannot get data for storage type {storage_type.name}")
 
-    return data
+def __remove_file(path: str, tray_name: str, base_name: str) -> None:
+    """Remove the file, if it exists"""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        raise StorageError("FILE", e)
 
 
-def get_data_binary(path: str, range: Tuple[int, int] = None) -> str:
-    """Load data into a binary string
+# Fonction de suppression selon le type de stockage
+__REMOVE_FUNCTIONS = {
+    StorageType.S3: __remove_s3,
+    StorageType.FILE: __remove_file,
+}
+if CEPH_RADOS_AVAILABLE:
+    __REMOVE_FUNCTIONS[StorageType.CEPH] = __remove_ceph
 
-    This function uses a LRU cache, with a TTL of 5 minutes
+
+def remove(path: str) -> None:
+    """Remove the file/object
 
     Args:
-        path (str): path to data
-        range (Tuple[int, int], optional): offset and size, to make a partial read. Defaults to None.
+        path (str): path of file/object to remove
 
     Raises:
         MissingEnvironmentError: Missing object storage informations
-        StorageError: Storage read issue
-        FileNotFoundError: File or object does not exist
+        StorageError: Storage removal issue
         NotImplementedError: Storage type not handled
-
-    Returns:
-        str: Data binary content
     """
-    return __get_cached_data_binary(path, __get_ttl_hash(), range)
+    storage_type, path, tray_name, base_name = get_infos_from_path(path)
 
+    try:
+        remove_function = __REMOVE_FUNCTIONS[storage_type]
+    except KeyError:
+        raise NotImplementedError(f"Cannot remove data for storage type {storage_type.name}")
 
-def put_data_str(data: str, path: str) -> None:
-    """Store string data into a file or an object
+    remove_function(path, tray_name, base_name)
 
-    UTF-8 encoding is used for bytes conversion
+
+def __check_not_same_file(from_path: str, to_path: str) -> None:
+    """Check that source and destination are not the same file, before opening the destination for writing
 
     Args:
-        data (str): data to write
-        path (str): destination path, where to write data
+        from_path (str): source file path
+        to_path (str): destination file path
 
     Raises:
-        MissingEnvironmentError: Missing object storage informations
-        StorageError: Storage write issue
-        NotImplementedError: Storage type not handled
+        SameFileError: source and destination are the same file, as shutil.copyfile does
     """
 
-    storage_type, path, tray_name, base_name = get_infos_from_path(path)
+    try:
+        same = os.path.samefile(from_path, to_path)
+    except OSError:
+        # Destination absente (ou source illisible, l'erreur sera levée à l'ouverture)
+        same = False
 
-    if storage_type == StorageType.S3:
-        s3_client, bucket_name = __get_s3_client(tray_name)
+    if same:
+        raise SameFileError(f"{from_path!r} and {to_path!r} are the same file")
 
-        try:
-            s3_client["client"].put_object(
-                Body=data.encode("utf-8"), Bucket=bucket_name, Key=base_name
-            )
-        except Exception as e:
-            raise StorageError("S3", e)
 
-    elif storage_type == StorageType.CEPH and CEPH_RADOS_AVAILABLE:
-        ioctx = __get_ceph_ioctx(tray_name)
+def __copy_file_in_kernel(from_path: str, to_path: str) -> None:
+    """Copy a file without passing data through user space
 
-        try:
-            ioctx.write_full(base_name, data.encode("utf-8"))
-        except Exception as e:
-            raise StorageError("CEPH", e)
+    copy_file_range lets copy-on-write file systems (XFS, Btrfs) share blocks instead of duplicating them. When it is
+    not available (platform, kernel or file systems), copy is made by shutil.copyfile, using sendfile when possible.
 
-    elif storage_type == StorageType.FILE:
+    Args:
+        from_path (str): source file path
+        to_path (str): destination file path
+
+    Raises:
+        SameFileError: source and destination are the same file
+    """
+
+    # Ouvrir la destination en écriture viderait la source
+    __check_not_same_file(from_path, to_path)
+
+    if hasattr(os, "copy_file_range"):
         try:
-            f = open(path, "w")
-            f.write(data)
-            f.close()
-        except Exception as e:
-            raise StorageError("FILE", e)
+            with open(from_path, "rb", buffering=0) as from_file, open(
+                to_path, "wb", buffering=0
+            ) as to_file:
+                while os.copy_file_range(from_file.fileno(), to_file.fileno(), 1024 * 1024 * 1024):
+                    pass
+            return
 
-    else:
-        raise NotImplementedError(f"Cannot write data for storage type {storage_type.name}")
+        except OSError as e:
+            # Appel non supporté : copie classique, qui réécrit le fichier depuis le début
+            if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP, errno.EINVAL):
+                raise
 
+    copyfile(from_path, to_path)
 
-def get_size(path: str) -> int:
-    """Get size of file or object
+
+def __copy_file_with_md5(from_path: str, to_path: str) -> str:
+    """Copy a file and process the MD5 sum of copied data, in one pass
 
     Args:
-        path (str): path of file/object whom size is asked
+        from_path (str): source file path
+        to_path (str): destination file path
 
     Raises:
-        MissingEnvironmentError: Missing object storage informations
-        StorageError: Storage read issue
-        NotImplementedError: Storage type not handled
+        SameFileError: source and destination are the same file
 
     Returns:
-        int: file/object size, in bytes
+        str: hexadecimal MD5 sum of copied data
     """
 
-    storage_type, path, tray_name, base_name = get_infos_from_path(path)
-
-    if storage_type == StorageType.S3:
-        s3_client, bucket_name = __get_s3_client(tray_name)
-
-        try:
-            size = s3_client["client"].head_object(Bucket=bucket_name, Key=base_name)[
-                "ContentLength"
-            ]
-            return int(size)
-        except Exception as e:
-            raise StorageError("S3", e)
-
-    elif storage_type == StorageType.CEPH and CEPH_RADOS_AVAILABLE:
-        ioctx = __get_ceph_ioctx(tray_name)
+    # Ouvrir la destination en écriture viderait la source
+    __check_not_same_file(from_path, to_path)
 
-        try:
-            size, mtime = ioctx.stat(base_name)
-            return size
-        except Exception as e:
-            raise StorageError("CEPH", e)
+    checker = __new_md5()
+    buffer = __get_block_buffer()
 
-    elif storage_type == StorageType.FILE:
-        try:
-            file_stats = os.stat(path)
-            return file_stats.st_size
-        except Exception as e:
-            raise StorageError("FILE", e)
+    with open(from_path, "rb", buffering=0) as from_file, open(to_path, "wb") as to_file:
+        while True:
+            size = from_file.readinto(buffer)
+            if not size:
+                break
+            to_file.write(buffer[:size])
+            checker.update(buffer[:size])
 
-    elif storage_type == StorageType.HTTP or storage_type == StorageType.HTTPS:
-        try:
-            # Le stream=True permet de ne télécharger que le header initialement
-            reponse = requests.get(storage_type.value + path, stream=True).headers["content-length"]
-            return reponse
-        except Exception as e:
-            raise StorageError(storage_type.name, e)
+    return checker.hexdigest()
 
-    else:
-        raise NotImplementedError(f"Cannot get size for storage type {storage_type.name}")
 
+def __read_ceph_chunks(ioctx: "rados.Ioctx", object_name: str, size: int = None) -> Iterator[bytes]:
+    """Read a CEPH object chunk by chunk, with several asynchronous readings in flight
 
-def exists(path: str) -> bool:
-    """Do the file or object exist ?
+    Up to __CEPH_READ_DEPTH readings are sent in advance, so that RADOS latencies overlap. Chunks are provided in
+    the object's order. An empty object provides one empty chunk.
 
     Args:
-        path (str): path of file/object to test
+        ioctx (rados.Ioctx): CEPH IO context of the object's pool
+        object_name (str): object to read
+        size (int, optional): object's size, if already known. Defaults to None : size is asked to CEPH.
 
     Raises:
-        MissingEnvironmentError: Missing object storage informations
-        StorageError: Storage read issue
-        NotImplementedError: Storage type not handled
+        rados.ObjectNotFound: Object does not exist
+        StorageError: Asynchronous reading issue
 
     Returns:
-        bool: file/object existing status
+        Iterator[bytes]: object's chunks
     """
 
-    storage_type, path, tray_name, base_name = get_infos_from_path(path)
+    if size is None:
+        size, mtime = ioctx.stat(object_name)
 
-    if storage_type == StorageType.S3:
-        s3_client, bucket_name = __get_s3_client(tray_name)
+    if size == 0:
+        yield b""
+        return
 
-        try:
-            s3_client["client"].head_object(Bucket=bucket_name, Key=base_name)
-            return True
-        except botocore.exceptions.ClientError as e:
-            if e.response["Error"]["Code"] == "404":
-                return False
-            else:
-                raise StorageError("S3", e)
+    offsets = iter(range(0, size, __CEPH_CHUNK_SIZE))
+    pending = deque()
 
-    elif storage_type == StorageType.CEPH and CEPH_RADOS_AVAILABLE:
-        ioctx = __get_ceph_ioctx(tray_name)
+    def submit(offset: int) -> None:
+        result = {}
 
-        try:
-            ioctx.stat(base_name)
-            return True
-        except rados.ObjectNotFound:
-            return False
-        except Exception as e:
-            raise StorageError("CEPH", e)
+        def on_complete(completion, data):
+            result["data"] = data
 
-    elif storage_type == StorageType.FILE:
-        return os.path.exists(path)
+        completion = ioctx.aio_read(object_name, __CEPH_CHUNK_SIZE, offset, on_complete)
+        pending.append((completion, result))
 
-    elif storage_type == StorageType.HTTP or storage_type == StorageType.HTTPS:
-        try:
-            response = requests.get(storage_type.value + path, stream=True)
-            if response.status_code == 200:
-                return True
-            else:
-                return False
-        except Exception as e:
-            raise StorageError(storage_type.name, e)
+    for offset in offsets:
+        submit(offset)
+        if len(pending) == __CEPH_READ_DEPTH:
+            break
 
-    else:
-        raise NotImplementedError(f"Cannot test existence for storage type {storage_type.name}")
+    while pending:
+        completion, result = pending.popleft()
+        completion.wait_for_complete_and_cb()
 
+        if completion.get_return_value() < 0:
+            raise StorageError(
+                "CEPH",
+                f"Cannot read CEPH object {object_name} : error {completion.get_return_value()}",
+            )
 
-def remove(path: str) -> None:
-    """Remove the file/object
+        # Une lecture terminée libère une place pour la suivante
+        offset = next(offsets, None)
+        if offset is not None:
+            submit(offset)
+
+        yield result["data"]
+
+
+def __read_file_chunks(file) -> Iterator[bytes]:
+    """Read an opened file chunk by chunk, with the CEPH chunk size
+
+    An empty file provides one empty chunk, so that the written object is created.
 
     Args:
-        path (str): path of file/object to remove
+        file: binary file object, opened for reading
+
+    Returns:
+        Iterator[bytes]: file's chunks
+    """
+
+    while True:
+        chunk = file.read(__CEPH_CHUNK_SIZE)
+        yield chunk
+        if len(chunk) < __CEPH_CHUNK_SIZE:
+            return
+
+
+def __write_ceph_chunks(
+    ioctx: "rados.Ioctx", object_name: str, chunks: Iterable[bytes], checker=None
+) -> int:
+    """Write chunks one after the other into a CEPH object, with several asynchronous writings in flight
+
+    Up to __CEPH_WRITE_DEPTH writings are waiting for acknowledgement at the same time, so that RADOS latencies
+    overlap. Chunks are written at successive offsets.
+
+    Args:
+        ioctx (rados.Ioctx): CEPH IO context of the object's pool
+        object_name (str): object to write
+        chunks (Iterable[bytes]): data to write, in order
+        checker (optional): hash object updated with each written chunk
 
     Raises:
-        MissingEnvironmentError: Missing object storage informations
-        StorageError: Storage removal issue
-        NotImplementedError: Storage type not handled
+        StorageError: Asynchronous writing issue
+
+    Returns:
+        int: written size
     """
-    storage_type, path, tray_name, base_name = get_infos_from_path(path)
 
-    if storage_type == StorageType.S3:
-        s3_client, bucket_name = __get_s3_client(tray_name)
+    pending = deque()
+    offset = 0
 
-        try:
-            s3_client["client"].delete_object(Bucket=bucket_name, Key=base_name)
-        except Exception as e:
-            raise StorageError("S3", e)
+    def wait(completion) -> None:
+        completion.wait_for_complete()
+        if completion.get_return_value() < 0:
+            raise StorageError(
+                "CEPH",
+                f"Cannot write CEPH object {object_name} : error {completion.get_return_value()}",
+            )
 
-    elif storage_type == StorageType.CEPH and CEPH_RADOS_AVAILABLE:
-        ioctx = __get_ceph_ioctx(tray_name)
+    for chunk in chunks:
+        if len(pending) == __CEPH_WRITE_DEPTH:
+            wait(pending.popleft()[0])
 
-        try:
-            ioctx.remove_object(base_name)
-        except rados.ObjectNotFound:
-            pass
-        except Exception as e:
-            raise StorageError("CEPH", e)
+        # Le chunk est conservé jusqu'à l'acquittement de l'écriture
+        pending.append((ioctx.aio_write(object_name, chunk, offset), chunk))
+        offset += len(chunk)
 
-    elif storage_type == StorageType.FILE:
-        try:
-            os.remove(path)
-        except FileNotFoundError:
-            pass
-        except Exception as e:
-            raise StorageError("FILE", e)
+        if checker is not None:
+            checker.update(chunk)
 
-    else:
-        raise NotImplementedError(f"Cannot remove data for storage type {storage_type.name}")
+    while pending:
+        wait(pending.popleft()[0])
+
+    return offset
 
 
 def copy(from_path: str, to_path: str, from_md5: str = None) -> None:
@@ -687,10 +1595,11 @@ def copy(from_path: str, to_path: str, from_md5: str = None) -> None:
             if to_tray != "":
                 os.makedirs(to_tray, exist_ok=True)
 
-            copyfile(from_path, to_path)
-
-            if from_md5 is not None:
-                to_md5 = hash_file(to_path)
+            if from_md5 is None:
+                __copy_file_in_kernel(from_path, to_path)
+            else:
+                # Copie et calcul de la somme de contrôle en une seule lecture
+                to_md5 = __copy_file_with_md5(from_path, to_path)
                 if to_md5 != from_md5:
                     raise StorageError(
                         "FILE",
@@ -707,7 +1616,9 @@ def copy(from_path: str, to_path: str, from_md5: str = None) -> None:
             if to_tray != "":
                 os.makedirs(to_tray, exist_ok=True)
 
-            s3_client["client"].download_file(from_bucket, from_base_name, to_path)
+            s3_client["client"].download_file(
+                from_bucket, from_base_name, to_path, Config=__S3_TRANSFER_CONFIG
+            )
 
             if from_md5 is not None:
                 to_md5 = hash_file(to_path)
@@ -726,19 +1637,47 @@ def copy(from_path: str, to_path: str, from_md5: str = None) -> None:
         s3_client, to_bucket = __get_s3_client(to_tray)
 
         try:
-            s3_client["client"].upload_file(from_path, to_bucket, to_base_name)
+            if (
+                from_md5 is not None
+                and os.path.getsize(from_path) < __S3_TRANSFER_CONFIG.multipart_threshold
+            ):
+                # Envoi en une requête : S3 contrôle lui-même la somme MD5 à la réception
+                # et refuse l'objet si elle diffère, sans requête HEAD supplémentaire
+                with open(from_path, "rb") as f:
+                    s3_client["client"].put_object(
+                        Body=f,
+                        Bucket=to_bucket,
+                        Key=to_base_name,
+                        ContentMD5=base64.b64encode(bytes.fromhex(from_md5)).decode(),
+                    )
 
-            if from_md5 is not None:
-                to_md5 = (
-                    s3_client["client"]
-                    .head_object(Bucket=to_bucket, Key=to_base_name)["ETag"]
-                    .strip('"')
+            else:
+                if from_md5 is not None:
+                    # Un envoi en plusieurs parties donne un ETag composite, calculé en même temps
+                    # que la somme MD5 du fichier
+                    file_md5, file_etag = hash_file_parts(from_path)
+                    if file_md5 != from_md5:
+                        raise StorageError(
+                            "FILE and S3",
+                            f"Invalid MD5 sum control for copy file {from_path} to S3 object {to_path} : {from_md5} != {file_md5}",
+                        )
+
+                s3_client["client"].upload_file(
+                    from_path, to_bucket, to_base_name, Config=__S3_TRANSFER_CONFIG
                 )
-                if to_md5 != from_md5:
-                    raise StorageError(
-                        "FILE and S3",
-                        f"Invalid MD5 sum control for copy file {from_path} to S3 object {to_path} : {from_md5} != {to_md5}",
+
+                if from_md5 is not None:
+                    to_etag = (
+                        s3_client["client"]
+                        .head_object(Bucket=to_bucket, Key=to_base_name)["ETag"]
+                        .strip('"')
                     )
+                    expected = file_etag if "-" in to_etag else file_md5
+                    if to_etag != expected:
+                        raise StorageError(
+                            "FILE and S3",
+                            f"Invalid ETag control for copy file {from_path} to S3 object {to_path} : {expected} != {to_etag}",
+                        )
         except Exception as e:
             raise StorageError(
                 "FILE and S3", f"Cannot copy file {from_path} to S3 object {to_path} : {e}"
@@ -751,12 +1690,21 @@ def copy(from_path: str, to_path: str, from_md5: str = None) -> None:
         try:
             if to_s3_client["host"] == from_s3_client["host"]:
                 to_s3_client["client"].copy(
-                    {"Bucket": from_bucket, "Key": from_base_name}, to_bucket, to_base_name
+                    {"Bucket": from_bucket, "Key": from_base_name},
+                    to_bucket,
+                    to_base_name,
+                    Config=__S3_TRANSFER_CONFIG,
                 )
             else:
-                with tempfile.NamedTemporaryFile("w+b") as f:
-                    from_s3_client["client"].download_fileobj(from_bucket, from_base_name, f)
-                    to_s3_client["client"].upload_file(f.name, to_bucket, to_base_name)
+                # Transit en mémoire, sur disque seulement au-delà d'une taille limite
+                with tempfile.SpooledTemporaryFile(max_size=__COPY_SPOOL_MAX_SIZE) as f:
+                    from_s3_client["client"].download_fileobj(
+                        from_bucket, from_base_name, f, Config=__S3_TRANSFER_CONFIG
+                    )
+                    f.seek(0)
+                    to_s3_client["client"].upload_fileobj(
+                        f, to_bucket, to_base_name, Config=__S3_TRANSFER_CONFIG
+                    )
 
             if from_md5 is not None:
                 to_md5 = (
@@ -777,29 +1725,17 @@ def copy(from_path: str, to_path: str, from_md5: str = None) -> None:
         ioctx = __get_ceph_ioctx(from_tray)
 
         if from_md5 is not None:
-            checker = hashlib.md5()
+            checker = __new_md5()
 
         try:
             if to_tray != "":
                 os.makedirs(to_tray, exist_ok=True)
-            f = open(to_path, "wb")
-
-            offset = 0
-            size = 0
-
-            while True:
-                chunk = ioctx.read(from_base_name, 65536, offset)
-                size = len(chunk)
-                offset += size
-                f.write(chunk)
-
-                if from_md5 is not None:
-                    checker.update(chunk)
-
-                if size < 65536:
-                    break
+            with open(to_path, "wb") as f:
+                for chunk in __read_ceph_chunks(ioctx, from_base_name):
+                    f.write(chunk)
 
-            f.close()
+                    if from_md5 is not None:
+                        checker.update(chunk)
 
             if from_md5 is not None and from_md5 != checker.hexdigest():
                 raise StorageError(
@@ -816,27 +1752,13 @@ def copy(from_path: str, to_path: str, from_md5: str = None) -> None:
         ioctx = __get_ceph_ioctx(to_tray)
 
         if from_md5 is not None:
-            checker = hashlib.md5()
+            checker = __new_md5()
+        else:
+            checker = None
 
         try:
-            f = open(from_path, "rb")
-
-            offset = 0
-            size = 0
-
-            while True:
-                chunk = f.read(65536)
-                size = len(chunk)
-                ioctx.write(to_base_name, chunk, offset)
-                offset += size
-
-                if from_md5 is not None:
-                    checker.update(chunk)
-
-                if size < 65536:
-                    break
-
-            f.close()
+            with open(from_path, "rb") as f:
+                __write_ceph_chunks(ioctx, to_base_name, __read_file_chunks(f), checker)
 
             if from_md5 is not None and from_md5 != checker.hexdigest():
                 raise StorageError(
@@ -854,23 +1776,14 @@ def copy(from_path: str, to_path: str, from_md5: str = None) -> None:
         to_ioctx = __get_ceph_ioctx(to_tray)
 
         if from_md5 is not None:
-            checker = hashlib.md5()
+            checker = __new_md5()
+        else:
+            checker = None
 
         try:
-            offset = 0
-            size = 0
-
-            while True:
-                chunk = from_ioctx.read(from_base_name, 65536, offset)
-                size = len(chunk)
-                to_ioctx.write(to_base_name, chunk, offset)
-                offset += size
-
-                if from_md5 is not None:
-                    checker.update(chunk)
-
-                if size < 65536:
-                    break
+            __write_ceph_chunks(
+                to_ioctx, to_base_name, __read_ceph_chunks(from_ioctx, from_base_name), checker
+            )
 
             if from_md5 is not None and from_md5 != checker.hexdigest():
                 raise StorageError(
@@ -887,29 +1800,21 @@ def copy(from_path: str, to_path: str, from_md5: str = None) -> None:
         s3_client, to_bucket = __get_s3_client(to_tray)
 
         if from_md5 is not None:
-            checker = hashlib.md5()
+            checker = __new_md5()
 
         try:
-            offset = 0
-            size = 0
-
-            with tempfile.NamedTemporaryFile("w+b", delete=False) as f:
-                name_tmp = f.name
-                while True:
-                    chunk = from_ioctx.read(from_base_name, 65536, offset)
-                    size = len(chunk)
-                    offset += size
+            # Transit en mémoire, sur disque seulement au-delà d'une taille limite
+            with tempfile.SpooledTemporaryFile(max_size=__COPY_SPOOL_MAX_SIZE) as f:
+                for chunk in __read_ceph_chunks(from_ioctx, from_base_name):
                     f.write(chunk)
 
                     if from_md5 is not None:
                         checker.update(chunk)
 
-                    if size < 65536:
-                        break
-
-            s3_client["client"].upload_file(name_tmp, to_bucket, to_base_name)
-
-            os.remove(name_tmp)
+                f.seek(0)
+                s3_client["client"].upload_fileobj(
+                    f, to_bucket, to_base_name, Config=__S3_TRANSFER_CONFIG
+                )
 
             if from_md5 is not None and from_md5 != checker.hexdigest():
                 raise StorageError(
@@ -947,12 +1852,11 @@ def copy(from_path: str, to_path: str, from_md5: str = None) -> None:
 
         try:
             response = requests.get(from_type.value + from_path, stream=True)
-            offset = 0
-            for chunk in response.iter_content(chunk_size=65536):
-                if chunk:
-                    size = len(chunk)
-                    to_ioctx.write(to_base_name, chunk, offset)
-                    offset += size
+            __write_ceph_chunks(
+                to_ioctx,
+                to_base_name,
+                (chunk for chunk in response.iter_content(chunk_size=__CEPH_CHUNK_SIZE) if chunk),
+            )
 
         except Exception as e:
             raise StorageError(
@@ -967,15 +1871,17 @@ def copy(from_path: str, to_path: str, from_md5: str = None) -> None:
 
         try:
             response = requests.get(from_type.value + from_path, stream=True)
-            with tempfile.NamedTemporaryFile("w+b", delete=False) as f:
-                name_fich = f.name
+
+            # Transit en mémoire, sur disque seulement au-delà d'une taille limite
+            with tempfile.SpooledTemporaryFile(max_size=__COPY_SPOOL_MAX_SIZE) as f:
                 for chunk in response.iter_content(chunk_size=65536):
                     if chunk:
                         f.write(chunk)
+                f.seek(0)
 
-            to_s3_client["client"].upload_file(name_fich, to_tray, to_base_name)
-
-            os.remove(name_fich)
+                to_s3_client["client"].upload_fileobj(
+                    f, to_bucket, to_base_name, Config=__S3_TRANSFER_CONFIG
+                )
 
         except Exception as e:
             raise StorageError(
@@ -989,6 +1895,61 @@ def copy(from_path: str, to_path: str, from_md5: str = None) -> None:
         )
 
 
+def copy_many(copies: List[Tuple[str, ...]], max_workers: int = 32) -> None:
+    """Copy several files or objects, concurrently
+
+    Each element is the arguments list of a `copy` call : source path, destination path and optionally the MD5 sum.
+    Copies are made in a pool of threads, so that storage requests' latencies overlap.
+
+    Args:
+        copies (List[Tuple[str, ...]]): copies to do, as (from_path, to_path) or (from_path, to_path, from_md5)
+        max_workers (int, optional): maximum number of simultaneous copies. Defaults to 32.
+
+    Examples:
+
+        Copy two S3 objects to local files
+
+            from rok4.storage import copy_many
+
+            try:
+                copy_many([
+                    ("s3://bucket/image1.tif", "file:///data/image1.tif"),
+                    ("s3://bucket/image2.tif", "file:///data/image2.tif", "8d777f385d3dfec8815d20f7496026dc"),
+                ])
+            except Exception as e:
+                print(f"Cannot copy data : {e}")
+
+    A failing copy does not stop the other ones. If only one copy fails, its error is raised as is. If several
+    copies fail, a single StorageError lists all of them.
+
+    Raises:
+        StorageError: Copy issue, or several copies issues
+        MissingEnvironmentError: Missing object storage informations
+        NotImplementedError: Storage type not handled
+    """
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(copy, *c) for c in copies]
+
+    # Toutes les copies sont terminées : on rassemble les erreurs rencontrées
+    errors = []
+    for c, future in zip(copies, futures):
+        error = future.exception()
+        if error is not None:
+            errors.append((c, error))
+
+    if len(errors) == 1:
+        raise errors[0][1]
+
+    if len(errors) > 1:
+        types = sorted({get_infos_from_path(p)[0].name for c, e in errors for p in c[:2]})
+        raise StorageError(
+            " and ".join(types),
+            f"{len(errors)} copies failed : "
+            + " ; ".join(f"{c[0]} -> {c[1]} ({e})" for c, e in errors),
+        ) from errors[0][1]
+
+
 def link(target_path: str, link_path: str, hard: bool = False) -> None:
     """Create a symbolic link
 
@@ -1067,6 +2028,8 @@ def get_osgeo_path(path: str) -> str:
 
     For a S3 input path, endpoint, access and secret keys are set and path is built with "/vsis3" root.
 
+    For a HTTP(S) input path, path is built with "/vsicurl" root, so that only needed ranges are read.
+
     For a FILE input path, only storage prefix is removed
 
     Args:
@@ -1093,6 +2056,9 @@ def get_osgeo_path(path: str) -> str:
 
         return f"/vsis3/{bucket_name}/{base_name}"
 
+    elif storage_type == StorageType.HTTP or storage_type == StorageType.HTTPS:
+        return f"/vsicurl/{storage_type.value}{unprefixed_path}"
+
     elif storage_type == StorageType.FILE:
         return unprefixed_path
 
@@ -5,6 +5,10 @@ The module contains the following classes:
 - `TileMatrixSet` - Multi level grid
 - `TileMatrix` - A tile matrix set level
 
+The module contains the following functions:
+
+- `get_tile_matrix_set` - Load a tile matrix set only once per process
+
 Loading a tile matrix set requires environment variables :
 
 - ROK4_TMS_DIRECTORY
@@ -13,18 +17,22 @@ Loading a tile matrix set requires environment variables :
 # -- IMPORTS --
 
 # standard library
-import json
 import os
 from json.decoder import JSONDecodeError
 from typing import Dict, List, Tuple
 
+# 3rd party
+import numpy
+
 # package
 from rok4.exceptions import FormatError, MissingAttributeError, MissingEnvironmentError
-from rok4.storage import get_data_str
-from rok4.utils import srs_to_spatialreference
+from rok4.storage import get_data_binary
+from rok4.utils import json_loads, srs_to_spatialreference
 
 # -- GLOBALS --
 
+__TMS_BOOK = {}
+
 
 class TileMatrix:
     """A tile matrix is a tile matrix set's level.
@@ -36,6 +44,7 @@ class TileMatrix:
         origin (Tuple[float, float]): X,Y coordinates of the upper left corner for the level, the grid's origin.
         tile_size (Tuple[int, int]): Pixel width and height of a tile.
         matrix_size (Tuple[int, int]): Number of tile in the level, widthwise and heightwise.
+        tile_span (Tuple[float, float]): Ground width and height of a tile, using unity of the TMS's coordinate system.
     """
 
     def __init__(self, level: Dict, tms: "TileMatrixSet") -> None:
@@ -69,6 +78,10 @@ class TileMatrix:
                 level["matrixWidth"],
                 level["matrixHeight"],
             )
+            self.tile_span = (
+                self.resolution * self.tile_size[0],
+                self.resolution * self.tile_size[1],
+            )
             self.__latlon = (
                 self.tms.sr.EPSGTreatsAsLatLong() or self.tms.sr.EPSGTreatsAsNorthingEasting()
             )
@@ -84,7 +97,7 @@ class TileMatrix:
         Returns:
             int: tile's column
         """
-        return int((x - self.origin[0]) / (self.resolution * self.tile_size[0]))
+        return int((x - self.origin[0]) / self.tile_span[0])
 
     def y_to_row(self, y: float) -> int:
         """Convert north-south coordinate to tile's row
@@ -95,7 +108,7 @@ class TileMatrix:
         Returns:
             int: tile's row
         """
-        return int((self.origin[1] - y) / (self.resolution * self.tile_size[1]))
+        return int((self.origin[1] - y) / self.tile_span[1])
 
     def tile_to_bbox(self, tile_col: int, tile_row: int) -> Tuple[float, float, float, float]:
         """Get tile terrain extent (xmin, ymin, xmax, ymax), in TMS coordinates system
@@ -124,6 +137,39 @@ class TileMatrix:
                 self.origin[1] - self.resolution * tile_row * self.tile_size[1],
             )
 
+    def tiles_to_bboxes(self, tile_cols: numpy.ndarray, tile_rows: numpy.ndarray) -> numpy.ndarray:
+        """Get several tiles terrain extents (xmin, ymin, xmax, ymax), in TMS coordinates system
+
+        Vectorized version of `tile_to_bbox`, with the same results. TMS spatial reference is Lat / Lon case is handled.
+
+        Args:
+            tile_cols (numpy.ndarray): columns indices
+            tile_rows (numpy.ndarray): rows indices, same length as columns
+
+        Examples:
+
+            import numpy
+
+            bboxes = tm.tiles_to_bboxes(numpy.array([67728, 67729]), numpy.array([45975, 45975]))
+
+        Returns:
+            numpy.ndarray: terrain extents, one row (xmin, ymin, xmax, ymax) per tile
+        """
+
+        tile_cols = numpy.asarray(tile_cols, dtype=numpy.float64)
+        tile_rows = numpy.asarray(tile_rows, dtype=numpy.float64)
+
+        # Mêmes opérations, dans le même ordre, que pour une seule tuile
+        west = self.origin[0] + self.resolution * tile_cols * self.tile_size[0]
+        east = self.origin[0] + self.resolution * (tile_cols + 1) * self.tile_size[0]
+        north = self.origin[1] - self.resolution * tile_rows * self.tile_size[1]
+        south = self.origin[1] - self.resolution * (tile_rows + 1) * self.tile_size[1]
+
+        if self.__latlon:
+            return numpy.stack((south, west, north, east), axis=-1)
+        else:
+            return numpy.stack((west, south, east, north), axis=-1)
+
     def bbox_to_tiles(self, bbox: Tuple[float, float, float, float]) -> Tuple[int, int, int, int]:
         """Get extrems tile columns and rows corresponding to provided bounding box
 
@@ -222,7 +268,7 @@ class TileMatrixSet:
             raise MissingEnvironmentError(e)
 
         try:
-            data = json.loads(get_data_str(self.path))
+            data = json_loads(get_data_binary(self.path))
 
             self.id = data["id"]
             self.srs = data["crs"]
@@ -266,3 +312,38 @@ class TileMatrixSet:
     @property
     def sorted_levels(self) -> List[TileMatrix]:
         return sorted(self.levels.values(), key=lambda level: level.resolution)
+
+
+def get_tile_matrix_set(name: str) -> TileMatrixSet:
+    """Get a tile matrix set from its name
+
+    Using a cache, to read and parse a tile matrix set's descriptor only once. Tile matrix sets are not modified
+    after their loading, so the same instance can be shared.
+
+    Args:
+        name (str): TMS's name
+
+    Raises:
+        MissingEnvironmentError: Missing object storage informations or TMS root directory
+        Exception: No level in the TMS, CRS not recognized by OSR
+        StorageError: Storage read issue
+        FileNotFoundError: TMS file or object does not exist
+        FormatError: Provided path is not a well formed JSON
+        MissingAttributeError: Attribute is missing in the content
+
+    Returns:
+        TileMatrixSet: the shared tile matrix set instance
+    """
+
+    global __TMS_BOOK
+
+    try:
+        # Le répertoire fait partie de la clé : il peut changer au cours de l'exécution
+        key = (os.environ["ROK4_TMS_DIRECTORY"], name)
+    except KeyError as e:
+        raise MissingEnvironmentError(e)
+
+    if key not in __TMS_BOOK:
+        __TMS_BOOK[key] = TileMatrixSet(name)
+
+    return __TMS_BOOK[key]
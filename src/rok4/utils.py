@@ -4,13 +4,26 @@
 # -- IMPORTS --
 
 # standard library
+import json
 import os
 import re
-from typing import Tuple
+from functools import lru_cache
+from typing import Any, Tuple, Union
 
 # 3rd party
+import numpy
 from osgeo import gdal, ogr, osr
 
+# conditional import
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE: bool = True
+except ImportError:
+    ORJSON_AVAILABLE: bool = False
+    orjson = None
+
 # package
 from rok4.enums import ColorFormat
 
@@ -22,6 +35,25 @@ gdal.UseExceptions()
 __SR_BOOK = {}
 
 
+def json_loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON data, with orjson if installed (faster), with the standard json module otherwise
+
+    Args:
+        data (Union[bytes, str]): JSON content
+
+    Raises:
+        JSONDecodeError: Invalid JSON content (orjson's errors inherit from it)
+
+    Returns:
+        Any: parsed content
+    """
+
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    else:
+        return json.loads(data)
+
+
 def srs_to_spatialreference(srs: str) -> "osgeo.osr.SpatialReference":
     """Convert coordinates system as string to OSR spatial reference
 
@@ -116,6 +148,28 @@ def reproject_bbox(
         Tuple[float, float, float, float]: bounding box (xmin, ymin, xmax, ymax) with destination coordinates system
     """
 
+    return __reproject_bbox(tuple(bbox), srs_src, srs_dst, densification)
+
+
+@lru_cache(maxsize=128)
+def __reproject_bbox(
+    bbox: Tuple[float, float, float, float], srs_src: str, srs_dst: str, densification: int
+) -> Tuple[float, float, float, float]:
+    """Reproject a bounding box, with a cache on the parameters
+
+    The same bounding boxes are reprojected again and again (layers' extents when loading many
+    layers, for example), so the transformations' results are kept.
+
+    Args:
+        bbox (Tuple[float, float, float, float]): bounding box (xmin, ymin, xmax, ymax) with source coordinates system
+        srs_src (str): source coordinates system
+        srs_dst (str): destination coordinates system
+        densification (int): Number of point to add for each side of bounding box
+
+    Returns:
+        Tuple[float, float, float, float]: bounding box (xmin, ymin, xmax, ymax) with destination coordinates system
+    """
+
     sr_src = srs_to_spatialreference(srs_src)
     sr_src_inv = sr_src.EPSGTreatsAsLatLong() or sr_src.EPSGTreatsAsNorthingEasting()
 
@@ -196,25 +250,26 @@ def compute_bbox(source_dataset: gdal.Dataset) -> Tuple:
             "No transform vector found in the dataset created from "
             + f"the following file : {source_dataset.GetFileList()[0]}"
         )
-    width = source_dataset.RasterXSize
-    height = source_dataset.RasterYSize
-    x_range = (
-        transform_vector[0],
-        transform_vector[0] + width * transform_vector[1] + height * transform_vector[2],
+    # Coins (0, 0) et (largeur, hauteur) de l'image, passés en coordonnées terrain en un seul calcul
+    corners = numpy.array(
+        [[0, 0], [source_dataset.RasterXSize, source_dataset.RasterYSize]], dtype=float
     )
-    y_range = (
-        transform_vector[3],
-        transform_vector[3] + width * transform_vector[4] + height * transform_vector[5],
+    affine = numpy.array(
+        [[transform_vector[1], transform_vector[4]], [transform_vector[2], transform_vector[5]]]
     )
+    terrain_corners = corners @ affine + (transform_vector[0], transform_vector[3])
+    x_min, y_min = terrain_corners.min(axis=0).tolist()
+    x_max, y_max = terrain_corners.max(axis=0).tolist()
+
     spatial_ref = source_dataset.GetSpatialRef()
     if spatial_ref is not None and spatial_ref.GetDataAxisToSRSAxisMapping() == [2, 1]:
         # Coordonnées terrain de type (latitude, longitude)
         # => on permute les coordonnées terrain par rapport à l'image
-        bbox = (min(y_range), min(x_range), max(y_range), max(x_range))
+        bbox = (y_min, x_min, y_max, x_max)
     else:
         # Coordonnées terrain de type (longitude, latitude) ou pas de SRS
         # => les coordonnées terrain sont dans le même ordre que celle de l'image
-        bbox = (min(x_range), min(y_range), max(x_range), max(y_range))
+        bbox = (x_min, y_min, x_max, y_max)
     return bbox
 
 
@@ -8,20 +8,83 @@ The module contains the following class :
 # -- IMPORTS --
 
 # standard library
+import math
 import os
 import tempfile
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple
 
 # 3rd party
-from osgeo import ogr
+from osgeo import gdal, ogr
 
 # package
-from rok4.storage import copy, get_osgeo_path
+from rok4.storage import copy, get_data_chunks, get_osgeo_path
 
 # -- GLOBALS --
 
 # Enable GDAL/OGR exceptions
 ogr.UseExceptions()
 
+_SHAPEFILE_EXTENSIONS = (".shp", ".shx", ".cpg", ".dbf", ".prj")
+
+
+def _read_uncached(path: str) -> bytes:
+    """Read a whole file/object, without the reading cache
+
+    Vector files can be big and are read only once : keeping them in the reading cache is useless.
+
+    Args:
+        path (str): path to the file/object
+
+    Raises:
+        MissingEnvironmentError: Missing object storage informations
+        StorageError: Storage read issue
+        FileNotFoundError: File or object does not exist
+
+    Returns:
+        bytes: file's content
+    """
+
+    _, chunks = get_data_chunks(path)
+    return b"".join(chunks)
+
+
+def _open_in_memory(path: str, extensions: Tuple[str, ...]) -> "ogr.DataSource":
+    """Open a vector data source with OGR from memory files (GDAL VSI)
+
+    Files composing the data source are read in parallel, without the reading cache, and removed from memory once
+    the data source is opened.
+
+    Args:
+        path (str): path to the main file/object, with the first extension
+        extensions (Tuple[str, ...]): extensions of the files composing the data source, main file's first
+
+    Raises:
+        MissingEnvironmentError: Missing object storage informations
+        StorageError: Storage read issue
+
+    Returns:
+        ogr.DataSource: opened data source, None if OGR cannot read it
+    """
+
+    stem = path[: -len(extensions[0])]
+    mem_path = f"/vsimem/{uuid.uuid4().hex}/{stem.split('/')[-1]}"
+    mem_files = []
+
+    try:
+        with ThreadPoolExecutor(len(extensions)) as executor:
+            contents = executor.map(_read_uncached, [stem + ext for ext in extensions])
+            for ext, content in zip(extensions, contents):
+                gdal.FileFromMemBuffer(mem_path + ext, content)
+                mem_files.append(mem_path + ext)
+
+        return ogr.Open(mem_path + extensions[0], 0)
+
+    finally:
+        for mem_file in mem_files:
+            gdal.Unlink(mem_file)
+
 
 class Vector:
     """A data vector
@@ -43,6 +106,7 @@ class Vector:
                 -column_x (str) ("x" if not provided) : field of the x coordinate
                 -column_y (str) ("y" if not provided) : field of the y coordinate
                 -column_wkt (str) (None if not provided) : field of the WKT of the geometry if WKT use to define coordinate
+                -autodetect_type (bool) (False if not provided) : infer the attributes types (Integer, Real...) instead of String
 
         Examples:
 
@@ -74,32 +138,13 @@ class Vector:
 
         if path_split[0] == "ceph:" or path.endswith(".csv"):
             if path.endswith(".shp"):
-                with tempfile.TemporaryDirectory() as tmp:
-                    tmp_path = tmp + "/" + path_split[-1][:-4]
-
-                    copy(path, "file://" + tmp_path + ".shp")
-                    copy(path[:-4] + ".shx", "file://" + tmp_path + ".shx")
-                    copy(path[:-4] + ".cpg", "file://" + tmp_path + ".cpg")
-                    copy(path[:-4] + ".dbf", "file://" + tmp_path + ".dbf")
-                    copy(path[:-4] + ".prj", "file://" + tmp_path + ".prj")
-
-                    dataSource = ogr.Open(tmp_path + ".shp", 0)
+                dataSource = _open_in_memory(path, _SHAPEFILE_EXTENSIONS)
 
             elif path.endswith(".gpkg"):
-                with tempfile.TemporaryDirectory() as tmp:
-                    tmp_path = tmp + "/" + path_split[-1][:-5]
-
-                    copy(path, "file://" + tmp_path + ".gpkg")
-
-                    dataSource = ogr.Open(tmp_path + ".gpkg", 0)
+                dataSource = _open_in_memory(path, (".gpkg",))
 
             elif path.endswith(".geojson"):
-                with tempfile.TemporaryDirectory() as tmp:
-                    tmp_path = tmp + "/" + path_split[-1][:-8]
-
-                    copy(path, "file://" + tmp_path + ".geojson")
-
-                    dataSource = ogr.Open(tmp_path + ".geojson", 0)
+                dataSource = _open_in_memory(path, (".geojson",))
 
             elif path.endswith(".csv"):
                 # Récupération des informations optionnelles
@@ -128,6 +173,11 @@ class Vector:
                 else:
                     column_wkt = None
 
+                if "autodetect_type" in csv and csv["autodetect_type"]:
+                    autodetect_type = "YES"
+                else:
+                    autodetect_type = "NO"
+
                 with tempfile.TemporaryDirectory() as tmp:
                     tmp_path = tmp + "/" + path_split[-1][:-4]
                     name_fich = path_split[-1][:-4]
@@ -140,6 +190,13 @@ class Vector:
                         vrt_file = "<OGRVRTDataSource>\n"
                         vrt_file += '<OGRVRTLayer name="' + name_fich + '">\n'
                         vrt_file += "<SrcDataSource>" + tmp_path + ".csv</SrcDataSource>\n"
+                        # Le séparateur est détecté par le pilote CSV d'OGR, qui peut aussi déduire
+                        # le type des colonnes à la lecture
+                        vrt_file += (
+                            '<OpenOptions><OOI key="AUTODETECT_TYPE">'
+                            + autodetect_type
+                            + "</OOI></OpenOptions>\n"
+                        )
                         vrt_file += "<SrcLayer>" + name_fich + "</SrcLayer>\n"
                         vrt_file += "<LayerSRS>" + srs + "</LayerSRS>\n"
                         if column_wkt is None:
@@ -159,9 +216,8 @@ class Vector:
                         tmp2.write(vrt_file)
                     dataSourceVRT = ogr.Open(tmp2.name, 0)
                     os.remove(tmp2.name)
-                    dataSource = ogr.GetDriverByName("ESRI Shapefile").CopyDataSource(
-                        dataSourceVRT, tmp_path + "shp"
-                    )
+                    # Le CSV est interprété par OGR (en C) et chargé en mémoire, sans écriture sur disque
+                    dataSource = ogr.GetDriverByName("Memory").CopyDataSource(dataSourceVRT, "")
 
             else:
                 raise Exception("This format of file cannot be loaded")
@@ -169,12 +225,14 @@ class Vector:
         else:
             dataSource = ogr.Open(get_osgeo_path(path), 0)
 
-        multipolygon = ogr.Geometry(ogr.wkbGeometryCollection)
         try:
             layer = dataSource.GetLayer()
         except AttributeError:
             raise Exception(f"The content of {self.path} cannot be read")
 
+        # Emprise globale, fusion des emprises des couches
+        xmin, xmax, ymin, ymax = math.inf, -math.inf, math.inf, -math.inf
+
         layers = []
         for i in range(dataSource.GetLayerCount()):
             layer = dataSource.GetLayer(i)
@@ -183,18 +241,30 @@ class Vector:
             layerDefinition = layer.GetLayerDefn()
             attributes = []
             for j in range(layerDefinition.GetFieldCount()):
-                fieldName = layerDefinition.GetFieldDefn(j).GetName()
-                fieldTypeCode = layerDefinition.GetFieldDefn(j).GetType()
-                fieldType = layerDefinition.GetFieldDefn(j).GetFieldTypeName(fieldTypeCode)
-                attributes += [(fieldName, fieldType)]
-            for feature in layer:
-                geom = feature.GetGeometryRef()
-                if geom is not None:
-                    multipolygon.AddGeometry(geom)
-            layers += [(name, count, attributes)]
+                fieldDefinition = layerDefinition.GetFieldDefn(j)
+                fieldType = fieldDefinition.GetFieldTypeName(fieldDefinition.GetType())
+                attributes.append((fieldDefinition.GetName(), fieldType))
+            if count != 0:
+                # Emprise fournie par le pilote (en-tête du shapefile, métadonnées du geopackage...),
+                # sans parcourir les géométries en Python
+                try:
+                    extent = layer.GetExtent()
+                    xmin = min(xmin, extent[0])
+                    xmax = max(xmax, extent[1])
+                    ymin = min(ymin, extent[2])
+                    ymax = max(ymax, extent[3])
+                except RuntimeError:
+                    # Couche sans géométrie
+                    pass
+            layers.append((name, count, attributes))
 
         self.layers = layers
-        self.bbox = multipolygon.GetEnvelope()
+
+        if xmin > xmax:
+            # Aucune géométrie : même emprise que celle d'une collection vide
+            self.bbox = (0.0, 0.0, 0.0, 0.0)
+        else:
+            self.bbox = (xmin, xmax, ymin, ymax)
 
         return self
 
@@ -2,6 +2,8 @@ import os
 from unittest import mock
 from unittest.mock import *
 
+import pytest
+
 from rok4.enums import PyramidType
 from rok4.exceptions import *
 from rok4.layer import Layer
@@ -9,12 +11,12 @@ from rok4.layer import Layer
 
 @mock.patch.dict(os.environ, {}, clear=True)
 @mock.patch(
-    "rok4.layer.get_data_str",
-    return_value='{"pyramids" : [{"bottom_level" : "10","top_level" : "10","path" : "s3://pyramids/SCAN1000.json"}],"title" : "SCAN1000","bbox":{"east": 11.250000000000997,"west": -5.624999999999043,"north": 52.48278022207774,"south": 40.9798980696195},"styles" : ["normal","hypso"],"abstract" : "Diffusion de la donnée BDORTHO","resampling" : "linear","keywords" : ["PM","TIFF_JPG_UINT8"]}',
+    "rok4.layer.get_data_binary",
+    return_value='{"pyramids" : [{"bottom_level" : "10","top_level" : "10","path" : "s3://pyramids/SCAN1000.json"}],"title" : "SCAN1000","bbox":{"east": 11.250000000000997,"west": -5.624999999999043,"north": 52.48278022207774,"south": 40.9798980696195},"styles" : ["normal","hypso"],"abstract" : "Diffusion de la donnée BDORTHO","resampling" : "linear","keywords" : ["PM","TIFF_JPG_UINT8"]}'.encode(),
 )
 @mock.patch("rok4.layer.Pyramid.from_descriptor")
 @mock.patch("rok4.layer.put_data_str", return_value=None)
-def test_descriptor_ok(mocked_put_data_str, mocked_pyramid_class, mocked_get_data_str):
+def test_descriptor_ok(mocked_put_data_str, mocked_pyramid_class, mocked_get_data_binary):
     tms_instance = MagicMock()
     tms_instance.srs = "EPSG:3857"
 
@@ -38,7 +40,7 @@ def test_descriptor_ok(mocked_put_data_str, mocked_pyramid_class, mocked_get_dat
     try:
         layer = Layer.from_descriptor("s3://layers/SCAN1000.json")
         assert layer.type == PyramidType.RASTER
-        mocked_get_data_str.assert_called_once_with("s3://layers/SCAN1000.json")
+        mocked_get_data_binary.assert_called_once_with("s3://layers/SCAN1000.json")
 
         layer.write_descriptor("s3://layers_backup/")
         mocked_put_data_str.assert_called_once_with(
@@ -141,3 +143,9 @@ def test_parameters_raster_ok(
 
     except Exception as exc:
         assert False, f"Layer creation from parameters raises an exception: {exc}"
+
+
+def test_parameters_wrong_name():
+    with pytest.raises(Exception) as exc:
+        Layer.from_parameters([{"path": "file:///home/ign/pyramids/RGEALTI.json"}], "layer name")
+    assert str(exc.value).startswith("Layer's name have to contain only letters")
@@ -6,21 +6,30 @@ import pytest
 
 from rok4.enums import SlabType, StorageType
 from rok4.exceptions import FormatError, MissingAttributeError, StorageError
-from rok4.pyramid import Pyramid, b36_path_decode, b36_path_encode
+from rok4.pyramid import (
+    Pyramid,
+    b36_number_encode,
+    b36_numbers_encode,
+    b36_path_decode,
+    b36_path_encode,
+    morton_decode,
+    morton_encode,
+)
 from rok4.utils import srs_to_spatialreference
 
 
-@mock.patch("rok4.pyramid.get_data_str", side_effect=StorageError("FILE", "Not found"))
-def test_wrong_file(mocked_get_data_str):
+@mock.patch("rok4.pyramid.get_data_binary", side_effect=StorageError("FILE", "Not found"))
+def test_wrong_file(mocked_get_data_binary):
     with pytest.raises(StorageError):
         Pyramid.from_descriptor("file:///pyramid.json")
 
 
+@mock.patch("rok4.utils.ORJSON_AVAILABLE", False)
 @mock.patch(
-    "rok4.pyramid.get_data_str",
-    return_value='{"format": "TIFF_PBF_MVT","levels":[{"id": "100","tables":',
+    "rok4.pyramid.get_data_binary",
+    return_value=b'{"format": "TIFF_PBF_MVT","levels":[{"id": "100","tables":',
 )
-def test_bad_json(mocked_get_data_str):
+def test_bad_json(mocked_get_data_binary):
     with pytest.raises(FormatError) as exc:
         Pyramid.from_descriptor("file:///pyramid.json")
 
@@ -28,54 +37,54 @@ def test_bad_json(mocked_get_data_str):
         str(exc.value)
         == "Expected format JSON to read 'file:///pyramid.json' : Expecting value: line 1 column 59 (char 58)"
     )
-    mocked_get_data_str.assert_called_once_with("file:///pyramid.json")
+    mocked_get_data_binary.assert_called_once_with("file:///pyramid.json")
 
 
-@mock.patch("rok4.pyramid.get_data_str", return_value='{"format": "TIFF_PBF_MVT","levels":[]}')
-def test_missing_tms(mocked_get_data_str):
+@mock.patch("rok4.pyramid.get_data_binary", return_value=b'{"format": "TIFF_PBF_MVT","levels":[]}')
+def test_missing_tms(mocked_get_data_binary):
     with pytest.raises(MissingAttributeError) as exc:
         Pyramid.from_descriptor("file:///pyramid.json")
 
     assert str(exc.value) == "Missing attribute 'tile_matrix_set' in 'file:///pyramid.json'"
-    mocked_get_data_str.assert_called_once_with("file:///pyramid.json")
+    mocked_get_data_binary.assert_called_once_with("file:///pyramid.json")
 
 
 @mock.patch.dict(os.environ, {}, clear=True)
 @mock.patch(
-    "rok4.pyramid.get_data_str",
-    return_value='{"format": "TIFF_PBF_MVT","levels":[{}], "tile_matrix_set": "PM"}',
+    "rok4.pyramid.get_data_binary",
+    return_value=b'{"format": "TIFF_PBF_MVT","levels":[{}], "tile_matrix_set": "PM"}',
 )
-@mock.patch("rok4.pyramid.TileMatrixSet", side_effect=StorageError("FILE", "TMS not found"))
-def test_wrong_tms(mocked_tms_constructor, mocked_get_data_str):
+@mock.patch("rok4.pyramid.get_tile_matrix_set", side_effect=StorageError("FILE", "TMS not found"))
+def test_wrong_tms(mocked_tms_constructor, mocked_get_data_binary):
     with pytest.raises(StorageError) as exc:
         Pyramid.from_descriptor("file:///pyramid.json")
 
     assert str(exc.value) == "Issue occured using a FILE storage : TMS not found"
     mocked_tms_constructor.assert_called_once_with("PM")
-    mocked_get_data_str.assert_called_once_with("file:///pyramid.json")
+    mocked_get_data_binary.assert_called_once_with("file:///pyramid.json")
 
 
 @mock.patch.dict(os.environ, {}, clear=True)
 @mock.patch(
-    "rok4.pyramid.get_data_str",
-    return_value='{"format": "TIFF_JPG_UINT8","levels":[{"tiles_per_height":16,"tile_limits":{"min_col":0,"max_row":15,"max_col":15,"min_row":0},"storage":{"image_directory":"SCAN1000/DATA/0","path_depth":2,"type":"FILE"},"tiles_per_width":16,"id":"0"}], "tile_matrix_set": "PM"}',
+    "rok4.pyramid.get_data_binary",
+    return_value=b'{"format": "TIFF_JPG_UINT8","levels":[{"tiles_per_height":16,"tile_limits":{"min_col":0,"max_row":15,"max_col":15,"min_row":0},"storage":{"image_directory":"SCAN1000/DATA/0","path_depth":2,"type":"FILE"},"tiles_per_width":16,"id":"0"}], "tile_matrix_set": "PM"}',
 )
-@mock.patch("rok4.pyramid.TileMatrixSet")
-def test_raster_missing_raster_specifications(mocked_tms_class, mocked_get_data_str):
+@mock.patch("rok4.pyramid.get_tile_matrix_set")
+def test_raster_missing_raster_specifications(mocked_tms_class, mocked_get_data_binary):
     with pytest.raises(MissingAttributeError) as exc:
         Pyramid.from_descriptor("file:///pyramid.json")
 
     assert str(exc.value) == "Missing attribute 'raster_specifications' in 'file:///pyramid.json'"
-    mocked_get_data_str.assert_called_once_with("file:///pyramid.json")
+    mocked_get_data_binary.assert_called_once_with("file:///pyramid.json")
 
 
 @mock.patch.dict(os.environ, {}, clear=True)
 @mock.patch(
-    "rok4.pyramid.get_data_str",
-    return_value='{"raster_specifications":{"channels":3,"nodata":"255,0,0","photometric":"rgb","interpolation":"bicubic"}, "format": "TIFF_JPG_UINT8","levels":[{"tiles_per_height":16,"tile_limits":{"min_col":0,"max_row":15,"max_col":15,"min_row":0},"storage":{"image_directory":"SCAN1000/DATA/0","path_depth":2,"type":"FILE"},"tiles_per_width":16,"id":"unknown"}], "tile_matrix_set": "PM"}',
+    "rok4.pyramid.get_data_binary",
+    return_value=b'{"raster_specifications":{"channels":3,"nodata":"255,0,0","photometric":"rgb","interpolation":"bicubic"}, "format": "TIFF_JPG_UINT8","levels":[{"tiles_per_height":16,"tile_limits":{"min_col":0,"max_row":15,"max_col":15,"min_row":0},"storage":{"image_directory":"SCAN1000/DATA/0","path_depth":2,"type":"FILE"},"tiles_per_width":16,"id":"unknown"}], "tile_matrix_set": "PM"}',
 )
-@mock.patch("rok4.pyramid.TileMatrixSet")
-def test_wrong_level(mocked_tms_class, mocked_get_data_str):
+@mock.patch("rok4.pyramid.get_tile_matrix_set")
+def test_wrong_level(mocked_tms_class, mocked_get_data_binary):
     tms_instance = MagicMock()
     tms_instance.get_level.return_value = None
     tms_instance.name = "PM"
@@ -85,7 +94,7 @@ def test_wrong_level(mocked_tms_class, mocked_get_data_str):
         Pyramid.from_descriptor("file:///pyramid.json")
 
     mocked_tms_class.assert_called_once_with("PM")
-    mocked_get_data_str.assert_called_once_with("file:///pyramid.json")
+    mocked_get_data_binary.assert_called_once_with("file:///pyramid.json")
     tms_instance.get_level.assert_called_once_with("unknown")
     assert (
         str(exc.value)
@@ -95,26 +104,26 @@ def test_wrong_level(mocked_tms_class, mocked_get_data_str):
 
 @mock.patch.dict(os.environ, {}, clear=True)
 @mock.patch(
-    "rok4.pyramid.get_data_str",
-    return_value='{"format": "TIFF_PBF_MVT","levels":[{"tiles_per_height":16,"tile_limits":{"min_col":0,"max_row":15,"max_col":15,"min_row":0},"storage":{"image_directory":"SCAN1000/DATA/0","path_depth":2,"type":"FILE"},"tiles_per_width":16,"id":"0"}], "tile_matrix_set": "PM"}',
+    "rok4.pyramid.get_data_binary",
+    return_value=b'{"format": "TIFF_PBF_MVT","levels":[{"tiles_per_height":16,"tile_limits":{"min_col":0,"max_row":15,"max_col":15,"min_row":0},"storage":{"image_directory":"SCAN1000/DATA/0","path_depth":2,"type":"FILE"},"tiles_per_width":16,"id":"0"}], "tile_matrix_set": "PM"}',
 )
-@mock.patch("rok4.pyramid.TileMatrixSet", autospec=True)
-def test_vector_missing_tables(mocked_tms_class, mocked_get_data_str):
+@mock.patch("rok4.pyramid.get_tile_matrix_set", autospec=True)
+def test_vector_missing_tables(mocked_tms_class, mocked_get_data_binary):
     with pytest.raises(MissingAttributeError) as exc:
         Pyramid.from_descriptor("file:///pyramid.json")
 
     assert str(exc.value) == "Missing attribute levels[].'tables' in 'file:///pyramid.json'"
-    mocked_get_data_str.assert_called_once_with("file:///pyramid.json")
+    mocked_get_data_binary.assert_called_once_with("file:///pyramid.json")
 
 
 @mock.patch.dict(os.environ, {}, clear=True)
 @mock.patch(
-    "rok4.pyramid.get_data_str",
-    return_value='{"raster_specifications":{"channels":3,"nodata":"255,0,0","photometric":"rgb","interpolation":"bicubic"}, "format": "TIFF_JPG_UINT8","levels":[{"tiles_per_height":16,"tile_limits":{"min_col":0,"max_row":15,"max_col":15,"min_row":0},"storage":{"image_prefix":"SCAN1000/DATA_0","pool_name":"pool1","type":"CEPH"},"tiles_per_width":16,"id":"0"}], "tile_matrix_set": "PM"}',
+    "rok4.pyramid.get_data_binary",
+    return_value=b'{"raster_specifications":{"channels":3,"nodata":"255,0,0","photometric":"rgb","interpolation":"bicubic"}, "format": "TIFF_JPG_UINT8","levels":[{"tiles_per_height":16,"tile_limits":{"min_col":0,"max_row":15,"max_col":15,"min_row":0},"storage":{"image_prefix":"SCAN1000/DATA_0","pool_name":"pool1","type":"CEPH"},"tiles_per_width":16,"id":"0"}], "tile_matrix_set": "PM"}',
 )
-@mock.patch("rok4.pyramid.TileMatrixSet")
+@mock.patch("rok4.pyramid.get_tile_matrix_set")
 @mock.patch("rok4.pyramid.put_data_str", return_value=None)
-def test_raster_ok(mocked_put_data_str, mocked_tms_class, mocked_get_data_str):
+def test_raster_ok(mocked_put_data_str, mocked_tms_class, mocked_get_data_binary):
     tms_instance = MagicMock()
     tms_instance.name = "PM"
     tms_instance.srs = "EPSG:3857"
@@ -136,7 +145,7 @@ def test_raster_ok(mocked_put_data_str, mocked_tms_class, mocked_get_data_str):
         assert pyramid.name == "sub/pyramid"
         assert pyramid.storage_type == StorageType.CEPH
         assert pyramid.storage_root == "pool1"
-        mocked_get_data_str.assert_called_once_with("ceph://pool1/sub/pyramid.json")
+        mocked_get_data_binary.assert_called_once_with("ceph://pool1/sub/pyramid.json")
 
         clone = Pyramid.from_other(pyramid, "titi", {"type": "FILE", "root": "/data/ign"})
         assert clone.name == "titi"
@@ -167,11 +176,52 @@ def test_raster_ok(mocked_put_data_str, mocked_tms_class, mocked_get_data_str):
 
 @mock.patch.dict(os.environ, {}, clear=True)
 @mock.patch(
-    "rok4.pyramid.get_data_str",
-    return_value='{"format": "TIFF_PBF_MVT","levels":[{"tiles_per_height":16,"tile_limits":{"min_col":0,"max_row":15,"max_col":15,"min_row":0},"storage":{"image_directory":"SCAN1000/DATA/0","path_depth":2,"type":"FILE"},"tiles_per_width":16,"id":"0","tables":[{"name":"table","geometry":"POINT","attributes":[{"type":"bigint","name":"fid","count":1531}]}]}], "tile_matrix_set": "PM"}',
+    "rok4.pyramid.get_data_binary",
+    return_value=b'{"raster_specifications":{"channels":3,"nodata":"255,0,0","photometric":"rgb","interpolation":"bicubic"}, "format": "TIFF_JPG_UINT8","levels":[{"tiles_per_height":16,"tile_limits":{"min_col":0,"max_row":15,"max_col":15,"min_row":0},"storage":{"image_prefix":"SCAN1000/DATA_0","pool_name":"pool1","type":"CEPH"},"tiles_per_width":16,"id":"0"}], "tile_matrix_set": "PM"}',
+)
+@mock.patch("rok4.pyramid.get_tile_matrix_set")
+def test_level_cache(mocked_tms_class, mocked_get_data_binary):
+    tms_instance = MagicMock()
+    tms_instance.name = "PM"
+
+    tm_instance = MagicMock()
+    tm_instance.id = "0"
+    tm_instance.resolution = 1
+    tm_instance.tile_to_bbox.side_effect = lambda col, row: (col, row, col + 1, row + 1)
+    tm_instance.bbox_to_tiles.return_value = (2, 3, 4, 5)
+
+    tms_instance.get_level.return_value = tm_instance
+
+    mocked_tms_class.return_value = tms_instance
+
+    try:
+        pyramid = Pyramid.from_descriptor("ceph://pool1/sub/pyramid.json")
+        level = pyramid.get_level("0")
+
+        assert level.bbox == (0, 15, 16, 1)
+        assert level.bbox == (0, 15, 16, 1)
+        assert tm_instance.tile_to_bbox.call_count == 2
+        assert level.serializable is level.serializable
+
+        level.set_limits_from_bbox((0, 0, 1, 1))
+        assert level.bbox == (2, 5, 5, 4)
+        assert level.serializable["tile_limits"] == {
+            "min_row": 3,
+            "max_col": 4,
+            "max_row": 5,
+            "min_col": 2,
+        }
+    except Exception as exc:
+        assert False, f"Pyramid level cache raises an exception: {exc}"
+
+
+@mock.patch.dict(os.environ, {}, clear=True)
+@mock.patch(
+    "rok4.pyramid.get_data_binary",
+    return_value=b'{"format": "TIFF_PBF_MVT","levels":[{"tiles_per_height":16,"tile_limits":{"min_col":0,"max_row":15,"max_col":15,"min_row":0},"storage":{"image_directory":"SCAN1000/DATA/0","path_depth":2,"type":"FILE"},"tiles_per_width":16,"id":"0","tables":[{"name":"table","geometry":"POINT","attributes":[{"type":"bigint","name":"fid","count":1531}]}]}], "tile_matrix_set": "PM"}',
 )
-@mock.patch("rok4.pyramid.TileMatrixSet")
-def test_vector_ok(mocked_tms_class, mocked_get_data_str):
+@mock.patch("rok4.pyramid.get_tile_matrix_set")
+def test_vector_ok(mocked_tms_class, mocked_get_data_binary):
     try:
         pyramid = Pyramid.from_descriptor("file:///pyramid.json")
         assert pyramid.get_level("0") is not None
@@ -179,12 +229,18 @@ def test_vector_ok(mocked_tms_class, mocked_get_data_str):
         assert pyramid.name == "pyramid"
         assert pyramid.storage_depth == 2
         assert pyramid.storage_type == StorageType.FILE
-        mocked_get_data_str.assert_called_once_with("file:///pyramid.json")
+        mocked_get_data_binary.assert_called_once_with("file:///pyramid.json")
 
         clone = Pyramid.from_other(pyramid, "toto", {"type": "S3", "root": "bucket"})
         assert clone.name == "toto"
         assert clone.tile_extension == "pbf"
         assert clone.storage_type == StorageType.S3
+        assert clone.storage_root == "bucket"
+        assert clone.storage_s3_cluster is None
+
+        clone = Pyramid.from_other(pyramid, "toto", {"type": "S3", "root": "bucket@s3.storage.fr"})
+        assert clone.storage_root == "bucket"
+        assert clone.storage_s3_cluster == "s3.storage.fr"
         assert clone.get_level("0") is not None
         assert clone.get_level("4") is None
     except Exception as exc:
@@ -195,7 +251,7 @@ def test_vector_ok(mocked_tms_class, mocked_get_data_str):
 
 
 @mock.patch.dict(os.environ, {}, clear=True)
-@mock.patch("rok4.pyramid.TileMatrixSet")
+@mock.patch("rok4.pyramid.get_tile_matrix_set")
 def test_tile_read_raster(mocked_tms_class):
     tms_instance = MagicMock()
     tms_instance.name = "UTM20W84MART_1M_MNT"
@@ -220,7 +276,7 @@ def test_tile_read_raster(mocked_tms_class):
 
 
 @mock.patch.dict(os.environ, {}, clear=True)
-@mock.patch("rok4.pyramid.TileMatrixSet")
+@mock.patch("rok4.pyramid.get_tile_matrix_set")
 def test_tile_read_vector(mocked_tms_class):
     tms_instance = MagicMock()
     tms_instance.name = "PM"
@@ -248,7 +304,7 @@ def test_tile_read_vector(mocked_tms_class):
 
 
 @mock.patch.dict(os.environ, {}, clear=True)
-@mock.patch("rok4.pyramid.TileMatrixSet")
+@mock.patch("rok4.pyramid.get_tile_matrix_set")
 def test_list_read(mocked_tms_class):
     tms_instance = MagicMock()
     tms_instance.name = "PM"
@@ -282,6 +338,106 @@ def test_list_read(mocked_tms_class):
         assert False, f"Pyramid vector list read raises an exception: {exc}"
 
 
+@mock.patch.dict(os.environ, {}, clear=True)
+@mock.patch(
+    "rok4.pyramid.get_data_binary",
+    return_value=b'{"raster_specifications":{"channels":3,"nodata":"255,0,0","photometric":"rgb","interpolation":"bicubic"}, "format": "TIFF_JPG_UINT8","levels":[{"tiles_per_height":16,"tile_limits":{"min_col":0,"max_row":15,"max_col":15,"min_row":0},"storage":{"image_directory":"SCAN1000/DATA/2","path_depth":2,"type":"FILE"},"tiles_per_width":16,"id":"2"},{"tiles_per_height":16,"tile_limits":{"min_col":0,"max_row":15,"max_col":15,"min_row":0},"storage":{"image_directory":"SCAN1000/DATA/0","path_depth":2,"type":"FILE"},"tiles_per_width":16,"id":"0"},{"tiles_per_height":16,"tile_limits":{"min_col":0,"max_row":15,"max_col":15,"min_row":0},"storage":{"image_directory":"SCAN1000/DATA/1","path_depth":2,"type":"FILE"},"tiles_per_width":16,"id":"1"}], "tile_matrix_set": "PM"}',
+)
+@mock.patch("rok4.pyramid.get_tile_matrix_set")
+def test_get_levels(mocked_tms_class, mocked_get_data_binary):
+    tms_instance = MagicMock()
+    tms_instance.name = "PM"
+
+    tm_instances = {}
+    for level_id in ["0", "1", "2"]:
+        tm_instances[level_id] = MagicMock()
+        tm_instances[level_id].id = level_id
+        tm_instances[level_id].resolution = 2 ** (2 - int(level_id))
+
+    tms_instance.get_level.side_effect = lambda level_id: tm_instances.get(level_id, None)
+
+    mocked_tms_class.return_value = tms_instance
+
+    pyramid = Pyramid.from_descriptor("file:///pyramid.json")
+
+    assert [level.id for level in pyramid.get_levels()] == ["2", "1", "0"]
+    assert [level.id for level in pyramid.get_levels("1")] == ["1", "0"]
+    assert [level.id for level in pyramid.get_levels(None, "1")] == ["2", "1"]
+    assert [level.id for level in pyramid.get_levels("1", "1")] == ["1"]
+    assert pyramid.bottom_level.id == "2"
+    assert pyramid.top_level.id == "0"
+
+    with pytest.raises(Exception):
+        pyramid.get_levels("0", "2")
+
+    with pytest.raises(Exception):
+        pyramid.get_levels("3")
+
+    pyramid.delete_level("2")
+    assert [level.id for level in pyramid.get_levels()] == ["1", "0"]
+
+    pyramid.delete_level("1")
+    pyramid.delete_level("0")
+    assert pyramid.get_levels() == []
+
+
+@mock.patch.dict(os.environ, {}, clear=True)
+@mock.patch(
+    "rok4.pyramid.get_data_binary",
+    return_value=b'{"raster_specifications":{"channels":3,"nodata":"255,0,0","photometric":"rgb","interpolation":"bicubic"}, "format": "TIFF_JPG_UINT8","levels":[{"tiles_per_height":16,"tile_limits":{"min_col":0,"max_row":15,"max_col":15,"min_row":0},"storage":{"image_directory":"SCAN1000/DATA/2","path_depth":2,"type":"FILE"},"tiles_per_width":16,"id":"2"},{"tiles_per_height":16,"tile_limits":{"min_col":0,"max_row":15,"max_col":15,"min_row":0},"storage":{"image_directory":"SCAN1000/DATA/0","path_depth":2,"type":"FILE"},"tiles_per_width":16,"id":"0"},{"tiles_per_height":16,"tile_limits":{"min_col":0,"max_row":15,"max_col":15,"min_row":0},"storage":{"image_directory":"SCAN1000/DATA/1","path_depth":2,"type":"FILE"},"tiles_per_width":16,"id":"1"}], "tile_matrix_set": "PM"}',
+)
+@mock.patch("rok4.pyramid.get_tile_matrix_set")
+def test_slab_key(mocked_tms_class, mocked_get_data_binary):
+    tms_instance = MagicMock()
+    tms_instance.name = "PM"
+
+    tm_instances = {}
+    for level_id in ["0", "1", "2"]:
+        tm_instances[level_id] = MagicMock()
+        tm_instances[level_id].id = level_id
+        tm_instances[level_id].resolution = 2 ** (2 - int(level_id))
+
+    tms_instance.get_level.side_effect = lambda level_id: tm_instances.get(level_id, None)
+    tms_instance.sorted_levels = [tm_instances[level_id] for level_id in ["2", "1", "0"]]
+
+    mocked_tms_class.return_value = tms_instance
+
+    pyramid = Pyramid.from_descriptor("file:///pyramid.json")
+
+    key = pyramid.get_slab_key(SlabType.MASK, "1", 159, 367)
+    assert key < 2**64
+    assert pyramid.get_infos_from_slab_key(key) == (SlabType.MASK, "1", 159, 367)
+    assert pyramid.get_slab_key(SlabType.DATA, "2", 0, 0) == 0
+    assert pyramid.get_slab_key(SlabType.DATA, "0", 1, 0) == (2 << 56) | 1
+
+    with pytest.raises(Exception):
+        pyramid.get_slab_key(SlabType.DATA, "3", 0, 0)
+
+    with pytest.raises(Exception):
+        pyramid.get_slab_key(SlabType.DATA, "1", 2**28, 0)
+
+    with pytest.raises(Exception):
+        pyramid.get_infos_from_slab_key(63 << 56)
+
+    # Les clés restent valides après suppression d'un niveau
+    bottom_key = pyramid.get_slab_key(SlabType.DATA, "2", 0, 0)
+    pyramid.delete_level("2")
+    assert pyramid.get_infos_from_slab_key(key) == (SlabType.MASK, "1", 159, 367)
+
+    with pytest.raises(Exception):
+        pyramid.get_infos_from_slab_key(bottom_key)
+
+
+def test_morton():
+    assert morton_encode(0, 0) == 0
+    assert morton_encode(1, 0) == 1
+    assert morton_encode(0, 1) == 2
+    assert morton_encode(3, 3) == 15
+    assert morton_encode(2**28 - 1, 2**28 - 1) == 2**56 - 1
+    assert morton_decode(morton_encode(4032, 18217)) == (4032, 18217)
+    assert morton_decode(morton_encode(123456789, 987654)) == (123456789, 987654)
+
+
 def test_b36_path_decode():
     assert b36_path_decode("3E/42/01.tif") == (
         4032,
@@ -297,6 +453,16 @@ def test_b36_path_decode():
     )
 
 
+def test_b36_numbers_encode():
+    assert b36_numbers_encode([]) == []
+    assert b36_numbers_encode([0, 35, 36, 4032, 18217]) == ["0", "Z", "10", "340", "E21"]
+    assert b36_numbers_encode([2**64 - 1]) == [b36_number_encode(2**64 - 1)]
+
+
 def test_b36_path_encode():
     assert b36_path_encode(4032, 18217, 2) == "3E/42/01.tif"
     assert b36_path_encode(14, 18217, 1) == "0E02/E1.tif"
+
+    hits = b36_path_encode.cache_info().hits
+    assert b36_path_encode(4032, 18217, 2) == "3E/42/01.tif"
+    assert b36_path_encode.cache_info().hits == hits + 1
@@ -15,6 +15,7 @@ from unittest.mock import MagicMock, call, mock_open
 import pytest
 
 from rok4.enums import ColorFormat
+from rok4.exceptions import FormatError
 from rok4.raster import Raster, RasterSet
 
 # rok4.raster.Raster class tests
@@ -69,10 +70,19 @@ class TestRasterFromFile(TestCase):
 
     @mock.patch("rok4.raster.get_osgeo_path")
     @mock.patch("rok4.raster.compute_format", return_value=ColorFormat.UINT8)
+    @mock.patch("rok4.raster.gdal.VSIStatL", return_value=None)
     @mock.patch("rok4.raster.gdal.Open")
     @mock.patch("rok4.raster.compute_bbox")
-    @mock.patch("rok4.raster.exists", side_effect=[True, False])
-    def test_image(self, m_exists, m_compute_bbox, m_gdal_open, m_compute_format, m_get_osgeo_path):
+    @mock.patch("rok4.raster.exists", return_value=True)
+    def test_image(
+        self,
+        m_exists,
+        m_compute_bbox,
+        m_gdal_open,
+        m_vsistatl,
+        m_compute_format,
+        m_get_osgeo_path,
+    ):
         """Constructor called nominally on an image without mask."""
         m_compute_bbox.return_value = self.bbox
         m_dataset_properties = {
@@ -81,12 +91,15 @@ class TestRasterFromFile(TestCase):
             "RasterYSize": self.image_size[1],
         }
         m_gdal_open.return_value = type("", (object,), m_dataset_properties)
-        m_get_osgeo_path.return_value = self.osgeo_image_path
+        m_get_osgeo_path.side_effect = [self.osgeo_image_path, self.osgeo_mask_path]
 
         raster = Raster.from_file(self.source_image_path)
 
-        m_exists.assert_has_calls([call(self.source_image_path), call(self.source_mask_path)])
-        m_get_osgeo_path.assert_called_once_with(self.source_image_path)
+        m_exists.assert_called_once_with(self.source_image_path)
+        m_get_osgeo_path.assert_has_calls(
+            [call(self.source_image_path), call(self.source_mask_path)]
+        )
+        m_vsistatl.assert_called_once_with(self.osgeo_mask_path)
         m_gdal_open.assert_called_once_with(self.osgeo_image_path)
         assert raster.path == self.source_image_path
         assert raster.mask is None
@@ -107,14 +120,16 @@ class TestRasterFromFile(TestCase):
     @mock.patch("rok4.raster.get_osgeo_path")
     @mock.patch("rok4.raster.compute_format", return_value=ColorFormat.UINT8)
     @mock.patch("rok4.raster.gdal.IdentifyDriver")
+    @mock.patch("rok4.raster.gdal.VSIStatL")
     @mock.patch("rok4.raster.gdal.Open")
     @mock.patch("rok4.raster.compute_bbox")
-    @mock.patch("rok4.raster.exists", side_effect=[True, True])
+    @mock.patch("rok4.raster.exists", return_value=True)
     def test_image_and_mask(
         self,
         m_exists,
         m_compute_bbox,
         m_gdal_open,
+        m_vsistatl,
         m_identifydriver,
         m_compute_format,
         m_get_osgeo_path,
@@ -132,10 +147,11 @@ class TestRasterFromFile(TestCase):
 
         raster = Raster.from_file(self.source_image_path)
 
-        m_exists.assert_has_calls([call(self.source_image_path), call(self.source_mask_path)])
+        m_exists.assert_called_once_with(self.source_image_path)
         m_get_osgeo_path.assert_has_calls(
             [call(self.source_image_path), call(self.source_mask_path)]
         )
+        m_vsistatl.assert_called_once_with(self.osgeo_mask_path)
         m_identifydriver.assert_called_once_with(self.osgeo_mask_path)
         m_gdal_open.assert_called_once_with(self.osgeo_image_path)
         assert raster.path == self.source_image_path
@@ -156,7 +172,7 @@ class TestRasterFromFile(TestCase):
 
     @mock.patch("rok4.raster.get_osgeo_path")
     @mock.patch("rok4.raster.gdal.Open", side_effect=RuntimeError)
-    @mock.patch("rok4.raster.exists", side_effect=[True, False])
+    @mock.patch("rok4.raster.exists", return_value=True)
     def test_unsupported_image_format(self, m_exists, m_gdal_open, m_get_osgeo_path):
         """Test case : Constructor called on an unsupported image file or object."""
         m_get_osgeo_path.return_value = self.osgeo_image_path
@@ -170,19 +186,20 @@ class TestRasterFromFile(TestCase):
 
     @mock.patch("rok4.raster.get_osgeo_path")
     @mock.patch("rok4.raster.gdal.IdentifyDriver")
+    @mock.patch("rok4.raster.gdal.VSIStatL")
     @mock.patch("rok4.raster.gdal.Open", side_effect=None)
-    @mock.patch("rok4.raster.exists", side_effect=[True, True])
+    @mock.patch("rok4.raster.exists", return_value=True)
     def test_unsupported_mask_format(
-        self, m_exists, m_gdal_open, m_identifydriver, m_get_osgeo_path
+        self, m_exists, m_gdal_open, m_vsistatl, m_identifydriver, m_get_osgeo_path
     ):
         """Test case : Constructor called on an unsupported mask file or object."""
         m_get_osgeo_path.side_effect = [self.osgeo_image_path, self.osgeo_mask_path]
         m_identifydriver.return_value = type("", (object,), {"ShortName": "JPG"})
 
-        with pytest.raises(Exception):
+        with pytest.raises(FormatError):
             Raster.from_file(self.source_image_path)
 
-        m_exists.assert_has_calls([call(self.source_image_path), call(self.source_mask_path)])
+        m_exists.assert_called_once_with(self.source_image_path)
         m_get_osgeo_path.assert_has_calls(
             [call(self.source_image_path), call(self.source_mask_path)]
         )
@@ -190,6 +207,27 @@ class TestRasterFromFile(TestCase):
         m_gdal_open.assert_called_once_with(self.osgeo_image_path)
 
 
+class TestRasterFromFiles(TestCase):
+    """rok4.raster.Raster.from_files(paths) class constructor."""
+
+    @mock.patch("rok4.raster.Raster.from_file")
+    def test_ok(self, m_from_file):
+        """Rasters are returned in the order of provided paths."""
+        paths = [f"s3://test_bucket/image_{n}.tif" for n in range(20)]
+        m_from_file.side_effect = lambda path: f"raster from {path}"
+
+        rasters = Raster.from_files(paths, max_workers=4)
+
+        assert rasters == [f"raster from {path}" for path in paths]
+        assert m_from_file.call_count == 20
+
+    @mock.patch("rok4.raster.Raster.from_file", side_effect=FileNotFoundError("missing"))
+    def test_error(self, m_from_file):
+        """An error reading one image is raised."""
+        with pytest.raises(FileNotFoundError):
+            Raster.from_files(["file:///home/user/image.tif"])
+
+
 class TestRasterFromParameters(TestCase):
     """rok4.raster.Raster.from_parameters(**kwargs) class constructor."""
 
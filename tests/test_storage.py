@@ -1,24 +1,34 @@
+import errno
+import hashlib
 import os
+import subprocess
+import sys
 from unittest import mock
 from unittest.mock import MagicMock, mock_open, patch
 
+import botocore.awsrequest
 import botocore.exceptions
 import pytest
 
+import rok4.storage
 from rok4.enums import StorageType
 from rok4.exceptions import MissingEnvironmentError, StorageError
 from rok4.storage import (
     copy,
+    copy_many,
     disconnect_ceph_clients,
     disconnect_s3_clients,
     exists,
+    exists_many,
     get_data_binary,
+    get_data_chunks,
     get_data_str,
     get_infos_from_path,
     get_osgeo_path,
     get_path_from_infos,
     get_size,
     hash_file,
+    hash_file_parts,
     link,
     put_data_str,
     rados,
@@ -27,13 +37,94 @@ from rok4.storage import (
 )
 
 
+def mock_ceph_object(ioctx_instance: MagicMock, data: bytes) -> None:
+    """Configure a mocked CEPH IO context to provide the object's data, through stat and asynchronous reads"""
+
+    def aio_read(object_name, length, offset, oncomplete):
+        completion = MagicMock()
+        completion.get_return_value.return_value = 0
+        completion.wait_for_complete_and_cb.side_effect = lambda: oncomplete(
+            completion, data[offset : offset + length]
+        )
+        return completion
+
+    ioctx_instance.stat.return_value = (len(data), None)
+    ioctx_instance.aio_read.side_effect = aio_read
+
+
 @mock.patch.dict(os.environ, {}, clear=True)
-@patch("builtins.open", new_callable=mock_open, read_data=b"data")
-def test_hash_file_ok(mock_file):
+def test_hash_file_ok(tmp_path):
     try:
-        md5 = hash_file("/path/to/file.ext")
-        mock_file.assert_called_with("/path/to/file.ext", "rb")
+        path = tmp_path / "file.ext"
+        path.write_bytes(b"data")
+        md5 = hash_file(str(path))
         assert md5 == "8d777f385d3dfec8815d20f7496026dc"
+
+        # Contenu plus grand que le tampon de lecture
+        path.write_bytes(b"data" * 300000)
+        md5 = hash_file(str(path))
+        assert md5 == hashlib.md5(b"data" * 300000).hexdigest()
+    except Exception as exc:
+        assert False, f"FILE md5 sum raises an exception: {exc}"
+
+
+def test_block_buffer_reused():
+    get_block_buffer = rok4.storage.__dict__["__get_block_buffer"]
+
+    buffer = get_block_buffer()
+    assert get_block_buffer() is buffer
+
+    with mock.patch("rok4.storage.__HASH_BLOCK_SIZE", 3):
+        assert len(get_block_buffer()) == 3
+
+
+def test_hash_file_algorithms(tmp_path):
+    path = tmp_path / "file.ext"
+    path.write_bytes(b"data" * 300000)
+
+    try:
+        assert hash_file(str(path), "sha256") == hashlib.sha256(b"data" * 300000).hexdigest()
+        assert hash_file(str(path), "blake2b") == hashlib.blake2b(b"data" * 300000).hexdigest()
+    except Exception as exc:
+        assert False, f"FILE hash sum raises an exception: {exc}"
+
+    with pytest.raises(ValueError):
+        hash_file(str(path), "unknown")
+
+    with mock.patch("rok4.storage.BLAKE3_AVAILABLE", False):
+        with pytest.raises(NotImplementedError):
+            hash_file(str(path), "blake3")
+
+
+def test_hash_file_parts_ok(tmp_path):
+    path = tmp_path / "parts.ext"
+    path.write_bytes(b"0123456789")
+
+    etag = hashlib.md5(
+        hashlib.md5(b"0123").digest() + hashlib.md5(b"4567").digest() + hashlib.md5(b"89").digest()
+    ).hexdigest()
+
+    try:
+        assert hash_file_parts(str(path), 4, 2) == (
+            hashlib.md5(b"0123456789").hexdigest(),
+            f"{etag}-3",
+        )
+
+        path.write_bytes(b"")
+        assert hash_file_parts(str(path), 4) == (hashlib.md5(b"").hexdigest(),) * 2
+    except Exception as exc:
+        assert False, f"FILE parts hashing raises an exception: {exc}"
+
+
+@mock.patch.dict(os.environ, {}, clear=True)
+@mock.patch("rok4.storage.hashlib", wraps=hashlib, spec=["md5"])
+def test_hash_file_without_file_digest_ok(mock_hashlib, tmp_path):
+    try:
+        path = tmp_path / "file.ext"
+        path.write_bytes(b"data" * 300000)
+        md5 = hash_file(str(path))
+        assert md5 == hashlib.md5(b"data" * 300000).hexdigest()
+        mock_hashlib.md5.assert_called_once()
     except Exception as exc:
         assert False, f"FILE md5 sum raises an exception: {exc}"
 
@@ -103,21 +194,42 @@ def test_s3_invalid_endpoint(mocked_s3_client):
 
 
 @mock.patch.dict(os.environ, {}, clear=True)
-@mock.patch("builtins.open", side_effect=FileNotFoundError("not_found"))
+@mock.patch("os.open", side_effect=FileNotFoundError("not_found"))
 def test_file_read_error(mock_file):
     with pytest.raises(FileNotFoundError):
         get_data_str("file:///path/to/file.ext")
 
-    mock_file.assert_called_with("/path/to/file.ext", "rb")
+    mock_file.assert_called_once()
+    assert mock_file.call_args[0][0] == "/path/to/file.ext"
 
 
 @mock.patch.dict(os.environ, {}, clear=True)
-@patch("builtins.open", new_callable=mock_open, read_data=b"data")
-def test_file_read_ok(mock_file):
+def test_file_read_ok(tmp_path):
     try:
-        data = get_data_str("file:///path/to/file.ext")
-        mock_file.assert_called_with("/path/to/file.ext", "rb")
+        path = tmp_path / "file.ext"
+        path.write_bytes(b"data")
+        data = get_data_str(f"file://{path}")
         assert data == "data"
+
+        data = get_data_binary(f"file://{path}", (1, 2))
+        assert data == b"at"
+
+        data = get_data_binary(f"file://{path}", (2, 10))
+        assert data == b"ta"
+    except Exception as exc:
+        assert False, f"FILE read raises an exception: {exc}"
+
+
+@mock.patch.dict(os.environ, {}, clear=True)
+def test_file_read_null_size(tmp_path):
+    # Fichiers annonçant une taille nulle mais fournissant des données (procfs, FIFO...)
+    path = tmp_path / "status"
+    path.write_bytes(b"data" * 10000)
+
+    try:
+        with mock.patch("os.fstat", return_value=MagicMock(st_size=0)):
+            data = get_data_binary(f"file://{path}")
+        assert data == b"data" * 10000
     except Exception as exc:
         assert False, f"FILE read raises an exception: {exc}"
 
@@ -246,9 +358,19 @@ def test_s3_write_ok(mocked_s3_client):
     mocked_s3_client.return_value = s3_instance
     try:
         put_data_str("data", "s3://bucket/path/to/object")
+        s3_instance.put_object.assert_called_once_with(
+            Body=b"data", Bucket="bucket", Key="path/to/object"
+        )
     except Exception as exc:
         assert False, f"S3 write raises an exception: {exc}"
 
+    try:
+        put_data_str("data" * 4 * 1024 * 1024, "s3://bucket/path/to/object")
+        s3_instance.upload_fileobj.assert_called_once()
+        assert s3_instance.upload_fileobj.call_args[0][1:] == ("bucket", "path/to/object")
+    except Exception as exc:
+        assert False, f"S3 large write raises an exception: {exc}"
+
 
 @mock.patch.dict(
     os.environ,
@@ -273,20 +395,65 @@ def test_ceph_write_ok(mocked_rados_client):
 # -- copy
 
 
+@mock.patch.dict(os.environ, {}, clear=True)
+def test_copy_file_file_ok(tmp_path):
+    source = tmp_path / "source.ext"
+    source.write_bytes(b"data" * 300000)
+
+    try:
+        copy(f"file://{source}", f"file://{tmp_path}/to/destination.ext")
+        assert (tmp_path / "to" / "destination.ext").read_bytes() == b"data" * 300000
+    except Exception as exc:
+        assert False, f"FILE -> FILE copy raises an exception: {exc}"
+
+
+@mock.patch.dict(os.environ, {}, clear=True)
+def test_copy_file_file_same(tmp_path):
+    source = tmp_path / "source.ext"
+    source.write_bytes(b"data")
+
+    with pytest.raises(StorageError) as exc:
+        copy(f"file://{source}", f"file://{source}")
+    assert "are the same file" in str(exc.value)
+    assert source.read_bytes() == b"data"
+
+    with pytest.raises(StorageError) as exc:
+        copy(f"file://{source}", f"file://{source}", hashlib.md5(b"data").hexdigest())
+    assert "are the same file" in str(exc.value)
+    assert source.read_bytes() == b"data"
+
+
 @mock.patch.dict(os.environ, {}, clear=True)
 @mock.patch("os.makedirs", return_value=None)
+@mock.patch("os.copy_file_range", create=True, side_effect=OSError(errno.EXDEV, "Cross-device"))
 @mock.patch("rok4.storage.copyfile", return_value=None)
-@mock.patch("rok4.storage.hash_file", return_value="toto")
-def test_copy_file_file_ok(mock_hash_file, mock_copyfile, mock_makedirs):
+def test_copy_file_file_fallback(mock_copyfile, mock_copy_file_range, mock_makedirs, tmp_path):
+    source = tmp_path / "source.ext"
+    source.write_bytes(b"data")
+
     try:
-        copy("file:///path/to/source.ext", "file:///path/to/destination.ext", "toto")
-        mock_copyfile.assert_called_once_with("/path/to/source.ext", "/path/to/destination.ext")
-        mock_hash_file.assert_called_once_with("/path/to/destination.ext")
-        mock_makedirs.assert_called_once_with("/path/to", exist_ok=True)
+        copy(f"file://{source}", f"file://{tmp_path}/destination.ext")
+        mock_copyfile.assert_called_once_with(str(source), f"{tmp_path}/destination.ext")
     except Exception as exc:
         assert False, f"FILE -> FILE copy raises an exception: {exc}"
 
 
+@mock.patch.dict(os.environ, {}, clear=True)
+def test_copy_file_file_md5(tmp_path):
+    source = tmp_path / "source.ext"
+    source.write_bytes(b"data" * 300000)
+    md5 = hashlib.md5(b"data" * 300000).hexdigest()
+
+    try:
+        copy(f"file://{source}", f"file://{tmp_path}/to/destination.ext", md5)
+        assert (tmp_path / "to" / "destination.ext").read_bytes() == b"data" * 300000
+    except Exception as exc:
+        assert False, f"FILE -> FILE copy raises an exception: {exc}"
+
+    with pytest.raises(StorageError):
+        copy(f"file://{source}", f"file://{tmp_path}/to/destination.ext", "toto")
+
+
 @mock.patch.dict(
     os.environ,
     {"ROK4_S3_URL": "https://a,https://b", "ROK4_S3_SECRETKEY": "a,b", "ROK4_S3_KEY": "a,b"},
@@ -334,15 +501,69 @@ def test_copy_s3_file_nok(mock_hash_file, mock_makedirs, mocked_s3_client):
     clear=True,
 )
 @mock.patch("rok4.storage.boto3.client")
-def test_copy_file_s3_ok(mocked_s3_client):
+@mock.patch("os.path.getsize", return_value=100 * 1024 * 1024)
+@mock.patch("rok4.storage.hash_file_parts", return_value=("toto", "titi-7"))
+def test_copy_file_s3_ok(mock_hash_parts, mock_getsize, mocked_s3_client):
     disconnect_s3_clients()
     s3_instance = MagicMock()
     s3_instance.upload_file.return_value = None
-    s3_instance.head_object.return_value = {"ETag": "toto"}
+    s3_instance.head_object.return_value = {"ETag": '"titi-7"'}
     mocked_s3_client.return_value = s3_instance
 
     try:
         copy("file:///path/to/source.ext", "s3://bucket/destination.ext", "toto")
+        s3_instance.upload_file.assert_called_once()
+        s3_instance.head_object.assert_called_once_with(Bucket="bucket", Key="destination.ext")
+        mock_hash_parts.assert_called_once_with("/path/to/source.ext")
+    except Exception as exc:
+        assert False, f"FILE -> S3 copy raises an exception: {exc}"
+
+
+@mock.patch.dict(
+    os.environ,
+    {"ROK4_S3_URL": "https://a,https://b", "ROK4_S3_SECRETKEY": "a,b", "ROK4_S3_KEY": "a,b"},
+    clear=True,
+)
+@mock.patch("rok4.storage.boto3.client")
+@mock.patch("os.path.getsize", return_value=100 * 1024 * 1024)
+@mock.patch("rok4.storage.hash_file_parts", return_value=("toto", "titi-7"))
+def test_copy_file_s3_etag_nok(mock_hash_parts, mock_getsize, mocked_s3_client):
+    disconnect_s3_clients()
+    s3_instance = MagicMock()
+    s3_instance.head_object.return_value = {"ETag": '"tutu-7"'}
+    mocked_s3_client.return_value = s3_instance
+
+    with pytest.raises(StorageError):
+        copy("file:///path/to/source.ext", "s3://bucket/destination.ext", "toto")
+
+
+@mock.patch.dict(
+    os.environ,
+    {"ROK4_S3_URL": "https://a,https://b", "ROK4_S3_SECRETKEY": "a,b", "ROK4_S3_KEY": "a,b"},
+    clear=True,
+)
+@mock.patch("rok4.storage.boto3.client")
+@mock.patch("os.path.getsize", return_value=4)
+@patch("builtins.open", new_callable=mock_open, read_data=b"data")
+def test_copy_small_file_s3_ok(mock_file, mock_getsize, mocked_s3_client):
+    disconnect_s3_clients()
+    s3_instance = MagicMock()
+    mocked_s3_client.return_value = s3_instance
+
+    try:
+        copy(
+            "file:///path/to/source.ext",
+            "s3://bucket/destination.ext",
+            "8d777f385d3dfec8815d20f7496026dc",
+        )
+        s3_instance.put_object.assert_called_once_with(
+            Body=mock_file.return_value,
+            Bucket="bucket",
+            Key="destination.ext",
+            ContentMD5="jXd/OF09/siBXSD3SWAm3A==",
+        )
+        s3_instance.upload_file.assert_not_called()
+        s3_instance.head_object.assert_not_called()
     except Exception as exc:
         assert False, f"FILE -> S3 copy raises an exception: {exc}"
 
@@ -413,7 +634,7 @@ def test_copy_s3_s3_intercluster_nok(mocked_s3_client):
 def test_copy_ceph_file_ok(mock_file, mock_makedirs, mocked_rados_client):
     disconnect_ceph_clients()
     ioctx_instance = MagicMock()
-    ioctx_instance.read.return_value = b"data"
+    mock_ceph_object(ioctx_instance, b"data")
     ceph_instance = MagicMock()
     ceph_instance.open_ioctx.return_value = ioctx_instance
     mocked_rados_client.return_value = ceph_instance
@@ -439,7 +660,7 @@ def test_copy_ceph_file_ok(mock_file, mock_makedirs, mocked_rados_client):
 def test_copy_file_ceph_ok(mock_file, mocked_rados_client):
     disconnect_ceph_clients()
     ioctx_instance = MagicMock()
-    ioctx_instance.write.return_value = None
+    ioctx_instance.aio_write.return_value.get_return_value.return_value = 0
     ceph_instance = MagicMock()
     ceph_instance.open_ioctx.return_value = ioctx_instance
     mocked_rados_client.return_value = ceph_instance
@@ -464,8 +685,8 @@ def test_copy_file_ceph_ok(mock_file, mocked_rados_client):
 def test_copy_ceph_ceph_ok(mock_file, mocked_rados_client):
     disconnect_ceph_clients()
     ioctx_instance = MagicMock()
-    ioctx_instance.read.return_value = b"data"
-    ioctx_instance.write.return_value = None
+    mock_ceph_object(ioctx_instance, b"data")
+    ioctx_instance.aio_write.return_value.get_return_value.return_value = 0
     ceph_instance = MagicMock()
     ceph_instance.open_ioctx.return_value = ioctx_instance
     mocked_rados_client.return_value = ceph_instance
@@ -480,6 +701,84 @@ def test_copy_ceph_ceph_ok(mock_file, mocked_rados_client):
         assert False, f"CEPH -> CEPH copy raises an exception: {exc}"
 
 
+@mock.patch.dict(
+    os.environ,
+    {"ROK4_CEPH_CONFFILE": "a", "ROK4_CEPH_CLUSTERNAME": "b", "ROK4_CEPH_USERNAME": "c"},
+    clear=True,
+)
+@mock.patch("rok4.storage.__CEPH_CHUNK_SIZE", 3)
+@mock.patch("rok4.storage.rados.Rados")
+def test_ceph_read_chunks_ok(mocked_rados_client):
+    disconnect_ceph_clients()
+    ioctx_instance = MagicMock()
+    ioctx_instance.read.side_effect = lambda name, length, offset=0: b"012345"[
+        offset : offset + length
+    ]
+    ceph_instance = MagicMock()
+    ceph_instance.open_ioctx.return_value = ioctx_instance
+    mocked_rados_client.return_value = ceph_instance
+
+    try:
+        assert get_data_binary("ceph://pool/chunked.ext") == b"012345"
+        assert ioctx_instance.read.call_count == 3
+        ioctx_instance.stat.assert_not_called()
+    except Exception as exc:
+        assert False, f"CEPH read raises an exception: {exc}"
+
+
+@mock.patch.dict(
+    os.environ,
+    {"ROK4_CEPH_CONFFILE": "a", "ROK4_CEPH_CLUSTERNAME": "b", "ROK4_CEPH_USERNAME": "c"},
+    clear=True,
+)
+@mock.patch("rok4.storage.__CEPH_CHUNK_SIZE", 3)
+@mock.patch("rok4.storage.__CEPH_READ_DEPTH", 2)
+@mock.patch("rok4.storage.rados.Rados")
+def test_copy_ceph_ceph_chunks_ok(mocked_rados_client):
+    disconnect_ceph_clients()
+    ioctx_instance = MagicMock()
+    mock_ceph_object(ioctx_instance, b"0123456789")
+    ioctx_instance.aio_write.return_value.get_return_value.return_value = 0
+    ceph_instance = MagicMock()
+    ceph_instance.open_ioctx.return_value = ioctx_instance
+    mocked_rados_client.return_value = ceph_instance
+
+    try:
+        copy(
+            "ceph://pool1/source.ext",
+            "ceph://pool2/destination.ext",
+            hashlib.md5(b"0123456789").hexdigest(),
+        )
+        assert ioctx_instance.aio_read.call_count == 4
+        assert ioctx_instance.aio_write.call_args_list == [
+            mock.call("destination.ext", b"012", 0),
+            mock.call("destination.ext", b"345", 3),
+            mock.call("destination.ext", b"678", 6),
+            mock.call("destination.ext", b"9", 9),
+        ]
+    except Exception as exc:
+        assert False, f"CEPH -> CEPH copy raises an exception: {exc}"
+
+
+@mock.patch.dict(
+    os.environ,
+    {"ROK4_CEPH_CONFFILE": "a", "ROK4_CEPH_CLUSTERNAME": "b", "ROK4_CEPH_USERNAME": "c"},
+    clear=True,
+)
+@mock.patch("rok4.storage.rados.Rados")
+@patch("builtins.open", new_callable=mock_open, read_data=b"data")
+def test_copy_file_ceph_write_error(mock_file, mocked_rados_client):
+    disconnect_ceph_clients()
+    ioctx_instance = MagicMock()
+    ioctx_instance.aio_write.return_value.get_return_value.return_value = -5
+    ceph_instance = MagicMock()
+    ceph_instance.open_ioctx.return_value = ioctx_instance
+    mocked_rados_client.return_value = ceph_instance
+
+    with pytest.raises(StorageError):
+        copy("file:///path/to/source.ext", "ceph://pool/destination.ext")
+
+
 @mock.patch.dict(
     os.environ,
     {
@@ -498,7 +797,7 @@ def test_copy_ceph_ceph_ok(mock_file, mocked_rados_client):
 def test_copy_ceph_s3_ok(mock_file, mocked_s3_client, mocked_rados_client):
     disconnect_ceph_clients()
     ioctx_instance = MagicMock()
-    ioctx_instance.read.return_value = b"data"
+    mock_ceph_object(ioctx_instance, b"data")
     ceph_instance = MagicMock()
     ceph_instance.open_ioctx.return_value = ioctx_instance
     mocked_rados_client.return_value = ceph_instance
@@ -545,18 +844,22 @@ def test_copy_http_file_ok(mock_open, mock_requests):
 def test_copy_http_ceph_ok(mock_requests, mocked_rados_client):
     try:
         http_instance = MagicMock()
-        http_instance.iter_content.return_value = ["data", "data2"]
+        http_instance.iter_content.return_value = [b"data", b"", b"data2"]
         mock_requests.return_value = http_instance
 
         disconnect_ceph_clients()
         ioctx_instance = MagicMock()
-        ioctx_instance.write.return_value = None
+        ioctx_instance.aio_write.return_value.get_return_value.return_value = 0
         ceph_instance = MagicMock()
         ceph_instance.open_ioctx.return_value = ioctx_instance
         mocked_rados_client.return_value = ceph_instance
 
         copy("http://path/to/source.ext", "ceph://pool1/source.ext")
         mock_requests.assert_called_once_with("http://path/to/source.ext", stream=True)
+        assert ioctx_instance.aio_write.call_args_list == [
+            mock.call("source.ext", b"data", 0),
+            mock.call("source.ext", b"data2", 4),
+        ]
     except Exception as exc:
         assert False, f"HTTP -> CEPH copy raises an exception: {exc}"
 
@@ -568,23 +871,23 @@ def test_copy_http_ceph_ok(mock_requests, mocked_rados_client):
 )
 @mock.patch("rok4.storage.boto3.client")
 @mock.patch("requests.get")
-@patch("tempfile.NamedTemporaryFile", new_callable=mock_open)
-@mock.patch("os.remove")
-def test_copy_http_s3_ok(mock_remove, mock_tempfile, mock_requests, mocked_s3_client):
+def test_copy_http_s3_ok(mock_requests, mocked_s3_client):
     try:
         http_instance = MagicMock()
-        http_instance.iter_content.return_value = ["data", "data2"]
+        http_instance.iter_content.return_value = [b"data", b"data2"]
         mock_requests.return_value = http_instance
 
         disconnect_s3_clients()
         s3_instance = MagicMock()
-        s3_instance.upload_file.return_value = None
-        s3_instance.head_object.return_value = {"ETag": "8d777f385d3dfec8815d20f7496026dc"}
+        uploaded = []
+        s3_instance.upload_fileobj.side_effect = lambda f, *args, **kwargs: uploaded.append(
+            (f.read(), args)
+        )
         mocked_s3_client.return_value = s3_instance
 
-        copy("http://path/to/source.ext", "s3://bucket/destination.ext")
+        copy("http://path/to/source.ext", "s3://bucket@b/destination.ext")
         mock_requests.assert_called_once_with("http://path/to/source.ext", stream=True)
-        mock_tempfile.assert_called_once_with("w+b", delete=False)
+        assert uploaded == [(b"datadata2", ("bucket", "destination.ext"))]
     except Exception as exc:
         assert False, f"HTTP -> CEPH copy raises an exception: {exc}"
 
@@ -929,6 +1232,15 @@ def test_get_osgeo_path_s3_ok():
         assert False, f"S3 osgeo path raises an exception: {exc}"
 
 
+@mock.patch.dict(os.environ, {}, clear=True)
+def test_get_osgeo_path_http_ok():
+    try:
+        path = get_osgeo_path("https://server/path/to/file.ext")
+        assert path == "/vsicurl/https://server/path/to/file.ext"
+    except Exception as exc:
+        assert False, f"HTTPS osgeo path raises an exception: {exc}"
+
+
 @mock.patch.dict(os.environ, {}, clear=True)
 def test_get_osgeo_path_nok():
     with pytest.raises(NotImplementedError):
@@ -979,3 +1291,296 @@ def test_size_path_s3_ok(mocked_s3_client):
         assert size == 80
     except Exception as exc:
         assert False, f"S3 size of the path raises an exception: {exc}"
+
+
+@mock.patch.dict(os.environ, {}, clear=True)
+@mock.patch("os.path.exists", side_effect=lambda path: path.endswith("present.ext"))
+def test_exists_many_ok(mock_exists):
+    try:
+        assert exists_many(
+            ["file:///path/to/present.ext", "file:///path/to/absent.ext", "/path/to/present.ext"]
+        ) == [True, False, True]
+        assert exists_many([]) == []
+    except Exception as exc:
+        assert False, f"FILE exists many raises an exception: {exc}"
+
+
+@mock.patch.dict(os.environ, {}, clear=True)
+@mock.patch("rok4.storage.copy")
+def test_copy_many(mock_copy):
+    try:
+        copy_many([("file:///a.ext", "file:///b.ext"), ("file:///c.ext", "file:///d.ext", "toto")])
+        assert mock_copy.call_count == 2
+        mock_copy.assert_any_call("file:///a.ext", "file:///b.ext")
+        mock_copy.assert_any_call("file:///c.ext", "file:///d.ext", "toto")
+    except Exception as exc:
+        assert False, f"Copy many raises an exception: {exc}"
+
+    mock_copy.side_effect = [None, StorageError("FILE", "Copy issue")]
+    with pytest.raises(StorageError) as exc:
+        copy_many([("file:///a.ext", "file:///b.ext"), ("file:///c.ext", "file:///d.ext")])
+    assert exc.value.issue == "Copy issue"
+
+    mock_copy.reset_mock()
+    mock_copy.side_effect = [
+        StorageError("FILE", "First issue"),
+        None,
+        StorageError("S3", "Second issue"),
+    ]
+    with pytest.raises(StorageError) as exc:
+        copy_many(
+            [
+                ("file:///a.ext", "file:///b.ext"),
+                ("file:///c.ext", "file:///d.ext"),
+                ("file:///e.ext", "s3://bucket/f.ext"),
+            ],
+            max_workers=1,
+        )
+    assert mock_copy.call_count == 3
+    assert exc.value.type == "FILE and S3"
+    assert exc.value.issue.startswith("2 copies failed : file:///a.ext -> file:///b.ext (")
+
+
+@mock.patch.dict(
+    os.environ,
+    {"ROK4_S3_URL": "https://a,https://b", "ROK4_S3_SECRETKEY": "a,b", "ROK4_S3_KEY": "a,b"},
+    clear=True,
+)
+@mock.patch("rok4.storage.boto3.client")
+def test_exists_many_s3_listing_ok(mocked_s3_client):
+    disconnect_s3_clients()
+    s3_instance = MagicMock()
+    s3_instance.get_paginator.return_value.paginate.return_value = [
+        {"Contents": [{"Key": f"prefix/object{i:02d}"} for i in range(0, 40, 2)]},
+        {"Contents": [{"Key": "prefix/object99"}]},
+    ]
+    mocked_s3_client.return_value = s3_instance
+
+    try:
+        paths = [f"s3://bucket/prefix/object{i:02d}" for i in range(20)]
+        assert exists_many(paths) == [i % 2 == 0 for i in range(20)]
+        s3_instance.get_paginator.assert_called_once_with("list_objects_v2")
+        s3_instance.get_paginator.return_value.paginate.assert_called_once_with(
+            Bucket="bucket",
+            Prefix="prefix/object",
+            StartAfter="prefix/object0",
+            PaginationConfig={"PageSize": 1000},
+        )
+        s3_instance.head_object.assert_not_called()
+    except Exception as exc:
+        assert False, f"S3 exists many raises an exception: {exc}"
+
+    # Peu d'objets : tests individuels
+    try:
+        assert exists_many(["s3://bucket/prefix/object00", "s3://bucket/prefix/object01"]) == [
+            True,
+            True,
+        ]
+        assert s3_instance.head_object.call_count == 2
+    except Exception as exc:
+        assert False, f"S3 exists many raises an exception: {exc}"
+
+
+@mock.patch.dict(
+    os.environ,
+    {"ROK4_S3_URL": "https://a,https://b", "ROK4_S3_SECRETKEY": "a,b", "ROK4_S3_KEY": "a,b"},
+    clear=True,
+)
+@mock.patch("rok4.storage.boto3.client")
+def test_exists_many_s3_listing_denied(mocked_s3_client):
+    disconnect_s3_clients()
+    s3_instance = MagicMock()
+    s3_instance.get_paginator.return_value.paginate.side_effect = botocore.exceptions.ClientError(
+        operation_name="ListObjectsV2", error_response={"Error": {"Code": "AccessDenied"}}
+    )
+    mocked_s3_client.return_value = s3_instance
+
+    try:
+        paths = [f"s3://bucket/prefix/object{i:02d}" for i in range(20)]
+        assert exists_many(paths) == [True] * 20
+        assert s3_instance.head_object.call_count == 20
+    except Exception as exc:
+        assert False, f"S3 exists many raises an exception: {exc}"
+
+
+@mock.patch.dict(
+    os.environ,
+    {"ROK4_S3_URL": "https://a,https://b", "ROK4_S3_SECRETKEY": "a,b", "ROK4_S3_KEY": "a,b"},
+    clear=True,
+)
+@mock.patch("rok4.storage.boto3.client")
+def test_s3_clients_after_fork(mocked_s3_client):
+    disconnect_s3_clients()
+    mocked_s3_client.side_effect = lambda *args, **kwargs: MagicMock()
+
+    try:
+        exists("s3://bucket/object.ext")
+        assert mocked_s3_client.call_count == 2
+
+        # Simulation du crochet exécuté dans le processus fils
+        rok4.storage.__dict__["__reset_clients_after_fork"]()
+
+        exists("s3://bucket/object.ext")
+        assert mocked_s3_client.call_count == 4
+    except Exception as exc:
+        assert False, f"S3 clients reset after fork raises an exception: {exc}"
+
+
+@mock.patch.dict(
+    os.environ,
+    {
+        "ROK4_S3_URL": "https://a",
+        "ROK4_S3_SECRETKEY": "a",
+        "ROK4_S3_KEY": "a",
+        "ROK4_S3_ACCELERATE": "true",
+    },
+    clear=True,
+)
+@mock.patch("rok4.storage.boto3.client")
+def test_s3_accelerate(mocked_s3_client):
+    disconnect_s3_clients()
+    s3_instance = MagicMock()
+    s3_instance.head_object.return_value = None
+    mocked_s3_client.return_value = s3_instance
+
+    try:
+        assert exists("s3://bucket/object.ext")
+        config = mocked_s3_client.call_args.kwargs["config"]
+        assert config.s3 == {"use_accelerate_endpoint": True}
+    except Exception as exc:
+        assert False, f"S3 client with acceleration raises an exception: {exc}"
+
+
+def read_s3_max_attempts(value):
+    """Read the attempts setting in a new interpreter, with the provided ROK4_S3_MAX_ATTEMPTS"""
+
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    env.pop("ROK4_S3_MAX_ATTEMPTS", None)
+    if value is not None:
+        env["ROK4_S3_MAX_ATTEMPTS"] = value
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import rok4.storage; print(rok4.storage.__dict__['__S3_MAX_ATTEMPTS'])",
+        ],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return int(result.stdout)
+
+
+def count_s3_requests(max_attempts):
+    """Count requests sent by a real S3 client for a call always failing with HTTP 500"""
+
+    requests = []
+
+    def fail(request, **kwargs):
+        requests.append(request)
+        return botocore.awsrequest.AWSResponse(request.url, 500, {}, MagicMock())
+
+    with mock.patch("rok4.storage.__S3_MAX_ATTEMPTS", max_attempts), mock.patch(
+        "botocore.endpoint.time.sleep"
+    ):
+        disconnect_s3_clients()
+        s3_client, bucket_name = rok4.storage.__dict__["__get_s3_client"]("bucket")
+        s3_client["client"].meta.events.register("before-send", fail)
+
+        with pytest.raises(botocore.exceptions.ClientError):
+            s3_client["client"].head_object(Bucket=bucket_name, Key="object.ext")
+
+        disconnect_s3_clients()
+
+    return len(requests)
+
+
+@mock.patch.dict(
+    os.environ,
+    {"ROK4_S3_URL": "https://a", "ROK4_S3_SECRETKEY": "a", "ROK4_S3_KEY": "a"},
+    clear=True,
+)
+def test_s3_max_attempts():
+    # Lecture de la variable d'environnement : les valeurs inférieures à 1 valent 1
+    assert read_s3_max_attempts(None) == 5
+    assert read_s3_max_attempts("3") == 3
+    assert read_s3_max_attempts("1") == 1
+    assert read_s3_max_attempts("0") == 1
+
+    # Nombre total de requêtes envoyées, la première incluse
+    assert count_s3_requests(1) == 1
+    assert count_s3_requests(3) == 3
+    assert count_s3_requests(5) == 5
+
+
+@mock.patch.dict(os.environ, {}, clear=True)
+def test_file_chunks_ok(tmp_path):
+    path = tmp_path / "file.ext"
+    path.write_bytes(b"data" * 300000)
+
+    try:
+        size, chunks = get_data_chunks(f"file://{path}")
+        assert size == 1200000
+        assert b"".join(chunks) == b"data" * 300000
+    except Exception as exc:
+        assert False, f"FILE chunks reading raises an exception: {exc}"
+
+    with pytest.raises(FileNotFoundError):
+        get_data_chunks(f"file://{tmp_path}/missing.ext")
+
+    file = MagicMock()
+    with mock.patch("rok4.storage.open", create=True, return_value=file), mock.patch(
+        "os.fstat", side_effect=OSError("fstat error")
+    ):
+        with pytest.raises(StorageError):
+            get_data_chunks(f"file://{path}")
+    file.close.assert_called_once()
+
+
+@mock.patch.dict(
+    os.environ,
+    {"ROK4_S3_URL": "https://a,https://b", "ROK4_S3_SECRETKEY": "a,b", "ROK4_S3_KEY": "a,b"},
+    clear=True,
+)
+@mock.patch("rok4.storage.boto3.client")
+def test_s3_chunks_ok(mocked_s3_client):
+    disconnect_s3_clients()
+    s3_instance = MagicMock()
+    s3_instance.get_object.return_value = {"ContentLength": 4, "Body": MagicMock()}
+    s3_instance.get_object.return_value["Body"].iter_chunks.return_value = iter([b"da", b"ta"])
+    mocked_s3_client.return_value = s3_instance
+
+    try:
+        size, chunks = get_data_chunks("s3://bucket/object.ext")
+        assert size == 4
+        assert b"".join(chunks) == b"data"
+        s3_instance.get_object.assert_called_once_with(Bucket="bucket", Key="object.ext")
+        s3_instance.head_object.assert_not_called()
+    except Exception as exc:
+        assert False, f"S3 chunks reading raises an exception: {exc}"
+
+
+@mock.patch.dict(
+    os.environ,
+    {"ROK4_CEPH_CONFFILE": "a", "ROK4_CEPH_CLUSTERNAME": "b", "ROK4_CEPH_USERNAME": "c"},
+    clear=True,
+)
+@mock.patch("rok4.storage.__CEPH_CHUNK_SIZE", 3)
+@mock.patch("rok4.storage.rados.Rados")
+def test_ceph_chunks_ok(mocked_rados_client):
+    disconnect_ceph_clients()
+    ioctx_instance = MagicMock()
+    mock_ceph_object(ioctx_instance, b"0123456789")
+    ceph_instance = MagicMock()
+    ceph_instance.open_ioctx.return_value = ioctx_instance
+    mocked_rados_client.return_value = ceph_instance
+
+    try:
+        size, chunks = get_data_chunks("ceph://pool/object.ext")
+        assert size == 10
+        assert list(chunks) == [b"012", b"345", b"678", b"9"]
+        ioctx_instance.stat.assert_called_once_with("object.ext")
+    except Exception as exc:
+        assert False, f"CEPH chunks reading raises an exception: {exc}"
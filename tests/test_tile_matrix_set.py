@@ -2,6 +2,7 @@ import os
 from unittest import mock
 from unittest.mock import *
 
+import numpy
 import pytest
 
 from rok4.exceptions import (
@@ -10,7 +11,7 @@ from rok4.exceptions import (
     MissingEnvironmentError,
     StorageError,
 )
-from rok4.tile_matrix_set import TileMatrixSet
+from rok4.tile_matrix_set import TileMatrixSet, get_tile_matrix_set
 
 
 @mock.patch.dict(os.environ, {}, clear=True)
@@ -20,119 +21,119 @@ def test_missing_env():
 
 
 @mock.patch.dict(os.environ, {"ROK4_TMS_DIRECTORY": "file:///path/to"}, clear=True)
-@mock.patch("rok4.tile_matrix_set.get_data_str", side_effect=StorageError("FILE", "Not found"))
-def test_wrong_file(mocked_get_data_str):
+@mock.patch("rok4.tile_matrix_set.get_data_binary", side_effect=StorageError("FILE", "Not found"))
+def test_wrong_file(mocked_get_data_binary):
     with pytest.raises(StorageError):
         TileMatrixSet("tms")
 
 
 @mock.patch.dict(os.environ, {"ROK4_TMS_DIRECTORY": "file:///path/to"}, clear=True)
 @mock.patch(
-    "rok4.tile_matrix_set.get_data_str",
-    return_value='"crs":"EPSG:3857","orderedAxes":["X","Y"],"id":"PM"}',
+    "rok4.tile_matrix_set.get_data_binary",
+    return_value=b'"crs":"EPSG:3857","orderedAxes":["X","Y"],"id":"PM"}',
 )
-def test_bad_json(mocked_get_data_str):
+def test_bad_json(mocked_get_data_binary):
     with pytest.raises(FormatError):
         TileMatrixSet("tms")
-    mocked_get_data_str.assert_called_once_with("file:///path/to/tms.json")
+    mocked_get_data_binary.assert_called_once_with("file:///path/to/tms.json")
 
 
 @mock.patch.dict(os.environ, {"ROK4_TMS_DIRECTORY": "file:///path/to"}, clear=True)
 @mock.patch(
-    "rok4.tile_matrix_set.get_data_str",
-    return_value='{"tileMatrices":[{"id":"0","tileWidth":256,"scaleDenominator":559082264.028718,"matrixWidth":1,"cellSize":156543.033928041,"matrixHeight":1,"tileHeight":256,"pointOfOrigin":[-20037508.3427892,20037508.3427892]}],"crs":"EPSG:3857","orderedAxes":["X","Y"]}',
+    "rok4.tile_matrix_set.get_data_binary",
+    return_value=b'{"tileMatrices":[{"id":"0","tileWidth":256,"scaleDenominator":559082264.028718,"matrixWidth":1,"cellSize":156543.033928041,"matrixHeight":1,"tileHeight":256,"pointOfOrigin":[-20037508.3427892,20037508.3427892]}],"crs":"EPSG:3857","orderedAxes":["X","Y"]}',
 )
-def test_missing_id(mocked_get_data_str):
+def test_missing_id(mocked_get_data_binary):
     with pytest.raises(MissingAttributeError) as exc:
         TileMatrixSet("tms")
     assert str(exc.value) == "Missing attribute 'id' in 'file:///path/to/tms.json'"
-    mocked_get_data_str.assert_called_once_with("file:///path/to/tms.json")
+    mocked_get_data_binary.assert_called_once_with("file:///path/to/tms.json")
 
 
 @mock.patch.dict(os.environ, {"ROK4_TMS_DIRECTORY": "file:///path/to"}, clear=True)
 @mock.patch(
-    "rok4.tile_matrix_set.get_data_str",
-    return_value='{"tileMatrices":[{"id":"0","tileWidth":256,"scaleDenominator":559082264.028718,"matrixWidth":1,"cellSize":156543.033928041,"matrixHeight":1,"tileHeight":256,"pointOfOrigin":[-20037508.3427892,20037508.3427892]}],"orderedAxes":["X","Y"],"id":"PM"}',
+    "rok4.tile_matrix_set.get_data_binary",
+    return_value=b'{"tileMatrices":[{"id":"0","tileWidth":256,"scaleDenominator":559082264.028718,"matrixWidth":1,"cellSize":156543.033928041,"matrixHeight":1,"tileHeight":256,"pointOfOrigin":[-20037508.3427892,20037508.3427892]}],"orderedAxes":["X","Y"],"id":"PM"}',
 )
-def test_missing_crs(mocked_get_data_str):
+def test_missing_crs(mocked_get_data_binary):
     with pytest.raises(MissingAttributeError) as exc:
         TileMatrixSet("tms")
     assert str(exc.value) == "Missing attribute 'crs' in 'file:///path/to/tms.json'"
-    mocked_get_data_str.assert_called_once_with("file:///path/to/tms.json")
+    mocked_get_data_binary.assert_called_once_with("file:///path/to/tms.json")
 
 
 @mock.patch.dict(os.environ, {"ROK4_TMS_DIRECTORY": "file:///path/to"}, clear=True)
 @mock.patch(
-    "rok4.tile_matrix_set.get_data_str",
-    return_value='{"crs":"epsg:123456","orderedAxes":["X","Y"],"tileMatrices":[{"id":"0","tileWidth":256,"scaleDenominator":559082264.028718,"matrixWidth":1,"cellSize":156543.033928041,"matrixHeight":1,"tileHeight":256,"pointOfOrigin":[-20037508.3427892,20037508.3427892]}],"orderedAxes":["X","Y"],"id":"PM"}',
+    "rok4.tile_matrix_set.get_data_binary",
+    return_value=b'{"crs":"epsg:123456","orderedAxes":["X","Y"],"tileMatrices":[{"id":"0","tileWidth":256,"scaleDenominator":559082264.028718,"matrixWidth":1,"cellSize":156543.033928041,"matrixHeight":1,"tileHeight":256,"pointOfOrigin":[-20037508.3427892,20037508.3427892]}],"orderedAxes":["X","Y"],"id":"PM"}',
 )
-def test_wrong_crs(mocked_get_data_str):
+def test_wrong_crs(mocked_get_data_binary):
     with pytest.raises(Exception) as exc:
         TileMatrixSet("tms")
     assert (
         str(exc.value)
         == "Wrong attribute 'crs' ('epsg:123456') in 'file:///path/to/tms.json', not recognize by OSR. Trace : PROJ: proj_create_from_database: crs not found"
     )
-    mocked_get_data_str.assert_called_once_with("file:///path/to/tms.json")
+    mocked_get_data_binary.assert_called_once_with("file:///path/to/tms.json")
 
 
 @mock.patch.dict(os.environ, {"ROK4_TMS_DIRECTORY": "file:///path/to"}, clear=True)
 @mock.patch(
-    "rok4.tile_matrix_set.get_data_str",
-    return_value='{"crs":"epsg:4326","orderedAxes":["Lat","Lon"],"tileMatrices":[{"id":"0","tileWidth":256,"scaleDenominator":559082264.028718,"matrixWidth":1,"cellSize":156543.033928041,"matrixHeight":1,"tileHeight":256,"pointOfOrigin":[-20037508.3427892,20037508.3427892]}],"id":"PM"}',
+    "rok4.tile_matrix_set.get_data_binary",
+    return_value=b'{"crs":"epsg:4326","orderedAxes":["Lat","Lon"],"tileMatrices":[{"id":"0","tileWidth":256,"scaleDenominator":559082264.028718,"matrixWidth":1,"cellSize":156543.033928041,"matrixHeight":1,"tileHeight":256,"pointOfOrigin":[-20037508.3427892,20037508.3427892]}],"id":"PM"}',
 )
-def test_wrong_axes_order(mocked_get_data_str):
+def test_wrong_axes_order(mocked_get_data_binary):
     with pytest.raises(Exception) as exc:
         TileMatrixSet("tms")
     assert (
         str(exc.value)
         == "TMS 'file:///path/to/tms.json' own invalid axes order : only X/Y or Lon/Lat are handled"
     )
-    mocked_get_data_str.assert_called_once_with("file:///path/to/tms.json")
+    mocked_get_data_binary.assert_called_once_with("file:///path/to/tms.json")
 
 
 @mock.patch.dict(os.environ, {"ROK4_TMS_DIRECTORY": "file:///path/to"}, clear=True)
 @mock.patch(
-    "rok4.tile_matrix_set.get_data_str",
-    return_value='{"crs":"EPSG:3857","orderedAxes":["X","Y"],"id":"PM"}',
+    "rok4.tile_matrix_set.get_data_binary",
+    return_value=b'{"crs":"EPSG:3857","orderedAxes":["X","Y"],"id":"PM"}',
 )
-def test_missing_levels(mocked_get_data_str):
+def test_missing_levels(mocked_get_data_binary):
     with pytest.raises(MissingAttributeError) as exc:
         TileMatrixSet("tms")
     assert str(exc.value) == "Missing attribute 'tileMatrices' in 'file:///path/to/tms.json'"
-    mocked_get_data_str.assert_called_once_with("file:///path/to/tms.json")
+    mocked_get_data_binary.assert_called_once_with("file:///path/to/tms.json")
 
 
 @mock.patch.dict(os.environ, {"ROK4_TMS_DIRECTORY": "file:///path/to"}, clear=True)
 @mock.patch(
-    "rok4.tile_matrix_set.get_data_str",
-    return_value='{"tileMatrices":[],"crs":"EPSG:3857","orderedAxes":["X","Y"],"id":"PM"}',
+    "rok4.tile_matrix_set.get_data_binary",
+    return_value=b'{"tileMatrices":[],"crs":"EPSG:3857","orderedAxes":["X","Y"],"id":"PM"}',
 )
-def test_no_levels(mocked_get_data_str):
+def test_no_levels(mocked_get_data_binary):
     with pytest.raises(Exception) as exc:
         TileMatrixSet("tms")
     assert str(exc.value) == "TMS 'file:///path/to/tms.json' has no level"
-    mocked_get_data_str.assert_called_once_with("file:///path/to/tms.json")
+    mocked_get_data_binary.assert_called_once_with("file:///path/to/tms.json")
 
 
 @mock.patch.dict(os.environ, {"ROK4_TMS_DIRECTORY": "file:///path/to"}, clear=True)
 @mock.patch(
-    "rok4.tile_matrix_set.get_data_str",
-    return_value='{"tileMatrices":[{"tileWidth":256,"scaleDenominator":559082264.028718,"matrixWidth":1,"cellSize":156543.033928041,"matrixHeight":1,"tileHeight":256,"pointOfOrigin":[-20037508.3427892,20037508.3427892]}],"orderedAxes":["X","Y"],"id":"PM","crs":"EPSG:3857"}',
+    "rok4.tile_matrix_set.get_data_binary",
+    return_value=b'{"tileMatrices":[{"tileWidth":256,"scaleDenominator":559082264.028718,"matrixWidth":1,"cellSize":156543.033928041,"matrixHeight":1,"tileHeight":256,"pointOfOrigin":[-20037508.3427892,20037508.3427892]}],"orderedAxes":["X","Y"],"id":"PM","crs":"EPSG:3857"}',
 )
-def test_wrong_level(mocked_get_data_str):
+def test_wrong_level(mocked_get_data_binary):
     with pytest.raises(MissingAttributeError) as exc:
         TileMatrixSet("tms")
     assert str(exc.value) == "Missing attribute tileMatrices[].'id' in 'file:///path/to/tms.json'"
-    mocked_get_data_str.assert_called_once_with("file:///path/to/tms.json")
+    mocked_get_data_binary.assert_called_once_with("file:///path/to/tms.json")
 
 
 @mock.patch.dict(os.environ, {"ROK4_TMS_DIRECTORY": "file:///path/to"}, clear=True)
 @mock.patch(
-    "rok4.tile_matrix_set.get_data_str",
-    return_value='{"tileMatrices":[{"id":"level_0","tileWidth":256,"scaleDenominator":559082264.028718,"matrixWidth":1,"cellSize":156543.033928041,"matrixHeight":1,"tileHeight":256,"pointOfOrigin":[-20037508.3427892,20037508.3427892]}],"crs":"EPSG:3857","orderedAxes":["X","Y"],"id":"PM"}',
+    "rok4.tile_matrix_set.get_data_binary",
+    return_value=b'{"tileMatrices":[{"id":"level_0","tileWidth":256,"scaleDenominator":559082264.028718,"matrixWidth":1,"cellSize":156543.033928041,"matrixHeight":1,"tileHeight":256,"pointOfOrigin":[-20037508.3427892,20037508.3427892]}],"crs":"EPSG:3857","orderedAxes":["X","Y"],"id":"PM"}',
 )
-def test_wrong_level_id(mocked_get_data_str):
+def test_wrong_level_id(mocked_get_data_binary):
     with pytest.raises(Exception) as exc:
         TileMatrixSet("tms")
 
@@ -140,30 +141,30 @@ def test_wrong_level_id(mocked_get_data_str):
         str(exc.value)
         == "TMS file:///path/to/tms.json owns a level whom id contains an underscore (level_0)"
     )
-    mocked_get_data_str.assert_called_once_with("file:///path/to/tms.json")
+    mocked_get_data_binary.assert_called_once_with("file:///path/to/tms.json")
 
 
 @mock.patch.dict(os.environ, {"ROK4_TMS_DIRECTORY": "file:///path/to"}, clear=True)
 @mock.patch(
-    "rok4.tile_matrix_set.get_data_str",
-    return_value='{"tileMatrices":[{"id":"0","tileWidth":256,"scaleDenominator":559082264.028718,"matrixWidth":1,"cellSize":156543.033928041,"matrixHeight":1,"tileHeight":256,"pointOfOrigin":[-20037508.3427892,20037508.3427892]}],"crs":"EPSG:3857","orderedAxes":["X","Y"],"id":"PM"}',
+    "rok4.tile_matrix_set.get_data_binary",
+    return_value=b'{"tileMatrices":[{"id":"0","tileWidth":256,"scaleDenominator":559082264.028718,"matrixWidth":1,"cellSize":156543.033928041,"matrixHeight":1,"tileHeight":256,"pointOfOrigin":[-20037508.3427892,20037508.3427892]}],"crs":"EPSG:3857","orderedAxes":["X","Y"],"id":"PM"}',
 )
-def test_ok(mocked_get_data_str):
+def test_ok(mocked_get_data_binary):
     try:
         tms = TileMatrixSet("tms")
         assert tms.get_level("0") is not None
         assert tms.get_level("4") is None
-        mocked_get_data_str.assert_called_once_with("file:///path/to/tms.json")
+        mocked_get_data_binary.assert_called_once_with("file:///path/to/tms.json")
     except Exception as exc:
         assert False, f"'TileMatrixSet creation raises an exception: {exc}"
 
 
 @mock.patch.dict(os.environ, {"ROK4_TMS_DIRECTORY": "file:///path/to"}, clear=True)
 @mock.patch(
-    "rok4.tile_matrix_set.get_data_str",
-    return_value='{"tileMatrices":[{"id":"17","cellSize":1.19432856695588,"matrixHeight":131072,"pointOfOrigin":[-20037508.3427892,20037508.3427892],"tileHeight":256,"tileWidth":256,"scaleDenominator":4265.45916769957,"matrixWidth":131072}],"crs":"EPSG:3857","orderedAxes":["X","Y"],"id":"PM"}',
+    "rok4.tile_matrix_set.get_data_binary",
+    return_value=b'{"tileMatrices":[{"id":"17","cellSize":1.19432856695588,"matrixHeight":131072,"pointOfOrigin":[-20037508.3427892,20037508.3427892],"tileHeight":256,"tileWidth":256,"scaleDenominator":4265.45916769957,"matrixWidth":131072}],"crs":"EPSG:3857","orderedAxes":["X","Y"],"id":"PM"}',
 )
-def test_pm_conversions(mocked_get_data_str):
+def test_pm_conversions(mocked_get_data_binary):
     try:
         tms = TileMatrixSet("tms")
         tm = tms.get_level("17")
@@ -179,16 +180,21 @@ def test_pm_conversions(mocked_get_data_str):
             (670034.4267107458, 5980565.948489188, 670649.5059227281, 5980936.190344945)
         ) == (67727, 45974, 67729, 45975)
         assert tm.point_to_indices(670654.2832369965, 5980575.503117723) == (67729, 45975, 124, 136)
+        bboxes = tm.tiles_to_bboxes(numpy.array([67728, 67729]), numpy.array([45975, 45976]))
+        assert bboxes.tolist() == [
+            list(tm.tile_to_bbox(67728, 45975)),
+            list(tm.tile_to_bbox(67729, 45976)),
+        ]
     except Exception as exc:
         assert False, f"'TileMatrixSet creation raises an exception: {exc}"
 
 
 @mock.patch.dict(os.environ, {"ROK4_TMS_DIRECTORY": "file:///path/to"}, clear=True)
 @mock.patch(
-    "rok4.tile_matrix_set.get_data_str",
-    return_value='{"crs":"EPSG:4326","tileMatrices":[{"tileWidth":256,"scaleDenominator":1066.36480348451,"matrixWidth":524288,"cellSize":2.68220901489258e-06,"matrixHeight":262144,"pointOfOrigin":[-180,90],"tileHeight":256,"id":"18"}],"orderedAxes":["Lon","Lat"],"id":"4326"}',
+    "rok4.tile_matrix_set.get_data_binary",
+    return_value=b'{"crs":"EPSG:4326","tileMatrices":[{"tileWidth":256,"scaleDenominator":1066.36480348451,"matrixWidth":524288,"cellSize":2.68220901489258e-06,"matrixHeight":262144,"pointOfOrigin":[-180,90],"tileHeight":256,"id":"18"}],"orderedAxes":["Lon","Lat"],"id":"4326"}',
 )
-def test_4326_conversions(mocked_get_data_str):
+def test_4326_conversions(mocked_get_data_binary):
     try:
         tms = TileMatrixSet("tms")
         tm = tms.get_level("18")
@@ -202,5 +208,40 @@ def test_4326_conversions(mocked_get_data_str):
         )
         assert tm.bbox_to_tiles((45, 5, 48, 6)) == (269425, 61166, 270882, 65535)
         assert tm.point_to_indices(45, 5) == (269425, 65535, 199, 255)
+        assert tm.tiles_to_bboxes(numpy.array([269425]), numpy.array([65535])).tolist() == [
+            list(tm.tile_to_bbox(269425, 65535))
+        ]
     except Exception as exc:
         assert False, f"'TileMatrixSet creation raises an exception: {exc}"
+
+
+@mock.patch.dict(os.environ, {"ROK4_TMS_DIRECTORY": "file:///path/to"}, clear=True)
+@mock.patch("rok4.tile_matrix_set.TileMatrixSet")
+def test_get_tile_matrix_set(mocked_tms_class):
+    try:
+        tms = get_tile_matrix_set("cached")
+        assert get_tile_matrix_set("cached") is tms
+        mocked_tms_class.assert_called_once_with("cached")
+
+        with mock.patch.dict(os.environ, {"ROK4_TMS_DIRECTORY": "file:///other"}):
+            get_tile_matrix_set("cached")
+        assert mocked_tms_class.call_count == 2
+    except Exception as exc:
+        assert False, f"'get_tile_matrix_set' raises an exception: {exc}"
+
+
+@mock.patch.dict(os.environ, {}, clear=True)
+def test_get_tile_matrix_set_missing_env():
+    with pytest.raises(MissingEnvironmentError):
+        get_tile_matrix_set("tms")
+
+
+@mock.patch.dict(os.environ, {"ROK4_TMS_DIRECTORY": "file:///path/to"}, clear=True)
+@mock.patch("rok4.utils.ORJSON_AVAILABLE", True)
+@mock.patch("rok4.utils.orjson")
+@mock.patch("rok4.tile_matrix_set.get_data_binary", return_value=b"{}")
+def test_orjson_parsing(mocked_get_data_binary, mocked_orjson):
+    mocked_orjson.loads.return_value = {}
+    with pytest.raises(MissingAttributeError):
+        TileMatrixSet("tms")
+    mocked_orjson.loads.assert_called_once_with(b"{}")
@@ -1,22 +1,36 @@
 import math
 import random
+from json.decoder import JSONDecodeError
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from osgeo import gdal, osr
 
+import rok4.utils
+
 # from rok4.exceptions import *
 from rok4.utils import (
     ColorFormat,
     bbox_to_geometry,
     compute_bbox,
     compute_format,
+    json_loads,
     reproject_bbox,
     reproject_point,
     srs_to_spatialreference,
 )
 
 
+def test_json_loads():
+    assert json_loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+
+    with patch("rok4.utils.ORJSON_AVAILABLE", False):
+        assert json_loads('{"a": [1, 2]}') == {"a": [1, 2]}
+
+        with pytest.raises(JSONDecodeError):
+            json_loads(b'{"a": ')
+
+
 def test_srs_to_spatialreference_ignf_ok():
     try:
         srs_to_spatialreference("IGNF:LAMB93")
@@ -61,6 +75,17 @@ def test_reproject_bbox_ok():
         assert False, f"Bbox reprojection raises an exception: {exc}"
 
 
+@patch("rok4.utils.srs_to_spatialreference")
+def test_reproject_bbox_cache(mocked_srs_to_spatialreference):
+    rok4.utils.__dict__["__reproject_bbox"].cache_clear()
+    try:
+        assert reproject_bbox([0, 1, 2, 3], "EPSG:2154", "EPSG:2154") == (0, 1, 2, 3)
+        assert reproject_bbox((0, 1, 2, 3), "EPSG:2154", "EPSG:2154") == (0, 1, 2, 3)
+        assert mocked_srs_to_spatialreference.call_count == 2
+    except Exception as exc:
+        assert False, f"Bbox reprojection raises an exception: {exc}"
+
+
 def test_reproject_point_ok():
     try:
         sr_4326 = srs_to_spatialreference("EPSG:4326")
@@ -1,6 +1,7 @@
 # standard library
 import os
 from unittest import mock
+from unittest.mock import MagicMock
 
 # 3rd party
 import pytest
@@ -18,8 +19,8 @@ def test_missing_env():
         Vector.from_file("ceph:///ign_std/vector.shp")
 
 
-@mock.patch("rok4.vector.copy", side_effect=StorageError("CEPH", "Not found"))
-def test_wrong_file(mocked_copy):
+@mock.patch("rok4.vector.get_data_chunks", side_effect=StorageError("CEPH", "Not found"))
+def test_wrong_file(mocked_get_data_chunks):
     with pytest.raises(StorageError):
         Vector.from_file("ceph:///vector.geojson")
 
@@ -45,6 +46,126 @@ def test_wrong_content_ceph(mocked_open, mocked_copy):
     assert str(exc.value) == "The content of file:///vector.shp cannot be read"
 
 
+@mock.patch("rok4.vector.get_data_chunks", side_effect=lambda path: (4, iter([b"da", b"ta"])))
+@mock.patch("rok4.vector.gdal")
+@mock.patch("rok4.vector.ogr.Open", return_value="not a shape")
+def test_shp_ceph_in_memory(mocked_open, mocked_gdal, mocked_get_data_chunks):
+    with pytest.raises(Exception) as exc:
+        Vector.from_file("ceph://pool/vector.shp")
+    assert str(exc.value) == "The content of ceph://pool/vector.shp cannot be read"
+
+    assert sorted(c.args[0] for c in mocked_get_data_chunks.call_args_list) == [
+        "ceph://pool/vector.cpg",
+        "ceph://pool/vector.dbf",
+        "ceph://pool/vector.prj",
+        "ceph://pool/vector.shp",
+        "ceph://pool/vector.shx",
+    ]
+    opened = mocked_open.call_args.args[0]
+    assert opened.startswith("/vsimem/") and opened.endswith("/vector.shp")
+    assert mocked_gdal.FileFromMemBuffer.call_count == 5
+    assert all(c.args[1] == b"data" for c in mocked_gdal.FileFromMemBuffer.call_args_list)
+    assert mocked_gdal.Unlink.call_count == 5
+
+
+@mock.patch("rok4.vector.get_data_chunks", return_value=(4, iter([b"da", b"ta"])))
+@mock.patch("rok4.vector.gdal")
+@mock.patch("rok4.vector.ogr.Open", return_value="not a geopackage")
+def test_gpkg_ceph_in_memory(mocked_open, mocked_gdal, mocked_get_data_chunks):
+    with pytest.raises(Exception) as exc:
+        Vector.from_file("ceph://pool/vector.gpkg")
+    assert str(exc.value) == "The content of ceph://pool/vector.gpkg cannot be read"
+
+    mocked_get_data_chunks.assert_called_once_with("ceph://pool/vector.gpkg")
+    opened = mocked_open.call_args.args[0]
+    assert opened.startswith("/vsimem/") and opened.endswith("/vector.gpkg")
+    mocked_gdal.FileFromMemBuffer.assert_called_once_with(opened, b"data")
+    mocked_gdal.Unlink.assert_called_once_with(opened)
+
+
+@mock.patch("rok4.vector.get_data_chunks")
+@mock.patch("rok4.vector.gdal")
+@mock.patch("rok4.vector.ogr.Open", return_value="not a geojson")
+def test_geojson_ceph_reload(mocked_open, mocked_gdal, mocked_get_data_chunks):
+    # Chaque chargement relit l'objet : pas de contenu périmé venant du cache de lecture
+    mocked_get_data_chunks.side_effect = [(3, iter([b"old"])), (3, iter([b"new"]))]
+
+    for content in (b"old", b"new"):
+        with pytest.raises(Exception):
+            Vector.from_file("ceph://pool/vector.geojson")
+        assert mocked_gdal.FileFromMemBuffer.call_args.args[1] == content
+
+    assert mocked_get_data_chunks.call_count == 2
+
+
+@mock.patch("rok4.vector.get_data_chunks", side_effect=StorageError("CEPH", "Not found"))
+def test_shp_ceph_missing_file(mocked_get_data_chunks):
+    with pytest.raises(StorageError):
+        Vector.from_file("ceph://pool/vector.shp")
+
+
+def mock_layer(name, count, extent):
+    """Create a mocked OGR layer, without attribute, with the provided features count and extent"""
+
+    layer = MagicMock()
+    layer.GetName.return_value = name
+    layer.GetFeatureCount.return_value = count
+    layer.GetLayerDefn.return_value.GetFieldCount.return_value = 0
+    if extent is None:
+        layer.GetExtent.side_effect = RuntimeError("No geometry")
+    else:
+        layer.GetExtent.return_value = extent
+
+    return layer
+
+
+@mock.patch("rok4.vector.ogr.Open")
+def test_bbox_ok(mocked_open):
+    layers = [
+        mock_layer("first", 2, (0, 2, 1, 3)),
+        mock_layer("second", 1, (-1, 1, 2, 5)),
+        mock_layer("empty", 0, (10, 10, 10, 10)),
+        mock_layer("table", 4, None),
+    ]
+    mocked_open.return_value.GetLayerCount.return_value = 4
+    mocked_open.return_value.GetLayer.side_effect = lambda i=0: layers[i]
+
+    try:
+        vector = Vector.from_file("file:///vector.shp")
+        assert vector.bbox == (-1, 2, 1, 5)
+        assert vector.layers == [
+            ("first", 2, []),
+            ("second", 1, []),
+            ("empty", 0, []),
+            ("table", 4, []),
+        ]
+        layers[0].__iter__.assert_not_called()
+    except Exception as exc:
+        assert False, f"Vector creation raises an exception: {exc}"
+
+
+@mock.patch("rok4.vector.ogr.GetDriverByName")
+@mock.patch("rok4.vector.copy")
+def test_csv_autodetect_type(mocked_copy, mocked_driver):
+    vrt_files = []
+
+    def read_vrt(vrt_path, mode):
+        with open(vrt_path) as f:
+            vrt_files.append(f.read())
+        return MagicMock()
+
+    mocked_driver.return_value.CopyDataSource.return_value.GetLayerCount.return_value = 0
+
+    try:
+        with mock.patch("rok4.vector.ogr.Open", side_effect=read_vrt):
+            Vector.from_file("file:///vector.csv")
+            Vector.from_file("file:///vector.csv", csv={"autodetect_type": True})
+        assert '<OOI key="AUTODETECT_TYPE">NO</OOI>' in vrt_files[0]
+        assert '<OOI key="AUTODETECT_TYPE">YES</OOI>' in vrt_files[1]
+    except Exception as exc:
+        assert False, f"Vector creation raises an exception: {exc}"
+
+
 def test_ok_csv1():
     try:
         vector_csv1 = Vector.from_file(